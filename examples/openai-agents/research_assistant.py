@@ -5,6 +5,12 @@ from dotenv import load_dotenv
 from agents import Agent
 from promptlightning.vault import Vault
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 load_dotenv()
 
 vault = Vault(config_path="promptlightning.yaml")
@@ -59,6 +65,19 @@ def create_coordinator(research_topic: str, output_format: str = "markdown", dep
     )
 
 
+def parse_plan(text: str):
+    """Parse planner output, repairing slightly broken JSON before giving up."""
+    try:
+        return _json_loads(text)
+    except ValueError:
+        pass
+    try:
+        from json_repair import repair_json
+        return _json_loads(repair_json(text))
+    except Exception:
+        return None
+
+
 def conduct_research(topic: str, num_subtopics: int = 3, focus_areas: list = None):
     print(f"\n🔬 Starting research on: {topic}\n")
 
@@ -79,9 +98,8 @@ def conduct_research(topic: str, num_subtopics: int = 3, focus_areas: list = Non
     from agents import Runner
     plan_result = Runner.run_sync(planner, f"Create a research plan for: {topic}")
 
-    try:
-        plan_data = json.loads(plan_result.final_output)
-    except json.JSONDecodeError:
+    plan_data = parse_plan(plan_result.final_output)
+    if not isinstance(plan_data, dict):
         print("⚠️  Planner output wasn't valid JSON, using fallback")
         plan_data = {
             "subtopics": [
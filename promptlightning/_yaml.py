@@ -0,0 +1,20 @@
+from __future__ import annotations
+from typing import Any
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+    YAML_C_AVAILABLE = True
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+    YAML_C_AVAILABLE = False
+
+
+def safe_load(stream: Any) -> Any:
+    """Like yaml.safe_load, but with libyaml's C loader when available."""
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def safe_dump(data: Any, stream: Any = None, **kwargs: Any) -> Any:
+    """Like yaml.safe_dump, but with libyaml's C dumper when available."""
+    return yaml.dump(data, stream, Dumper=SafeDumper, **kwargs)
@@ -1,15 +1,27 @@
-import typer, sys, time, subprocess, webbrowser, threading, json
+import typer, sys, time, subprocess, webbrowser, threading, json, re
+from functools import lru_cache
 from pathlib import Path
-import yaml
 from dotenv import load_dotenv
+from ._yaml import safe_load, safe_dump
 from .vault import Vault
-from .watcher import Watcher
-from .playground import create_playground
 from .exceptions import ValidationError, RenderError, TemplateNotFound, APIKeyError, RateLimitError, ModelNotFoundError, LLMError, RegistryError
-from .registry.migrate import migrate_local_to_lmdb, verify_migration
 
 app = typer.Typer(add_completion=False)
 
+@lru_cache(maxsize=1)
+def _parse_cli_config(path: str, mtime_ns: int) -> dict:
+    return safe_load(Path(path).read_text(encoding="utf-8")) or {}
+
+def _load_cli_config(path: str = "promptlightning.yaml") -> dict:
+    """Parse the project config once per invocation; keyed on mtime so `init` in the same process is seen."""
+    p = Path(path).resolve()
+    return _parse_cli_config(str(p), p.stat().st_mtime_ns)
+
+def _cli_vault(path: str = "promptlightning.yaml") -> Vault:
+    return Vault.from_config_dict(_load_cli_config(path))
+
+_VERSION_LINE_RE = re.compile(r"""^(version:[ \t]*["']?)(\d+\.\d+\.\d+)(["']?[ \t]*\r?)$""", re.M)
+
 load_dotenv()
 
 @app.command()
@@ -21,7 +33,7 @@ def init():
         "prompt_dir": "./prompts",
         "logging": {"enabled": True, "backend": "sqlite", "db_path": "./promptlightning.db"},
     }
-    (root / "promptlightning.yaml").write_text(yaml.safe_dump(cfg, sort_keys=False), encoding="utf-8")
+    (root / "promptlightning.yaml").write_text(safe_dump(cfg, sort_keys=False), encoding="utf-8")
     example = {
         "id": "summarizer",
         "version": "1.0.0",
@@ -29,18 +41,18 @@ def init():
         "template": "Summarize the following into exactly 3 bullet points:\n\n{{ input_text }}\n",
         "inputs": {"input_text": {"type": "string", "required": True}},
     }
-    (root / "prompts" / "summarizer.yaml").write_text(yaml.safe_dump(example, sort_keys=False, allow_unicode=True), encoding="utf-8")
+    (root / "prompts" / "summarizer.yaml").write_text(safe_dump(example, sort_keys=False, allow_unicode=True), encoding="utf-8")
     typer.echo("Initialized PromptLightning project.")
 
 @app.command()
 def list():
-    v = Vault("promptlightning.yaml")
+    v = _cli_vault()
     for tid in v.list():
         typer.echo(tid)
 
 @app.command()
 def get(id: str):
-    v = Vault("promptlightning.yaml")
+    v = _cli_vault()
     tmpl = v.get(id)
     # print raw template without rendering
     sys.stdout.write(tmpl.spec.template)
@@ -48,10 +60,14 @@ def get(id: str):
 @app.command()
 def bump(id: str, patch: bool = False, minor: bool = False, major: bool = False):
     # naive semantic bump: finds the file containing id and rewrites version
-    prompt_dir = Path(yaml.safe_load(Path("promptlightning.yaml").read_text())["prompt_dir"])
+    prompt_dir = Path(_load_cli_config()["prompt_dir"])
+    needle = id.encode("utf-8")
     target = None
     for p in prompt_dir.rglob("*.y*ml"):
-        data = yaml.safe_load(p.read_text()) or {}
+        raw = p.read_bytes()
+        if needle not in raw:  # cheap pre-filter so only candidate files get parsed
+            continue
+        data = safe_load(raw) or {}
         if data.get("id") == id:
             target = p
             ver = data.get("version", "0.0.1")
@@ -60,7 +76,14 @@ def bump(id: str, patch: bool = False, minor: bool = False, major: bool = False)
             elif minor: y,z = y+1,0
             else: z += 1
             data["version"] = f"{x}.{y}.{z}"
-            p.write_text(yaml.safe_dump(data, sort_keys=False))
+            # edit the version line in place when it's the plain top-level form, keeping the
+            # rest of the file byte-for-byte; otherwise fall back to a full re-dump
+            text = raw.decode("utf-8")
+            m = _VERSION_LINE_RE.search(text)
+            if m and m.group(2) == ver:
+                p.write_bytes((text[:m.start(2)] + data["version"] + text[m.end(2):]).encode("utf-8"))
+            else:
+                p.write_text(safe_dump(data, sort_keys=False))
             typer.echo(f"Bumped {id} -> {data['version']}")
             break
     if not target:
@@ -68,9 +91,10 @@ def bump(id: str, patch: bool = False, minor: bool = False, major: bool = False)
 
 @app.command()
 def watch():
-    v = Vault("promptlightning.yaml")
-    pd = Path(yaml.safe_load(Path("promptlightning.yaml").read_text())["prompt_dir"]).resolve()
+    v = _cli_vault()
+    pd = Path(v.config["prompt_dir"]).resolve()
     typer.echo(f"Watching {pd} for changes. Ctrl+C to stop.")
+    from .watcher import Watcher
     w = Watcher(pd, on_change=v.invalidate_cache)
     w.start()
     try:
@@ -107,6 +131,8 @@ def migrate(
         typer.echo(f"❌ Unsupported target type: {target_type}. Only 'lmdb' is currently supported.", err=True)
         raise typer.Exit(1)
 
+    from .registry.migrate import migrate_local_to_lmdb, verify_migration
+
     try:
         config_path = Path(config)
         if not config_path.exists():
@@ -114,7 +140,7 @@ def migrate(
             typer.echo("💡 Run 'promptlightning init' to create a new project", err=True)
             raise typer.Exit(1)
 
-        config_data = yaml.safe_load(config_path.read_text())
+        config_data = _load_cli_config(config)
         prompt_dir = Path(config_data.get("prompt_dir", "./prompts"))
 
         if not prompt_dir.exists():
@@ -298,6 +324,8 @@ def playground(
             if not _build_ui():
                 typer.echo("⚠️  UI build failed, starting with fallback interface", err=True)
 
+        from .playground import create_playground
+
         # Create the server
         if demo:
             typer.echo("🎮 Starting in DEMO mode - session isolation enabled")
@@ -362,7 +390,7 @@ def run(
       promptlightning run chatbot --model claude-3-opus --message "Hello" --max-tokens 100
     """
     try:
-        vault = Vault(config)
+        vault = _cli_vault(config)
     except FileNotFoundError:
         typer.echo(f"❌ Config file not found: {config}", err=True)
         typer.echo("💡 Run 'promptlightning init' to create a new project", err=True)
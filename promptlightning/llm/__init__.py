@@ -1,4 +1,11 @@
 from .models import ExecutionResult
-from .client import LLMClient
 
-__all__ = ["ExecutionResult", "LLMClient"]
\ No newline at end of file
+__all__ = ["ExecutionResult", "LLMClient"]
+
+
+def __getattr__(name):
+    # importing the client pulls in litellm, which is slow; defer it to first use
+    if name == "LLMClient":
+        from .client import LLMClient
+        return LLMClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
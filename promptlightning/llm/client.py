@@ -1,10 +1,14 @@
 from __future__ import annotations
 import time
 import asyncio
-from typing import Optional, Any, List, AsyncIterator, Iterator
+import random
+import threading
+from collections import OrderedDict
+from typing import Optional, Any, List, AsyncIterator, Iterator, ClassVar
 from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
 import litellm
-from litellm import completion, acompletion
+from litellm import completion, acompletion, text_completion
 from litellm.exceptions import (
     AuthenticationError,
     RateLimitError as LiteLLMRateLimitError,
@@ -13,17 +17,33 @@ from litellm.exceptions import (
     BadRequestError
 )
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from ..exceptions import APIKeyError, RateLimitError, ModelNotFoundError, LLMError
 from .models import ExecutionResult
 
+# providers whose (non-chat) completions endpoint takes a list of prompts and answers
+# them all in one request; chat endpoints take one conversation per call
+MULTI_PROMPT_PROVIDERS = frozenset({"text-completion-openai"})
+
 
 class LLMClient:
+    _uvloop_installed: ClassVar[bool] = False
+    _BREAKER_THRESHOLD: ClassVar[int] = 5
+    _BREAKER_RESET_SECS: ClassVar[float] = 30.0
+
     def __init__(
         self,
         max_connections: int = 100,
         max_keepalive: int = 20,
         enable_cache: bool = False,
-        cache_ttl: int = 60
+        cache_ttl: int = 60,
+        use_uvloop: bool = False,
+        cache_maxsize: int = 1024,
+        min_cache_len: int = 0
     ):
         litellm.suppress_debug_info = True
         litellm.drop_params = True
@@ -32,64 +52,111 @@ class LLMClient:
         self.max_keepalive = max_keepalive
         self.enable_cache = enable_cache
         self.cache_ttl = cache_ttl
+        self.cache_maxsize = cache_maxsize
+        # prompts shorter than this are never cached (0 caches everything)
+        self.min_cache_len = min_cache_len
+
+        # key -> (parsed result, stored at); LRU order, bounded by cache_maxsize
+        self._cache: OrderedDict[tuple, tuple[ExecutionResult, float]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_stats = {"hits": 0, "misses": 0}
+        # circuit breakers keyed by (provider, model); only state changes take the lock
+        self._breaker_fails: dict[tuple[str, str], int] = {}
+        self._breaker_opened_at: dict[tuple[str, str], float] = {}
+        self._breaker_lock = threading.Lock()
+
+        # opt-in: the loop policy is process-wide, so a library shouldn't change it by default
+        if use_uvloop:
+            self._install_uvloop()
+
+    @classmethod
+    def _install_uvloop(cls) -> None:
+        # once per process; never swap the policy under an already-running loop
+        if cls._uvloop_installed or uvloop is None:
+            return
+        try:
+            asyncio.get_running_loop()
+            return
+        except RuntimeError:
+            pass
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        cls._uvloop_installed = True
+
+    def _get_cache_key(self, prompt: str, model: str, **kwargs: Any) -> Optional[tuple]:
+        # None when caching is off, so uncached calls skip building the key at all
+        if not self.enable_cache or len(prompt) < self.min_cache_len:
+            return None
+        # exact key: str hashes are cached on the object, so this beats hashing a
+        # formatted string or a digest, and unlike hash()-derived keys it can't collide
+        params = tuple(sorted(kwargs.items()))
+        try:
+            hash(params)
+        except TypeError:  # e.g. a messages list
+            params = repr(params)
+        return (model, prompt, params)
 
-        self._cache: dict[str, tuple[ExecutionResult, float]] = {}
-        self._circuit_breaker: dict[str, dict[str, Any]] = {}
-
-    def _get_cache_key(self, prompt: str, model: str, **kwargs: Any) -> str:
-        params_str = str(sorted(kwargs.items()))
-        return f"{model}:{hash(prompt)}:{hash(params_str)}"
-
-    def _get_from_cache(self, cache_key: str) -> Optional[ExecutionResult]:
-        if not self.enable_cache:
+    def _get_from_cache(self, cache_key: Optional[tuple]) -> Optional[ExecutionResult]:
+        if cache_key is None:
             return None
 
-        if cache_key in self._cache:
-            result, timestamp = self._cache[cache_key]
-            if time.time() - timestamp < self.cache_ttl:
-                return result
-            else:
+        with self._cache_lock:
+            entry = self._cache.get(cache_key)
+            if entry is not None:
+                result, timestamp = entry
+                if time.time() - timestamp < self.cache_ttl:
+                    self._cache.move_to_end(cache_key)
+                    self._cache_stats["hits"] += 1
+                    return result
                 del self._cache[cache_key]
+            self._cache_stats["misses"] += 1
         return None
 
-    def _set_cache(self, cache_key: str, result: ExecutionResult):
-        if self.enable_cache:
-            self._cache[cache_key] = (result, time.time())
-
-    def _check_circuit_breaker(self, provider: str) -> bool:
-        if provider not in self._circuit_breaker:
+    def _set_cache(self, cache_key: Optional[tuple], result: ExecutionResult):
+        if cache_key is not None:
+            with self._cache_lock:
+                self._cache[cache_key] = (result, time.time())
+                self._cache.move_to_end(cache_key)
+                if len(self._cache) > self.cache_maxsize:
+                    self._cache.popitem(last=False)
+
+    @staticmethod
+    def _breaker_key(model: str) -> tuple[str, str]:
+        # per (provider, model): one failing model shouldn't block its provider's others
+        return (model.split('/')[0] if '/' in model else 'unknown', model)
+
+    def _check_circuit_breaker(self, key: tuple[str, str]) -> bool:
+        # lock-free read: the common case (never opened) is a single dict probe
+        opened_at = self._breaker_opened_at.get(key)
+        if opened_at is None:
             return True
-
-        breaker = self._circuit_breaker[provider]
-        if breaker["state"] == "open":
-            if time.time() - breaker["opened_at"] > breaker["timeout"]:
-                breaker["state"] = "half-open"
-                return True
-            return False
-        return True
-
-    def _record_failure(self, provider: str):
-        if provider not in self._circuit_breaker:
-            self._circuit_breaker[provider] = {
-                "failures": 0,
-                "state": "closed",
-                "opened_at": 0,
-                "timeout": 30
-            }
-
-        breaker = self._circuit_breaker[provider]
-        breaker["failures"] += 1
-
-        if breaker["failures"] >= 5:
-            breaker["state"] = "open"
-            breaker["opened_at"] = time.time()
-
-    def _record_success(self, provider: str):
-        if provider in self._circuit_breaker:
-            breaker = self._circuit_breaker[provider]
-            if breaker["state"] == "half-open":
-                breaker["state"] = "closed"
-                breaker["failures"] = 0
+        # open for _BREAKER_RESET_SECS, then half-open: calls go through again, a success
+        # closes it and another failure re-opens it
+        return time.monotonic() - opened_at > self._BREAKER_RESET_SECS
+
+    def _record_failure(self, key: tuple[str, str]):
+        with self._breaker_lock:
+            failures = self._breaker_fails.get(key, 0) + 1
+            self._breaker_fails[key] = failures
+            if failures >= self._BREAKER_THRESHOLD:
+                self._breaker_opened_at[key] = time.monotonic()
+
+    def _record_success(self, key: tuple[str, str]):
+        if key in self._breaker_fails:
+            with self._breaker_lock:
+                self._breaker_fails.pop(key, None)
+                self._breaker_opened_at.pop(key, None)
+
+    @staticmethod
+    def _backoff_delay(attempt: int, retry_delay: float, deadline: Optional[float]) -> Optional[float]:
+        """Full-jitter exponential delay before retrying, or None if it would pass the deadline.
+
+        Jitter keeps clients that failed together (e.g. one rate-limited batch) from
+        all retrying at the same instant.
+        """
+        delay = random.uniform(0, retry_delay * (2 ** attempt))
+        if deadline is not None and time.monotonic() + delay > deadline:
+            return None
+        return delay
 
     def _build_params(self, prompt: str, model: str, **kwargs: Any) -> dict[str, Any]:
         params = {
@@ -108,14 +175,16 @@ class LLMClient:
     ) -> ExecutionResult:
         latency_ms = int((time.time() - start_time) * 1000)
 
+        hidden = getattr(response, "_hidden_params", None) or {}
+        usage = response.usage
+
         output = response.choices[0].message.content or ""
-        provider = response._hidden_params.get("custom_llm_provider", "unknown")
-        tokens_in = response.usage.prompt_tokens if response.usage else 0
-        tokens_out = response.usage.completion_tokens if response.usage else 0
+        provider = hidden.get("custom_llm_provider", "unknown")
+        tokens_in = usage.prompt_tokens if usage else 0
+        tokens_out = usage.completion_tokens if usage else 0
 
-        cost_usd = 0.0
-        if hasattr(response, '_hidden_params') and 'response_cost' in response._hidden_params:
-            cost_usd = float(response._hidden_params['response_cost'])
+        response_cost = hidden.get("response_cost")
+        cost_usd = float(response_cost) if response_cost is not None else 0.0
 
         return ExecutionResult(
             output=output,
@@ -149,6 +218,7 @@ class LLMClient:
         model: str,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        total_timeout: Optional[float] = None,
         **kwargs: Any
     ) -> ExecutionResult:
         cache_key = self._get_cache_key(prompt, model, **kwargs)
@@ -156,31 +226,33 @@ class LLMClient:
         if cached_result:
             return cached_result
 
-        provider = model.split('/')[0] if '/' in model else 'unknown'
-        if not self._check_circuit_breaker(provider):
-            raise LLMError(f"Circuit breaker open for provider '{provider}'")
+        breaker = self._breaker_key(model)
+        if not self._check_circuit_breaker(breaker):
+            raise LLMError(f"Circuit breaker open for provider '{breaker[0]}' (model '{model}')")
 
         params = self._build_params(prompt, model, **kwargs)
 
+        # total_timeout bounds all attempts plus backoff; monotonic, so clock changes can't stretch it
+        deadline = time.monotonic() + total_timeout if total_timeout is not None else None
         for attempt in range(max_retries):
             try:
                 start_time = time.time()
                 response = completion(**params)
                 result = self._parse_response(response, model, start_time)
 
-                self._record_success(provider)
+                self._record_success(breaker)
                 self._set_cache(cache_key, result)
                 return result
 
             except (LiteLLMRateLimitError, Timeout, APIError) as e:
-                if attempt < max_retries - 1:
-                    delay = retry_delay * (2 ** attempt)
+                delay = self._backoff_delay(attempt, retry_delay, deadline) if attempt < max_retries - 1 else None
+                if delay is not None:
                     time.sleep(delay)
                     continue
-                self._record_failure(provider)
+                self._record_failure(breaker)
                 self._handle_exceptions(e, model)
             except Exception as e:
-                self._record_failure(provider)
+                self._record_failure(breaker)
                 self._handle_exceptions(e, model)
 
         raise LLMError(f"Failed to execute model '{model}' after {max_retries} retries")
@@ -191,6 +263,7 @@ class LLMClient:
         model: str,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        total_timeout: Optional[float] = None,
         **kwargs: Any
     ) -> ExecutionResult:
         cache_key = self._get_cache_key(prompt, model, **kwargs)
@@ -198,31 +271,32 @@ class LLMClient:
         if cached_result:
             return cached_result
 
-        provider = model.split('/')[0] if '/' in model else 'unknown'
-        if not self._check_circuit_breaker(provider):
-            raise LLMError(f"Circuit breaker open for provider '{provider}'")
+        breaker = self._breaker_key(model)
+        if not self._check_circuit_breaker(breaker):
+            raise LLMError(f"Circuit breaker open for provider '{breaker[0]}' (model '{model}')")
 
         params = self._build_params(prompt, model, **kwargs)
 
+        deadline = time.monotonic() + total_timeout if total_timeout is not None else None
         for attempt in range(max_retries):
             try:
                 start_time = time.time()
                 response = await acompletion(**params)
                 result = self._parse_response(response, model, start_time)
 
-                self._record_success(provider)
+                self._record_success(breaker)
                 self._set_cache(cache_key, result)
                 return result
 
             except (LiteLLMRateLimitError, Timeout, APIError) as e:
-                if attempt < max_retries - 1:
-                    delay = retry_delay * (2 ** attempt)
+                delay = self._backoff_delay(attempt, retry_delay, deadline) if attempt < max_retries - 1 else None
+                if delay is not None:
                     await asyncio.sleep(delay)
                     continue
-                self._record_failure(provider)
+                self._record_failure(breaker)
                 self._handle_exceptions(e, model)
             except Exception as e:
-                self._record_failure(provider)
+                self._record_failure(breaker)
                 self._handle_exceptions(e, model)
 
         raise LLMError(f"Failed to execute model '{model}' after {max_retries} retries")
@@ -231,13 +305,108 @@ class LLMClient:
         self,
         prompts: List[str],
         model: str,
+        max_workers: int = 10,
+        **kwargs: Any
+    ) -> List[ExecutionResult]:
+        provider = model.split('/')[0] if '/' in model else 'unknown'
+        if provider in MULTI_PROMPT_PROVIDERS and len(prompts) > 1 and "messages" not in kwargs:
+            return self._execute_multi_prompt(prompts, model, **kwargs)
+
+        # calls are network-bound: submit them all, then collect in prompt order;
+        # max_workers caps in-flight requests to stay under provider rate limits
+        if len(prompts) <= 1:
+            return [self.execute(prompt, model, **kwargs) for prompt in prompts]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(prompts))) as executor:
+            futures = [executor.submit(self.execute, prompt, model, **kwargs) for prompt in prompts]
+            return [future.result() for future in futures]
+
+    def _execute_multi_prompt(
+        self,
+        prompts: List[str],
+        model: str,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        total_timeout: Optional[float] = None,
         **kwargs: Any
     ) -> List[ExecutionResult]:
-        results = []
-        for prompt in prompts:
-            result = self.execute(prompt, model, **kwargs)
-            results.append(result)
-        return results
+        """Send every uncached prompt in one list-prompt completion request."""
+        cache_keys = [self._get_cache_key(prompt, model, **kwargs) for prompt in prompts]
+        results: List[Optional[ExecutionResult]] = [self._get_from_cache(key) for key in cache_keys]
+        missing = [i for i, result in enumerate(results) if result is None]
+        if not missing:
+            return results
+
+        breaker = self._breaker_key(model)
+        if not self._check_circuit_breaker(breaker):
+            raise LLMError(f"Circuit breaker open for provider '{breaker[0]}' (model '{model}')")
+
+        params = {
+            "model": model,
+            "prompt": [prompts[i] for i in missing],
+            "timeout": kwargs.pop("timeout", 120),
+            **kwargs
+        }
+
+        deadline = time.monotonic() + total_timeout if total_timeout is not None else None
+        for attempt in range(max_retries):
+            try:
+                start_time = time.time()
+                response = text_completion(**params)
+                fresh = self._split_multi_prompt_response(response, model, len(missing), kwargs.get("n") or 1, start_time)
+
+                self._record_success(breaker)
+                for i, result in zip(missing, fresh):
+                    results[i] = result
+                    self._set_cache(cache_keys[i], result)
+                return results
+
+            except (LiteLLMRateLimitError, Timeout, APIError) as e:
+                delay = self._backoff_delay(attempt, retry_delay, deadline) if attempt < max_retries - 1 else None
+                if delay is not None:
+                    time.sleep(delay)
+                    continue
+                self._record_failure(breaker)
+                self._handle_exceptions(e, model)
+            except Exception as e:
+                self._record_failure(breaker)
+                self._handle_exceptions(e, model)
+
+        raise LLMError(f"Failed to execute model '{model}' after {max_retries} retries")
+
+    def _split_multi_prompt_response(
+        self,
+        response: Any,
+        model: str,
+        count: int,
+        n: int,
+        start_time: float
+    ) -> List[ExecutionResult]:
+        # prompt i's first choice has index i * n; usage and cost cover the whole
+        # request, so they are split evenly (remainders to the first results)
+        latency_ms = int((time.time() - start_time) * 1000)
+
+        hidden = getattr(response, "_hidden_params", None) or {}
+        usage = response.usage
+        provider = hidden.get("custom_llm_provider", "unknown")
+        response_cost = hidden.get("response_cost")
+        cost_usd = float(response_cost) if response_cost is not None else 0.0
+
+        texts = {choice.index: choice.text or "" for choice in response.choices}
+        tokens_in, extra_in = divmod(usage.prompt_tokens if usage else 0, count)
+        tokens_out, extra_out = divmod(usage.completion_tokens if usage else 0, count)
+
+        return [
+            ExecutionResult(
+                output=texts.get(i * n, ""),
+                provider=provider,
+                model=model,
+                tokens_in=tokens_in + (i < extra_in),
+                tokens_out=tokens_out + (i < extra_out),
+                cost_usd=cost_usd / count,
+                latency_ms=latency_ms
+            )
+            for i in range(count)
+        ]
 
     async def execute_batch_async(
         self,
@@ -264,18 +433,22 @@ class LLMClient:
         params = self._build_params(prompt, model, **kwargs)
         params["stream"] = True
 
-        provider = model.split('/')[0] if '/' in model else 'unknown'
-        if not self._check_circuit_breaker(provider):
-            raise LLMError(f"Circuit breaker open for provider '{provider}'")
+        breaker = self._breaker_key(model)
+        if not self._check_circuit_breaker(breaker):
+            raise LLMError(f"Circuit breaker open for provider '{breaker[0]}' (model '{model}')")
 
         try:
             response = completion(**params)
+            # one attribute walk per chunk; role-only and usage-only chunks carry no text
             for chunk in response:
-                if hasattr(chunk.choices[0], 'delta') and chunk.choices[0].delta.content:
-                    yield chunk.choices[0].delta.content
+                choices = chunk.choices
+                delta = getattr(choices[0], 'delta', None) if choices else None
+                content = delta.content if delta is not None else None
+                if content:
+                    yield content
 
         except Exception as e:
-            self._record_failure(provider)
+            self._record_failure(breaker)
             self._handle_exceptions(e, model)
 
     async def execute_stream_async(
@@ -287,22 +460,33 @@ class LLMClient:
         params = self._build_params(prompt, model, **kwargs)
         params["stream"] = True
 
-        provider = model.split('/')[0] if '/' in model else 'unknown'
-        if not self._check_circuit_breaker(provider):
-            raise LLMError(f"Circuit breaker open for provider '{provider}'")
+        breaker = self._breaker_key(model)
+        if not self._check_circuit_breaker(breaker):
+            raise LLMError(f"Circuit breaker open for provider '{breaker[0]}' (model '{model}')")
 
         try:
             response = await acompletion(**params)
             async for chunk in response:
-                if hasattr(chunk.choices[0], 'delta') and chunk.choices[0].delta.content:
-                    yield chunk.choices[0].delta.content
+                choices = chunk.choices
+                delta = getattr(choices[0], 'delta', None) if choices else None
+                content = delta.content if delta is not None else None
+                if content:
+                    yield content
 
         except Exception as e:
-            self._record_failure(provider)
+            self._record_failure(breaker)
             self._handle_exceptions(e, model)
 
+    def cache_stats(self) -> dict:
+        """Response cache hits, misses and size; a low hit rate means caching isn't paying off."""
+        with self._cache_lock:
+            return {**self._cache_stats, "size": len(self._cache)}
+
     def clear_cache(self):
-        self._cache.clear()
+        with self._cache_lock:
+            self._cache.clear()
 
     def reset_circuit_breakers(self):
-        self._circuit_breaker.clear()
+        with self._breaker_lock:
+            self._breaker_fails.clear()
+            self._breaker_opened_at.clear()
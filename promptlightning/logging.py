@@ -1,8 +1,8 @@
 from __future__ import annotations
-import sqlite3, json, time
+import sqlite3, json, time, threading
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, Mapping
 
 _SCHEMA = """
 CREATE TABLE IF NOT EXISTS logs (
@@ -22,6 +22,8 @@ CREATE TABLE IF NOT EXISTS logs (
 );
 """
 
+_INDEX = "CREATE INDEX IF NOT EXISTS idx_logs_prompt_id ON logs(prompt_id)"
+
 _MIGRATION_ADD_LLM_COLUMNS = """
 ALTER TABLE logs ADD COLUMN provider TEXT;
 ALTER TABLE logs ADD COLUMN model TEXT;
@@ -30,13 +32,30 @@ ALTER TABLE logs ADD COLUMN tokens_out INTEGER;
 ALTER TABLE logs ADD COLUMN cost_usd REAL;
 """
 
+_INSERT = """INSERT INTO logs(prompt_id,version,inputs_json,output_text,cost,latency_ms,provider,model,tokens_in,tokens_out,cost_usd)
+   VALUES (?,?,?,?,?,?,?,?,?,?,?)"""
+
+def _row(prompt_id: str, version: str, inputs: Dict[str, Any], output: str,
+         cost: float | None = None, latency_ms: int | None = None,
+         provider: str | None = None, model: str | None = None,
+         tokens_in: int | None = None, tokens_out: int | None = None,
+         cost_usd: float | None = None) -> tuple:
+    return (prompt_id, version, json.dumps(inputs, ensure_ascii=False), output, cost, latency_ms,
+            provider, model, tokens_in, tokens_out, cost_usd)
+
 class Logger:
     def __init__(self, db_path: str | Path) -> None:
         self.path = Path(db_path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        with sqlite3.connect(self.path) as con:
-            con.execute(_SCHEMA)
-            self._migrate_if_needed(con)
+        # one autocommit connection for the logger's lifetime; WAL + NORMAL keeps
+        # each insert to a WAL append instead of a full fsync of the main file
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._migrate_if_needed(self._conn)
+        self._conn.execute(_INDEX)
 
     def _migrate_if_needed(self, con: sqlite3.Connection) -> None:
         cursor = con.execute("PRAGMA table_info(logs)")
@@ -55,13 +74,29 @@ class Logger:
               provider: str | None = None, model: str | None = None,
               tokens_in: int | None = None, tokens_out: int | None = None,
               cost_usd: float | None = None) -> None:
-        with sqlite3.connect(self.path) as con:
-            con.execute(
-                """INSERT INTO logs(prompt_id,version,inputs_json,output_text,cost,latency_ms,provider,model,tokens_in,tokens_out,cost_usd)
-                   VALUES (?,?,?,?,?,?,?,?,?,?,?)""",
-                (prompt_id, version, json.dumps(inputs, ensure_ascii=False), output, cost, latency_ms,
-                 provider, model, tokens_in, tokens_out, cost_usd)
-            )
+        row = _row(prompt_id, version, inputs, output, cost, latency_ms,
+                   provider, model, tokens_in, tokens_out, cost_usd)
+        with self._lock:
+            self._conn.execute(_INSERT, row)
+
+    def write_many(self, rows: Iterable[Mapping[str, Any]]) -> int:
+        """Insert several records (keyword arguments of write()) in one transaction."""
+        params = [_row(**r) for r in rows]
+        if not params:
+            return 0
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(_INSERT, params)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        return len(params)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
 
 @contextmanager
 def run(logger: Optional[Logger], prompt_id: str, version: str):
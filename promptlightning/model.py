@@ -1,7 +1,45 @@
 from __future__ import annotations
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Optional, List, Union
+from jinja2 import Template
 from pydantic import BaseModel, Field, field_validator
 from .types import InputType
+from .renderer import compile_shared, PlainTemplate
+
+_TRUTHY = frozenset({"1", "true", "yes", "y"})
+
+# per-type coercers; exact type() checks first so already-correct values skip isinstance
+def _to_string(v: Any) -> str:
+    return v if type(v) is str else str(v)
+
+def _to_number(v: Any) -> Any:
+    tv = type(v)
+    if tv is int or tv is float: return v
+    if isinstance(v, bool):  # avoid bool as int
+        raise TypeError()
+    return v if isinstance(v, (int, float)) else float(v)
+
+def _to_bool(v: Any) -> bool:
+    if type(v) is bool: return v
+    if isinstance(v, str): return v.lower() in _TRUTHY
+    if isinstance(v, (int, float)): return v != 0
+    raise TypeError()
+
+def _to_str_list(v: Any) -> list:
+    if isinstance(v, str): return [v]
+    if isinstance(v, list) and all(isinstance(x, str) for x in v): return v
+    raise TypeError()
+
+def _to_dict(v: Any) -> dict:
+    if isinstance(v, dict): return v
+    raise TypeError()
+
+_COERCERS = {
+    "string": _to_string,
+    "number": _to_number,
+    "boolean": _to_bool,
+    "array<string>": _to_str_list,
+    "object": _to_dict,
+}
 
 class InputSpec(BaseModel):
     type: InputType = "string"
@@ -36,6 +74,11 @@ class TemplateSpec(BaseModel):
     inputs: Dict[str, InputSpec] = Field(default_factory=dict)
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
+    @property
+    def compiled(self) -> Union[Template, PlainTemplate]:
+        """Compiled template, looked up by the current template text so edits and copies never go stale."""
+        return compile_shared(self.template)
+
     def coerce_inputs(self, provided: Dict[str, Any]) -> Dict[str, Any]:
         out: Dict[str, Any] = {}
         # apply defaults, check required, type coercion
@@ -53,27 +96,10 @@ class TemplateSpec(BaseModel):
     @staticmethod
     def _coerce_type(name: str, val: Any, t: str) -> Any:
         if val is None: return None
+        fn = _COERCERS.get(t)
+        if fn is None:
+            raise ValueError(f"type mismatch for '{name}': expected {t}")
         try:
-            match t:
-                case "string":
-                    return str(val)
-                case "number":
-                    if isinstance(val, bool):  # avoid bool as int
-                        raise TypeError()
-                    return float(val) if not isinstance(val, (int, float)) else val
-                case "boolean":
-                    if isinstance(val, bool): return val
-                    if isinstance(val, str): return val.lower() in {"1","true","yes","y"}
-                    if isinstance(val, (int, float)): return val != 0
-                    raise TypeError()
-                case "array<string>":
-                    if isinstance(val, str): return [val]
-                    if isinstance(val, list) and all(isinstance(x, str) for x in val): return val
-                    raise TypeError()
-                case "object":
-                    if isinstance(val, dict): return val
-                    raise TypeError()
-                case _:
-                    raise TypeError()
+            return fn(val)
         except TypeError:
-            raise ValueError(f"type mismatch for '{name}': expected {t}")
\ No newline at end of file
+            raise ValueError(f"type mismatch for '{name}': expected {t}")
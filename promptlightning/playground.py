@@ -6,28 +6,275 @@ editing, and testing prompt templates in real-time.
 """
 
 from __future__ import annotations
+import asyncio
+import gzip
 import json
-import yaml
+import math
+import os
+import re
 import uuid
 import tempfile
 import shutil
 import hashlib
+import importlib.util
 import time
+import threading
+import weakref
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-from functools import lru_cache
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from fastapi import FastAPI, HTTPException, Request, Cookie
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, JSONResponse, Response
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 import uvicorn
 
+from ._yaml import safe_dump, YAML_C_AVAILABLE
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
 from .vault import Vault
 from .model import TemplateSpec, InputSpec
 from .exceptions import TemplateNotFound, ValidationError, RenderError
 
+_UVICORN_LOOP = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+_UVICORN_HTTP = "httptools" if importlib.util.find_spec("httptools") else "h11"
+
+if orjson is not None:
+    def _json_bytes(obj: Any) -> bytes:
+        """Serialize an API payload straight to UTF-8 JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+else:
+    def _json_bytes(obj: Any) -> bytes:
+        """Serialize an API payload straight to UTF-8 JSON bytes."""
+        return json.dumps(obj, default=str).encode("utf-8")
+
+
+def _etag(body: bytes) -> str:
+    """Strong ETag for a response body."""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+_STATIC_CONTENT_TYPES = {
+    ".js": "application/javascript",
+    ".css": "text/css",
+    ".html": "text/html",
+    ".json": "application/json",
+}
+
+
+def _accepted_encodings(request: Request) -> set:
+    """Content codings the client accepts, ignoring any offered with q=0."""
+    accepted = set()
+    for part in request.headers.get("accept-encoding", "").split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        if coding and params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            accepted.add(coding)
+    return accepted
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Whether the client's If-None-Match already covers ``etag``."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+
+def _conditional_response(request: Request, body: bytes, etag: str, cache_control: str,
+                          media_type: str = "application/json") -> Response:
+    """Return ``body`` with validators, or a bodiless 304 if the client is current."""
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type=media_type, headers=headers)
+
+
+def _atomic_write_bytes(file_path: Path, data: bytes) -> None:
+    """Write via a sibling temp file and os.replace so readers never see a partial file."""
+    try:
+        mode = file_path.stat().st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o644
+    fd, tmp_path = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+# strings matching this (and not a YAML 1.1 keyword) load back as the same string when left unquoted
+_YAML_PLAIN_RE = re.compile(r"[A-Za-z][A-Za-z0-9_./-]*\Z")
+_YAML_KEYWORDS = frozenset({"y", "n", "yes", "no", "on", "off", "true", "false", "null"})
+_YAML_ESCAPE_RE = re.compile("[\\\\\"\x00-\x1f\x7f-\x9f\u2028\u2029\ud800-\udfff\ufeff\ufffe\uffff]")
+_YAML_ESCAPES = {
+    "\\": "\\\\", '"': '\\"', "\0": "\\0", "\t": "\\t", "\n": "\\n", "\r": "\\r",
+    "\x85": "\\N", "\u2028": "\\L", "\u2029": "\\P",
+}
+
+
+def _yaml_escape(match: "re.Match[str]") -> str:
+    char = match.group()
+    escaped = _YAML_ESCAPES.get(char)
+    if escaped is None:
+        code = ord(char)
+        escaped = f"\\x{code:02X}" if code <= 0xFF else f"\\u{code:04X}"
+    return escaped
+
+
+def _yaml_scalar(value: Any) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        if math.isnan(value):
+            return ".nan"
+        if math.isinf(value):
+            return ".inf" if value > 0 else "-.inf"
+        text = repr(value)
+        # YAML 1.1 only reads exponent floats that contain a dot
+        if "." not in text and "e" in text:
+            text = text.replace("e", ".0e", 1)
+        return text
+    if isinstance(value, str):
+        if _YAML_PLAIN_RE.match(value) and value.lower() not in _YAML_KEYWORDS:
+            return value
+        return f'"{_YAML_ESCAPE_RE.sub(_yaml_escape, value)}"'
+    raise TypeError(f"cannot emit {type(value).__name__} as a YAML scalar")
+
+
+def _yaml_flow(value: Any) -> str:
+    if isinstance(value, dict):
+        return "{" + ", ".join(f"{_yaml_scalar(k)}: {_yaml_flow(v)}" for k, v in value.items()) + "}"
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(_yaml_flow(v) for v in value) + "]"
+    return _yaml_scalar(value)
+
+
+def _yaml_block(mapping: Dict[Any, Any], indent: str, lines: List[str]) -> None:
+    for key, value in mapping.items():
+        if isinstance(value, dict) and value:
+            lines.append(f"{indent}{_yaml_scalar(key)}:")
+            _yaml_block(value, indent + "  ", lines)
+        else:
+            lines.append(f"{indent}{_yaml_scalar(key)}: {_yaml_flow(value)}")
+
+
+def _dump_template_yaml(content: Dict[str, Any]) -> str:
+    """
+    Emit a template file without going through PyYAML's generic emitter.
+
+    Template files have a fixed, shallow shape (see _spec_to_dict), so mappings
+    are written block style, lists and deeper values flow style, and strings
+    plain or double-quoted. Raises TypeError for values it cannot represent.
+    """
+    lines: List[str] = []
+    _yaml_block(content, "", lines)
+    lines.append("")
+    return "\n".join(lines)
+
+
+def _write_template_yaml(file_path: Path, content: Dict[str, Any]) -> None:
+    """Blocking YAML write; request handlers run it in a worker thread."""
+    try:
+        text = _dump_template_yaml(content)
+    except TypeError:
+        # metadata holding dates or other tagged types
+        text = safe_dump(content, default_flow_style=False, sort_keys=False)
+    _atomic_write_bytes(file_path, text.encode("utf-8"))
+
+
+def _render_with_inputs(vault: Vault, template_id: str, inputs: Dict[str, Any]) -> bytes:
+    """Blocking lookup and render, serialized as a RenderResponse body; handlers run it in a worker thread."""
+    template = vault.get(template_id)
+    rendered = template.render(**inputs)
+    return _json_bytes({"rendered": rendered, "inputs_used": template.spec.coerce_inputs(inputs)})
+
+
+def _ready_lifespan(ready_event: Optional[threading.Event], on_shutdown: Optional[Callable[[], None]] = None):
+    """App lifespan that sets ready_event once startup has run and calls on_shutdown on the
+    way out, or None when there is neither."""
+    if ready_event is None and on_shutdown is None:
+        return None
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        if ready_event is not None:
+            ready_event.set()
+        try:
+            yield
+        finally:
+            if on_shutdown is not None:
+                on_shutdown()
+
+    return lifespan
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered through orjson when it is installed."""
+
+    def render(self, content: Any) -> bytes:
+        return _json_bytes(content)
+
+
+def _inputs_to_dict(spec: TemplateSpec) -> Dict[str, Dict[str, Any]]:
+    return {
+        name: {
+            "type": input_spec.type,
+            "required": input_spec.required,
+            "default": input_spec.default
+        }
+        for name, input_spec in spec.inputs.items()
+    }
+
+
+def _inputs_from_request(raw_inputs: Dict[str, Dict[str, Any]]) -> Dict[str, InputSpec]:
+    return {
+        name: InputSpec(
+            type=input_data.get("type", "string"),
+            required=input_data.get("required", True),
+            default=input_data.get("default")
+        )
+        for name, input_data in raw_inputs.items()
+    }
+
+
+def _spec_to_dict(spec: TemplateSpec) -> Dict[str, Any]:
+    """Plain-dict form of a spec, shared by template files and API responses."""
+    return {
+        "id": spec.id,
+        "version": spec.version,
+        "description": spec.description,
+        "template": spec.template,
+        "inputs": _inputs_to_dict(spec),
+        "metadata": spec.metadata
+    }
+
 
 class RenderRequest(BaseModel):
     inputs: Dict[str, Any] = Field(default_factory=dict)
@@ -58,88 +305,388 @@ class TemplateResponse(BaseModel):
     inputs: Dict[str, Any]
     metadata: Dict[str, Any]
 
+    @classmethod
+    def from_spec(cls, spec: TemplateSpec) -> TemplateResponse:
+        return cls(**_spec_to_dict(spec))
+
 
 class RenderResponse(BaseModel):
     rendered: str
     inputs_used: Dict[str, Any]
 
 
+_EXAMPLE_TEMPLATES: Tuple[TemplateSpec, ...] = (
+    TemplateSpec(
+        id="code-reviewer",
+        version="1.0.0",
+        description="Review code and provide feedback",
+        template="""Review this code and provide feedback:
+
+Language: {{ language }}
+Code:
+```{{ language }}
+{{ code }}
+```
+
+Focus on:
+- Code quality and best practices
+- Potential bugs or issues
+- Performance considerations
+- Readability and maintainability
+
+Provide specific, actionable feedback.""",
+        inputs={
+            "code": {
+                "type": "string",
+                "required": True
+            },
+            "language": {
+                "type": "string",
+                "required": True,
+                "default": "python"
+            }
+        },
+        metadata={"category": "development", "tags": ["code-review", "programming"]}
+    ),
+
+    TemplateSpec(
+        id="email-responder",
+        version="1.0.0",
+        description="Generate professional email responses",
+        template="""Write a professional email response to this message:
+
+Original Email:
+{{ original_email }}
+
+Response tone: {{ tone }}
+{% if key_points %}
+Key points to address:
+{% for point in key_points %}
+- {{ point }}
+{% endfor %}
+{% endif %}
+
+Write a clear, {{ tone }} response that addresses the main points.""",
+        inputs={
+            "original_email": {
+                "type": "string",
+                "required": True
+            },
+            "tone": {
+                "type": "string",
+                "required": False,
+                "default": "professional"
+            },
+            "key_points": {
+                "type": "array<string>",
+                "required": False
+            }
+        },
+        metadata={"category": "communication", "tags": ["email", "business"]}
+    ),
+
+    TemplateSpec(
+        id="blog-post-generator",
+        version="1.0.0",
+        description="Generate blog post outlines and content",
+        template="""Create a blog post about: {{ topic }}
+
+Target audience: {{ audience }}
+Tone: {{ tone }}
+Length: {{ length }}
+
+Structure:
+1. Compelling headline
+2. Introduction hook
+3. Main content with {{ num_sections }} sections
+4. Conclusion with call-to-action
+
+{% if keywords %}
+Include these keywords naturally: {{ keywords | join(", ") }}
+{% endif %}
+
+Focus on providing value and actionable insights.""",
+        inputs={
+            "topic": {
+                "type": "string",
+                "required": True
+            },
+            "audience": {
+                "type": "string",
+                "required": False,
+                "default": "developers"
+            },
+            "tone": {
+                "type": "string",
+                "required": False,
+                "default": "informative"
+            },
+            "length": {
+                "type": "string",
+                "required": False,
+                "default": "medium"
+            },
+            "num_sections": {
+                "type": "number",
+                "required": False,
+                "default": 3
+            },
+            "keywords": {
+                "type": "array<string>",
+                "required": False
+            }
+        },
+        metadata={"category": "content", "tags": ["blog", "writing", "marketing"]}
+    )
+)
+
+# one-pass pydantic-core serializer: model -> JSON bytes without a model_dump() dict in between
+_TEMPLATE_RESPONSE_ADAPTER = TypeAdapter(TemplateResponse)
+
+# /api/examples is constant, so its body and ETag are serialized once at import.
+# The example specs only hold plain types, so they go straight from dicts to JSON.
+_EXAMPLES_BODY: bytes = _json_bytes([_spec_to_dict(spec) for spec in _EXAMPLE_TEMPLATES])
+_EXAMPLES_ETAG: str = _etag(_EXAMPLES_BODY)
+
+# served when the React UI has not been built; encoded once at import
+_FALLBACK_HTML: bytes = """\
+<!DOCTYPE html>
+<html>
+<head>
+    <title>PromptLightning Playground</title>
+    <meta charset="utf-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1">
+    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            margin: 0; padding: 20px; background: #f5f5f5;
+        }
+        .container { max-width: 1200px; margin: 0 auto; }
+        .header { background: white; padding: 20px; border-radius: 8px; margin-bottom: 20px; }
+        .content { background: white; padding: 20px; border-radius: 8px; }
+        .api-info { background: #e3f2fd; padding: 15px; border-radius: 4px; margin-top: 20px; }
+        .build-info { background: #fff3cd; padding: 15px; border-radius: 4px; margin-top: 20px; border: 1px solid #ffeaa7; }
+        code { background: #f5f5f5; padding: 2px 4px; border-radius: 3px; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>🎯 PromptLightning Playground</h1>
+            <p>Interactive playground for prompt template development</p>
+        </div>
+        <div class="content">
+            <h2>API Endpoints</h2>
+            <ul>
+                <li><code>GET /api/templates</code> - List all templates</li>
+                <li><code>GET /api/templates/{id}</code> - Get template details</li>
+                <li><code>POST /api/templates/{id}/render</code> - Render template</li>
+                <li><code>GET /api/examples</code> - Get example templates</li>
+                <li><code>GET /api/health</code> - Health check</li>
+            </ul>
+
+            <div class="build-info">
+                <strong>🔧 React UI Available!</strong><br>
+                To use the full interactive playground UI, build the React app:
+                <br><br>
+                <code>cd web && npm install && npm run build</code>
+                <br><br>
+                Then restart the playground server.
+            </div>
+
+            <div class="api-info">
+                <strong>API Testing</strong><br>
+                Try these endpoints: <a href="/api/templates">/api/templates</a> |
+                <a href="/api/examples">/api/examples</a> |
+                <a href="/api/health">/api/health</a>
+            </div>
+        </div>
+    </div>
+</body>
+</html>
+""".encode("utf-8")
+
+_DEMO_FALLBACK_HTML: bytes = """\
+<!DOCTYPE html>
+<html>
+<head>
+    <title>PromptLightning Playground - Demo Mode</title>
+    <meta charset="utf-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1">
+    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            margin: 0; padding: 20px; background: #f5f5f5;
+        }
+        .container { max-width: 1200px; margin: 0 auto; }
+        .header { background: white; padding: 20px; border-radius: 8px; margin-bottom: 20px; }
+        .content { background: white; padding: 20px; border-radius: 8px; }
+        .api-info { background: #e3f2fd; padding: 15px; border-radius: 4px; margin-top: 20px; }
+        .demo-badge { background: #4caf50; color: white; padding: 4px 8px; border-radius: 4px; font-size: 0.8em; }
+        code { background: #f5f5f5; padding: 2px 4px; border-radius: 3px; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>PromptLightning Playground <span class="demo-badge">DEMO MODE</span></h1>
+            <p>Interactive playground with session isolation - your data is private!</p>
+        </div>
+        <div class="content">
+            <h2>API Endpoints</h2>
+            <ul>
+                <li><code>GET /api/templates</code> - List all templates</li>
+                <li><code>GET /api/templates/{id}</code> - Get template details</li>
+                <li><code>POST /api/templates/{id}/render</code> - Render template</li>
+                <li><code>GET /api/examples</code> - Get example templates</li>
+                <li><code>GET /api/health</code> - Health check</li>
+            </ul>
+
+            <div class="api-info">
+                <strong>API Testing</strong><br>
+                Try these endpoints: <a href="/api/templates">/api/templates</a> |
+                <a href="/api/examples">/api/examples</a> |
+                <a href="/api/health">/api/health</a>
+            </div>
+        </div>
+    </div>
+</body>
+</html>
+""".encode("utf-8")
+_FALLBACK_HTML_ETAG: str = _etag(_FALLBACK_HTML)
+_DEMO_FALLBACK_HTML_ETAG: str = _etag(_DEMO_FALLBACK_HTML)
+
+
 class PlaygroundServer:
-    def __init__(self, vault: Vault, host: str = "localhost", port: int = 3000):
+    _TEMPLATE_CACHE_SIZE = 128
+
+    def __init__(self, vault: Vault, host: str = "localhost", port: int = 3000,
+                 ready_event: Optional[threading.Event] = None):
         self.vault = vault
         self.host = host
         self.port = port
+        # set once the app has started, so embedders can wait instead of polling /api/health
+        self._ready_event = ready_event
         self._cache_version = 0
+        self._template_list_cache: Dict[int, Tuple[List[str], bytes, str]] = {}
+        self._template_cache: Dict[Tuple[int, str], Tuple[bytes, str]] = {}
+        self._health_cache: Optional[Tuple[int, bytes]] = None
+        # cache misses are filled from worker threads; writes and invalidation go through this
+        self._cache_lock = threading.Lock()
+        # bumped on every invalidation, so a miss that started before it won't store its result
+        self._list_gen = 0
+        self._template_gens: Dict[str, int] = {}
+        # vault config is fixed for the server's lifetime; resolve it once instead of per request
+        prompt_dir = vault.config.get("prompt_dir")
+        # write where the registry reads: its root was resolved at construction, so a
+        # relative prompt_dir can't drift if the process changes directory later
+        registry_root = getattr(vault.registry, "root", None)
+        self._prompt_dir: Optional[Path] = registry_root or (Path(prompt_dir) if prompt_dir else None)
+        self._logging_enabled: bool = vault.config.get("logging", {}).get("enabled", False)
+        self._health_vault_config = {"prompt_dir": prompt_dir, "logging_enabled": self._logging_enabled}
         self.app = self._create_app()
 
-    def _get_vault_hash(self) -> str:
-        """Generate hash for cache invalidation based on cache version."""
-        return f"{self._cache_version}_{id(self.vault)}"
-
-    def _invalidate_cache(self):
-        """Invalidate all caches by incrementing version."""
-        self._cache_version += 1
-        self.vault.invalidate_cache()
-        self._get_template_list_cached.cache_clear()
-        self._get_template_cached.cache_clear()
-
-    @lru_cache(maxsize=1)
-    def _get_template_list_cached(self, cache_key: str) -> List[str]:
-        """Cached template list retrieval."""
-        return list(self.vault.list())
-
-    @lru_cache(maxsize=128)
-    def _get_template_cached(self, template_id: str, cache_key: str) -> TemplateResponse:
-        """Cached template retrieval."""
+    def _invalidate_cache(self, template_id: Optional[str] = None):
+        """Drop cached state for one template plus the list, or everything (new version) when no id is given."""
+        self.vault.invalidate(template_id)
+        with self._cache_lock:
+            self._list_gen += 1
+            self._template_list_cache.clear()
+            self._health_cache = None
+            if template_id is None:
+                self._cache_version += 1
+                self._template_cache.clear()
+            else:
+                self._template_gens[template_id] = self._template_gens.get(template_id, 0) + 1
+                self._template_cache.pop((self._cache_version, template_id), None)
+
+    def _get_health_body(self) -> bytes:
+        """Serialized health payload; it only changes when the template set does."""
+        gen = self._list_gen
+        health = self._health_cache  # one read: invalidation may reset it concurrently
+        if health is not None and health[0] == gen:
+            return health[1]
+        templates, _, _ = self._get_template_list_cached()
+        body = _json_bytes({
+            "status": "healthy",
+            "templates_loaded": len(templates),
+            "vault_config": self._health_vault_config
+        })
+        with self._cache_lock:
+            if self._list_gen == gen:
+                self._health_cache = (gen, body)
+        return body
+
+    def _get_template_list_cached(self) -> Tuple[List[str], bytes, str]:
+        """Cached template IDs with their serialized body and ETag."""
+        gen = self._list_gen
+        cached = self._template_list_cache.get(gen)
+        if cached is None:
+            templates = list(self.vault.list())
+            body = _json_bytes(templates)
+            cached = (templates, body, _etag(body))
+            with self._cache_lock:
+                if self._list_gen == gen:
+                    self._template_list_cache.clear()
+                    self._template_list_cache[gen] = cached
+        return cached
+
+    def _get_template_cached(self, template_id: str) -> Tuple[bytes, str]:
+        """Cached serialized template and its ETag."""
+        key = (self._cache_version, template_id)
+        gen = self._template_gens.get(template_id, 0)
+        cached = self._template_cache.get(key)
+        if cached is not None:
+            return cached
+
         template = self.vault.get(template_id)
         spec = template.spec
-        return TemplateResponse(
-            id=spec.id,
-            version=spec.version,
-            description=spec.description,
-            template=spec.template,
-            inputs={name: {
-                "type": input_spec.type,
-                "required": input_spec.required,
-                "default": input_spec.default
-            } for name, input_spec in spec.inputs.items()},
-            metadata=spec.metadata
-        )
+        template_response = TemplateResponse.from_spec(spec)
+        body = _TEMPLATE_RESPONSE_ADAPTER.dump_json(template_response)
+        cached = (body, _etag(body))
+
+        with self._cache_lock:
+            if key[0] != self._cache_version or self._template_gens.get(template_id, 0) != gen:
+                return cached  # invalidated while this was read; serve it, don't keep it
+            if len(self._template_cache) >= self._TEMPLATE_CACHE_SIZE:
+                self._template_cache.pop(next(iter(self._template_cache)))
+            self._template_cache[key] = cached
+        return cached
 
     def _create_app(self) -> FastAPI:
         app = FastAPI(
             title="PromptLightning Playground",
             description="Interactive playground for prompt template development",
-            version="0.1.0"
+            version="0.1.0",
+            default_response_class=FastJSONResponse,
+            lifespan=_ready_lifespan(self._ready_event)
         )
 
-        app.add_middleware(GZipMiddleware, minimum_size=1000)
+        # level 1 is several times cheaper than the default 9 for only a few percent on JSON
+        app.add_middleware(GZipMiddleware, minimum_size=1000, compresslevel=1)
 
         @app.get("/api/templates", response_model=List[str])
-        async def list_templates():
+        async def list_templates(request: Request):
             """List all available template IDs."""
             try:
-                cache_key = self._get_vault_hash()
-                templates = self._get_template_list_cached(cache_key)
-                return Response(
-                    content=json.dumps(templates),
-                    media_type="application/json",
-                    headers={"Cache-Control": "public, max-age=60"}
-                )
+                # cache hits are served inline; a miss reads the registry off the event loop
+                cached = self._template_list_cache.get(self._list_gen)
+                if cached is None:
+                    cached = await asyncio.to_thread(self._get_template_list_cached)
+                _, body, etag = cached
+                return _conditional_response(request, body, etag, "public, max-age=60")
             except Exception as e:
                 raise HTTPException(status_code=500, detail=str(e))
 
         @app.get("/api/templates/{template_id}", response_model=TemplateResponse)
-        async def get_template(template_id: str):
+        async def get_template(template_id: str, request: Request):
             """Get a specific template with all its details."""
             try:
-                cache_key = self._get_vault_hash()
-                template_response = self._get_template_cached(template_id, cache_key)
-                return Response(
-                    content=template_response.model_dump_json(),
-                    media_type="application/json",
-                    headers={"Cache-Control": "public, max-age=300"}
-                )
+                cached = self._template_cache.get((self._cache_version, template_id))
+                if cached is None:
+                    cached = await asyncio.to_thread(self._get_template_cached, template_id)
+                body, etag = cached
+                return _conditional_response(request, body, etag, "public, max-age=300")
             except TemplateNotFound:
                 raise HTTPException(status_code=404, detail=f"Template '{template_id}' not found")
             except Exception as e:
@@ -152,19 +699,10 @@ class PlaygroundServer:
                 if not request.id or request.id.strip() == "":
                     raise HTTPException(status_code=422, detail="Template ID cannot be empty")
 
-                try:
-                    self.vault.get(request.id)
+                if await asyncio.to_thread(self.vault.exists, request.id):
                     raise HTTPException(status_code=400, detail=f"Template '{request.id}' already exists")
-                except TemplateNotFound:
-                    pass
 
-                inputs_dict = {}
-                for input_name, input_data in request.inputs.items():
-                    inputs_dict[input_name] = InputSpec(
-                        type=input_data.get("type", "string"),
-                        required=input_data.get("required", True),
-                        default=input_data.get("default")
-                    )
+                inputs_dict = _inputs_from_request(request.inputs)
 
                 spec = TemplateSpec(
                     id=request.id,
@@ -175,43 +713,17 @@ class PlaygroundServer:
                     metadata=request.metadata
                 )
 
-                prompt_dir = Path(self.vault.config["prompt_dir"])
+                prompt_dir = self._prompt_dir
                 filename = f"{spec.id}.yaml"
                 file_path = prompt_dir / filename
 
-                yaml_content = {
-                    "id": spec.id,
-                    "version": spec.version,
-                    "description": spec.description,
-                    "template": spec.template,
-                    "inputs": {
-                        name: {
-                            "type": input_spec.type,
-                            "required": input_spec.required,
-                            "default": input_spec.default
-                        }
-                        for name, input_spec in spec.inputs.items()
-                    },
-                    "metadata": spec.metadata
-                }
-
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    yaml.dump(yaml_content, f, default_flow_style=False, sort_keys=False)
-
-                self._invalidate_cache()
-
-                return TemplateResponse(
-                    id=spec.id,
-                    version=spec.version,
-                    description=spec.description,
-                    template=spec.template,
-                    inputs={name: {
-                        "type": input_spec.type,
-                        "required": input_spec.required,
-                        "default": input_spec.default
-                    } for name, input_spec in spec.inputs.items()},
-                    metadata=spec.metadata
-                )
+                yaml_content = _spec_to_dict(spec)
+
+                await asyncio.to_thread(_write_template_yaml, file_path, yaml_content)
+
+                self._invalidate_cache(spec.id)
+
+                return Response(content=_json_bytes(yaml_content), media_type="application/json")
 
             except HTTPException:
                 raise
@@ -225,7 +737,7 @@ class PlaygroundServer:
             """Update an existing template and save it to the filesystem."""
             try:
                 try:
-                    current_template = self.vault.get(template_id)
+                    current_template = await asyncio.to_thread(self.vault.get, template_id)
                     current_spec = current_template.spec
                 except TemplateNotFound:
                     raise HTTPException(status_code=404, detail=f"Template '{template_id}' not found")
@@ -234,14 +746,8 @@ class PlaygroundServer:
                 updated_description = request.description if request.description is not None else current_spec.description
                 updated_template = request.template if request.template is not None else current_spec.template
 
-                updated_inputs_dict = {}
                 if request.inputs is not None:
-                    for input_name, input_data in request.inputs.items():
-                        updated_inputs_dict[input_name] = InputSpec(
-                            type=input_data.get("type", "string"),
-                            required=input_data.get("required", True),
-                            default=input_data.get("default")
-                        )
+                    updated_inputs_dict = _inputs_from_request(request.inputs)
                 else:
                     updated_inputs_dict = current_spec.inputs
 
@@ -256,43 +762,17 @@ class PlaygroundServer:
                     metadata=updated_metadata
                 )
 
-                prompt_dir = Path(self.vault.config["prompt_dir"])
+                prompt_dir = self._prompt_dir
                 filename = f"{updated_spec.id}.yaml"
                 file_path = prompt_dir / filename
 
-                yaml_content = {
-                    "id": updated_spec.id,
-                    "version": updated_spec.version,
-                    "description": updated_spec.description,
-                    "template": updated_spec.template,
-                    "inputs": {
-                        name: {
-                            "type": input_spec.type,
-                            "required": input_spec.required,
-                            "default": input_spec.default
-                        }
-                        for name, input_spec in updated_spec.inputs.items()
-                    },
-                    "metadata": updated_spec.metadata
-                }
-
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    yaml.dump(yaml_content, f, default_flow_style=False, sort_keys=False)
-
-                self._invalidate_cache()
-
-                return TemplateResponse(
-                    id=updated_spec.id,
-                    version=updated_spec.version,
-                    description=updated_spec.description,
-                    template=updated_spec.template,
-                    inputs={name: {
-                        "type": input_spec.type,
-                        "required": input_spec.required,
-                        "default": input_spec.default
-                    } for name, input_spec in updated_spec.inputs.items()},
-                    metadata=updated_spec.metadata
-                )
+                yaml_content = _spec_to_dict(updated_spec)
+
+                await asyncio.to_thread(_write_template_yaml, file_path, yaml_content)
+
+                self._invalidate_cache(updated_spec.id)
+
+                return Response(content=_json_bytes(yaml_content), media_type="application/json")
 
             except HTTPException:
                 raise
@@ -305,15 +785,8 @@ class PlaygroundServer:
         async def render_template(template_id: str, request: RenderRequest):
             """Render a template with provided inputs."""
             try:
-                template = self.vault.get(template_id)
-                rendered = template.render(**request.inputs)
-
-                inputs_used = template.spec.coerce_inputs(request.inputs)
-
-                return RenderResponse(
-                    rendered=rendered,
-                    inputs_used=inputs_used
-                )
+                body = await asyncio.to_thread(_render_with_inputs, self.vault, template_id, request.inputs)
+                return Response(content=body, media_type="application/json")
             except TemplateNotFound:
                 raise HTTPException(status_code=404, detail=f"Template '{template_id}' not found")
             except ValidationError as e:
@@ -324,46 +797,22 @@ class PlaygroundServer:
                 raise HTTPException(status_code=500, detail=str(e))
 
         @app.get("/api/examples", response_model=List[TemplateResponse])
-        async def get_example_templates():
+        async def get_example_templates(request: Request):
             """Get example templates for the playground showcase."""
-            examples = self._get_example_templates()
-            response_data = [
-                TemplateResponse(
-                    id=spec.id,
-                    version=spec.version,
-                    description=spec.description,
-                    template=spec.template,
-                    inputs={name: {
-                        "type": input_spec.type,
-                        "required": input_spec.required,
-                        "default": input_spec.default
-                    } for name, input_spec in spec.inputs.items()},
-                    metadata=spec.metadata
-                )
-                for spec in examples
-            ]
-            return Response(
-                content=json.dumps([r.model_dump() for r in response_data]),
-                media_type="application/json",
-                headers={"Cache-Control": "public, max-age=3600"}
-            )
+            body, etag = _EXAMPLES_BODY, _EXAMPLES_ETAG
+            return _conditional_response(request, body, etag, "public, max-age=3600")
 
         @app.get("/api/health")
         async def health_check():
             """Health check endpoint."""
             try:
-                cache_key = self._get_vault_hash()
-                templates = self._get_template_list_cached(cache_key)
-                template_count = len(templates)
+                health = self._health_cache
+                if health is not None and health[0] == self._list_gen:
+                    body = health[1]
+                else:
+                    body = await asyncio.to_thread(self._get_health_body)
                 return Response(
-                    content=json.dumps({
-                        "status": "healthy",
-                        "templates_loaded": template_count,
-                        "vault_config": {
-                            "prompt_dir": self.vault.config.get("prompt_dir"),
-                            "logging_enabled": self.vault.config.get("logging", {}).get("enabled", False)
-                        }
-                    }),
+                    content=body,
                     media_type="application/json",
                     headers={"Cache-Control": "no-cache"}
                 )
@@ -373,267 +822,184 @@ class PlaygroundServer:
         playground_dir = Path(__file__).parent.parent / "playground"
 
         if (playground_dir / "index.html").exists():
-            @app.get("/static/{file_path:path}")
-            async def serve_static(file_path: str):
-                """Serve static files with caching headers."""
-                static_file_path = playground_dir / file_path
-                if static_file_path.exists() and static_file_path.is_file():
-                    content = static_file_path.read_bytes()
-
-                    etag = hashlib.md5(content).hexdigest()
-
-                    content_type = "application/octet-stream"
-                    if file_path.endswith('.js'):
-                        content_type = "application/javascript"
-                    elif file_path.endswith('.css'):
-                        content_type = "text/css"
-                    elif file_path.endswith('.html'):
-                        content_type = "text/html"
-                    elif file_path.endswith('.json'):
-                        content_type = "application/json"
-
-                    return Response(
-                        content=content,
-                        media_type=content_type,
-                        headers={
-                            "Cache-Control": "public, max-age=31536000, immutable",
-                            "ETag": etag
-                        }
-                    )
-                raise HTTPException(status_code=404)
-
-            app.mount("/", StaticFiles(directory=str(playground_dir), html=True), name="playground")
+            self._add_static_routes(app, playground_dir)
         else:
             @app.get("/", response_class=HTMLResponse)
-            async def playground_ui():
+            async def playground_ui(request: Request):
                 """Serve fallback UI when React app is not built."""
-                return """
-                <!DOCTYPE html>
-                <html>
-                <head>
-                    <title>PromptLightning Playground</title>
-                    <meta charset="utf-8">
-                    <meta name="viewport" content="width=device-width, initial-scale=1">
-                    <style>
-                        body {
-                            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                            margin: 0; padding: 20px; background: #f5f5f5;
-                        }
-                        .container { max-width: 1200px; margin: 0 auto; }
-                        .header { background: white; padding: 20px; border-radius: 8px; margin-bottom: 20px; }
-                        .content { background: white; padding: 20px; border-radius: 8px; }
-                        .api-info { background: #e3f2fd; padding: 15px; border-radius: 4px; margin-top: 20px; }
-                        .build-info { background: #fff3cd; padding: 15px; border-radius: 4px; margin-top: 20px; border: 1px solid #ffeaa7; }
-                        code { background: #f5f5f5; padding: 2px 4px; border-radius: 3px; }
-                    </style>
-                </head>
-                <body>
-                    <div class="container">
-                        <div class="header">
-                            <h1>🎯 PromptLightning Playground</h1>
-                            <p>Interactive playground for prompt template development</p>
-                        </div>
-                        <div class="content">
-                            <h2>API Endpoints</h2>
-                            <ul>
-                                <li><code>GET /api/templates</code> - List all templates</li>
-                                <li><code>GET /api/templates/{id}</code> - Get template details</li>
-                                <li><code>POST /api/templates/{id}/render</code> - Render template</li>
-                                <li><code>GET /api/examples</code> - Get example templates</li>
-                                <li><code>GET /api/health</code> - Health check</li>
-                            </ul>
-
-                            <div class="build-info">
-                                <strong>🔧 React UI Available!</strong><br>
-                                To use the full interactive playground UI, build the React app:
-                                <br><br>
-                                <code>cd web && npm install && npm run build</code>
-                                <br><br>
-                                Then restart the playground server.
-                            </div>
-
-                            <div class="api-info">
-                                <strong>API Testing</strong><br>
-                                Try these endpoints: <a href="/api/templates">/api/templates</a> |
-                                <a href="/api/examples">/api/examples</a> |
-                                <a href="/api/health">/api/health</a>
-                            </div>
-                        </div>
-                    </div>
-                </body>
-                </html>
-                """
+                return _conditional_response(request, _FALLBACK_HTML, _FALLBACK_HTML_ETAG, "public, max-age=300", "text/html")
 
+        self._prewarm_caches()
         return app
 
-    def _get_example_templates(self) -> List[TemplateSpec]:
-        """Get example templates for playground showcase."""
-        examples = [
-            TemplateSpec(
-                id="code-reviewer",
-                version="1.0.0",
-                description="Review code and provide feedback",
-                template="""Review this code and provide feedback:
-
-Language: {{ language }}
-Code:
-```{{ language }}
-{{ code }}
-```
-
-Focus on:
-- Code quality and best practices
-- Potential bugs or issues
-- Performance considerations
-- Readability and maintainability
-
-Provide specific, actionable feedback.""",
-                inputs={
-                    "code": {
-                        "type": "string",
-                        "required": True
-                    },
-                    "language": {
-                        "type": "string",
-                        "required": True,
-                        "default": "python"
-                    }
-                },
-                metadata={"category": "development", "tags": ["code-review", "programming"]}
-            ),
-
-            TemplateSpec(
-                id="email-responder",
-                version="1.0.0",
-                description="Generate professional email responses",
-                template="""Write a professional email response to this message:
-
-Original Email:
-{{ original_email }}
-
-Response tone: {{ tone }}
-{% if key_points %}
-Key points to address:
-{% for point in key_points %}
-- {{ point }}
-{% endfor %}
-{% endif %}
-
-Write a clear, {{ tone }} response that addresses the main points.""",
-                inputs={
-                    "original_email": {
-                        "type": "string",
-                        "required": True
-                    },
-                    "tone": {
-                        "type": "string",
-                        "required": False,
-                        "default": "professional"
-                    },
-                    "key_points": {
-                        "type": "array<string>",
-                        "required": False
-                    }
-                },
-                metadata={"category": "communication", "tags": ["email", "business"]}
-            ),
-
-            TemplateSpec(
-                id="blog-post-generator",
-                version="1.0.0",
-                description="Generate blog post outlines and content",
-                template="""Create a blog post about: {{ topic }}
+    def _prewarm_caches(self):
+        """Serialize the template list and details up front so the UI's first page load is all cache hits."""
+        try:
+            templates, _, _ = self._get_template_list_cached()
+        except Exception:
+            return
+        for template_id in templates[:self._TEMPLATE_CACHE_SIZE]:
+            try:
+                self._get_template_cached(template_id)
+            except Exception:
+                # a broken template should surface on request, not abort startup
+                continue
+
+    def _add_static_routes(self, app: FastAPI, playground_dir: Path) -> None:
+        """Serve the built UI. Text assets are hashed and compressed once here; others stream from disk."""
+        root = playground_dir.resolve()
+        # relative path -> {content coding: (body, etag)}, identity included
+        static_variants: Dict[str, Dict[str, Tuple[bytes, str]]] = {}
+
+        for path in root.rglob("*"):
+            if path.suffix not in _STATIC_CONTENT_TYPES or not path.is_file():
+                continue
+            rel_path = path.relative_to(root).as_posix()
+            data = path.read_bytes()
+            etag = _etag(data)
+
+            # a strong ETag must differ per content coding
+            variants = {"identity": (data, etag)}
+            compressed = gzip.compress(data, compresslevel=9, mtime=0)
+            if len(compressed) < len(data):
+                variants["gzip"] = (compressed, f'{etag[:-1]}-gzip"')
+            if brotli is not None:
+                compressed = brotli.compress(data, quality=11)
+                if len(compressed) < len(data):
+                    variants["br"] = (compressed, f'{etag[:-1]}-br"')
+            static_variants[rel_path] = variants
+
+        @app.get("/static/{file_path:path}")
+        async def serve_static(file_path: str, request: Request):
+            """Serve static files with caching headers."""
+            headers = {"Cache-Control": "public, max-age=31536000, immutable"}
+            content_type = _STATIC_CONTENT_TYPES.get(Path(file_path).suffix, "application/octet-stream")
+
+            variants = static_variants.get(file_path)
+            if variants is not None:
+                accepted = _accepted_encodings(request)
+                coding = next((c for c in ("br", "gzip") if c in variants and c in accepted), "identity")
+                body, etag = variants[coding]
+                headers["ETag"] = etag
+                headers["Vary"] = "Accept-Encoding"
+                if coding != "identity":
+                    # GZipMiddleware leaves responses that already carry a Content-Encoding alone
+                    headers["Content-Encoding"] = coding
+                if _etag_matches(request, etag):
+                    return Response(status_code=304, headers=headers)
+                return Response(content=body, media_type=content_type, headers=headers)
+
+            static_file_path = root / file_path
+            if not static_file_path.is_file() or not static_file_path.resolve().is_relative_to(root):
+                raise HTTPException(status_code=404)
 
-Target audience: {{ audience }}
-Tone: {{ tone }}
-Length: {{ length }}
+            # binary assets are streamed by FileResponse; validate them by stat instead of hashing
+            st = static_file_path.stat()
+            etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+            headers["ETag"] = etag
+            if _etag_matches(request, etag):
+                return Response(status_code=304, headers=headers)
 
-Structure:
-1. Compelling headline
-2. Introduction hook
-3. Main content with {{ num_sections }} sections
-4. Conclusion with call-to-action
+            return FileResponse(static_file_path, media_type=content_type, headers=headers)
 
-{% if keywords %}
-Include these keywords naturally: {{ keywords | join(", ") }}
-{% endif %}
+        app.mount("/", StaticFiles(directory=str(playground_dir), html=True), name="playground")
 
-Focus on providing value and actionable insights.""",
-                inputs={
-                    "topic": {
-                        "type": "string",
-                        "required": True
-                    },
-                    "audience": {
-                        "type": "string",
-                        "required": False,
-                        "default": "developers"
-                    },
-                    "tone": {
-                        "type": "string",
-                        "required": False,
-                        "default": "informative"
-                    },
-                    "length": {
-                        "type": "string",
-                        "required": False,
-                        "default": "medium"
-                    },
-                    "num_sections": {
-                        "type": "number",
-                        "required": False,
-                        "default": 3
-                    },
-                    "keywords": {
-                        "type": "array<string>",
-                        "required": False
-                    }
-                },
-                metadata={"category": "content", "tags": ["blog", "writing", "marketing"]}
-            )
-        ]
-
-        return examples
+    def _get_example_templates(self) -> List[TemplateSpec]:
+        """Get example templates for playground showcase."""
+        return list(_EXAMPLE_TEMPLATES)
 
     def run(self, debug: bool = False):
         """Start the playground server."""
         print(f"🎯 Starting PromptLightning Playground at http://{self.host}:{self.port}")
         print(f"📁 Prompt directory: {self.vault.config.get('prompt_dir', 'N/A')}")
         print(f"📊 Logging: {'enabled' if self.vault.logger else 'disabled'}")
+        if debug and not YAML_C_AVAILABLE:
+            print("⚠️  PyYAML was built without libyaml; template writes use the slow pure-Python dumper")
         print("")
 
+        # single worker: template writes invalidate in-process caches that other workers could not see
         uvicorn.run(
             self.app,
             host=self.host,
             port=self.port,
             reload=debug,
             log_level="info" if debug else "warning",
-            workers=1
+            workers=1,
+            loop=_UVICORN_LOOP,
+            http=_UVICORN_HTTP
         )
 
 
+@dataclass
+class SessionRecord:
+    vault: Vault
+    session_dir: Path
+    last_access: float = 0.0
+
+
 class DemoPlaygroundServer(PlaygroundServer):
-    def __init__(self, host: str = "localhost", port: int = 3000):
+    # matches the session cookie max_age; older sessions can never be presented again
+    _SESSION_TTL = 3600
+    _MAX_SESSIONS = 1000
+    _SWEEP_INTERVAL = 256
+
+    def __init__(self, host: str = "localhost", port: int = 3000,
+                 ready_event: Optional[threading.Event] = None):
         self.host = host
         self.port = port
-        self.sessions: Dict[str, Vault] = {}
-        self.session_dirs: Dict[str, Path] = {}
-        self._session_cache_versions: Dict[str, int] = {}
+        self._ready_event = ready_event
+        self.sessions: OrderedDict[str, SessionRecord] = OrderedDict()
+        self._session_requests = 0
+        self._skeleton_dir = self._build_session_skeleton()
         self.app = self._create_demo_app()
 
-    def _get_session_cache_key(self, session_id: str) -> str:
-        """Generate cache key for session-specific caching."""
-        version = self._session_cache_versions.get(session_id, 0)
-        return f"{session_id}_{version}"
-
-    def _invalidate_session_cache(self, session_id: str):
-        """Invalidate cache for a specific session."""
-        self._session_cache_versions[session_id] = self._session_cache_versions.get(session_id, 0) + 1
+    def _invalidate_session_cache(self, session_id: str, template_id: Optional[str] = None):
+        """Invalidate a session's caches, for one template when an id is given."""
+        record = self.sessions.get(session_id)
+        if record:
+            record.vault.invalidate(template_id)
+
+    def _evict_session(self, session_id: str):
+        record = self.sessions.pop(session_id, None)
+        if record:
+            shutil.rmtree(record.session_dir, ignore_errors=True)
+
+    def _sweep_expired_sessions(self, now: float):
+        """Drop sessions idle past the cookie TTL; entries are in LRU order so stop at the first live one."""
+        cutoff = now - self._SESSION_TTL
+        while self.sessions:
+            session_id, record = next(iter(self.sessions.items()))
+            if record.last_access > cutoff:
+                break
+            self._evict_session(session_id)
+
+    def _build_session_skeleton(self) -> Path:
+        """Write the example templates once; new sessions copy this tree instead of re-serializing."""
+        # a fresh private directory, so nothing but these examples is ever copied into a session;
+        # removed on app shutdown, or when the server is garbage collected
+        skeleton_dir = Path(tempfile.mkdtemp(prefix="promptlightning-skeleton-"))
+        self._skeleton_cleanup = weakref.finalize(self, shutil.rmtree, skeleton_dir, True)
+        prompt_dir = skeleton_dir / "prompts"
+        prompt_dir.mkdir()
+
+        for example in _EXAMPLE_TEMPLATES:
+            yaml_content = _spec_to_dict(example)
+            # only ever read back by this server; JSON is valid YAML and far cheaper to emit
+            _atomic_write_bytes(prompt_dir / f"{example.id}.yaml", _json_bytes(yaml_content))
+
+        return skeleton_dir
+
+    def _remove_session_skeleton(self) -> None:
+        self._skeleton_cleanup()
 
     def _create_session_vault(self, session_id: str) -> Vault:
         session_dir = Path(tempfile.gettempdir()) / "promptlightning-demo" / session_id
         prompt_dir = session_dir / "prompts"
-        prompt_dir.mkdir(parents=True, exist_ok=True)
+
+        if not self._skeleton_dir.exists():
+            self._skeleton_cleanup()  # retire the old finalizer before registering a new one
+            self._skeleton_dir = self._build_session_skeleton()
+        shutil.copytree(self._skeleton_dir, session_dir, dirs_exist_ok=True)
 
         config_file = session_dir / "promptlightning.yaml"
         config = {
@@ -641,48 +1007,45 @@ class DemoPlaygroundServer(PlaygroundServer):
             "prompt_dir": str(prompt_dir),
             "logging": {"enabled": False}
         }
-        config_file.write_text(yaml.safe_dump(config, sort_keys=False))
+        _atomic_write_bytes(config_file, _json_bytes(config))
 
         vault = Vault(config_path=str(config_file))
-
-        for example in self._get_example_templates():
-            yaml_content = {
-                "id": example.id,
-                "version": example.version,
-                "description": example.description,
-                "template": example.template,
-                "inputs": {
-                    name: {
-                        "type": input_spec.type,
-                        "required": input_spec.required,
-                        "default": input_spec.default
-                    }
-                    for name, input_spec in example.inputs.items()
-                },
-                "metadata": example.metadata
-            }
-            file_path = prompt_dir / f"{example.id}.yaml"
-            file_path.write_text(yaml.safe_dump(yaml_content, sort_keys=False))
-
-        vault.invalidate_cache()
-        self.sessions[session_id] = vault
-        self.session_dirs[session_id] = session_dir
-        self._session_cache_versions[session_id] = 0
+        # load the copied examples now so the session's first template GETs hit the vault cache
+        for template_id in vault.list():
+            try:
+                vault.get(template_id)
+            except Exception:
+                continue
+        self.sessions[session_id] = SessionRecord(vault=vault, session_dir=session_dir, last_access=time.time())
+        while len(self.sessions) > self._MAX_SESSIONS:
+            self._evict_session(next(iter(self.sessions)))
         return vault
 
     def _get_or_create_session(self, session_id: Optional[str]) -> tuple[str, Vault]:
-        if not session_id or session_id not in self.sessions:
+        now = time.time()
+        self._session_requests += 1
+        if self._session_requests % self._SWEEP_INTERVAL == 0:
+            self._sweep_expired_sessions(now)
+
+        record = self.sessions.get(session_id) if session_id else None
+        if record is None or now - record.last_access > self._SESSION_TTL:
+            if record is not None:
+                self._evict_session(session_id)
             session_id = str(uuid.uuid4())
             vault = self._create_session_vault(session_id)
         else:
-            vault = self.sessions[session_id]
+            self.sessions.move_to_end(session_id)
+            record.last_access = now
+            vault = record.vault
         return session_id, vault
 
     def _create_demo_app(self) -> FastAPI:
         app = FastAPI(
             title="PromptLightning Playground - Demo Mode",
             description="Interactive playground with session isolation",
-            version="0.1.0"
+            version="0.1.0",
+            default_response_class=FastJSONResponse,
+            lifespan=_ready_lifespan(self._ready_event, self._remove_session_skeleton)
         )
 
         app.add_middleware(
@@ -693,7 +1056,7 @@ class DemoPlaygroundServer(PlaygroundServer):
             allow_headers=["*"],
         )
 
-        app.add_middleware(GZipMiddleware, minimum_size=1000)
+        app.add_middleware(GZipMiddleware, minimum_size=1000, compresslevel=1)
 
         @app.middleware("http")
         async def session_middleware(request: Request, call_next):
@@ -708,37 +1071,20 @@ class DemoPlaygroundServer(PlaygroundServer):
         @app.get("/api/templates", response_model=List[str])
         async def list_templates(request: Request):
             try:
-                templates = list(request.state.vault.list())
-                return Response(
-                    content=json.dumps(templates),
-                    media_type="application/json",
-                    headers={"Cache-Control": "public, max-age=60"}
-                )
+                templates = await asyncio.to_thread(request.state.vault.list)
+                body = _json_bytes(templates)
+                return _conditional_response(request, body, _etag(body), "public, max-age=60")
             except Exception as e:
                 raise HTTPException(status_code=500, detail=str(e))
 
         @app.get("/api/templates/{template_id}", response_model=TemplateResponse)
         async def get_template(template_id: str, request: Request):
             try:
-                template = request.state.vault.get(template_id)
+                template = await asyncio.to_thread(request.state.vault.get, template_id)
                 spec = template.spec
-                response_data = TemplateResponse(
-                    id=spec.id,
-                    version=spec.version,
-                    description=spec.description,
-                    template=spec.template,
-                    inputs={name: {
-                        "type": input_spec.type,
-                        "required": input_spec.required,
-                        "default": input_spec.default
-                    } for name, input_spec in spec.inputs.items()},
-                    metadata=spec.metadata
-                )
-                return Response(
-                    content=response_data.model_dump_json(),
-                    media_type="application/json",
-                    headers={"Cache-Control": "public, max-age=300"}
-                )
+                response_data = TemplateResponse.from_spec(spec)
+                body = _TEMPLATE_RESPONSE_ADAPTER.dump_json(response_data)
+                return _conditional_response(request, body, _etag(body), "public, max-age=300")
             except TemplateNotFound:
                 raise HTTPException(status_code=404, detail=f"Template '{template_id}' not found")
             except Exception as e:
@@ -750,19 +1096,10 @@ class DemoPlaygroundServer(PlaygroundServer):
                 if not req.id or req.id.strip() == "":
                     raise HTTPException(status_code=422, detail="Template ID cannot be empty")
 
-                try:
-                    request.state.vault.get(req.id)
+                if await asyncio.to_thread(request.state.vault.exists, req.id):
                     raise HTTPException(status_code=400, detail=f"Template '{req.id}' already exists")
-                except TemplateNotFound:
-                    pass
 
-                inputs_dict = {}
-                for input_name, input_data in req.inputs.items():
-                    inputs_dict[input_name] = InputSpec(
-                        type=input_data.get("type", "string"),
-                        required=input_data.get("required", True),
-                        default=input_data.get("default")
-                    )
+                inputs_dict = _inputs_from_request(req.inputs)
 
                 spec = TemplateSpec(
                     id=req.id,
@@ -776,38 +1113,12 @@ class DemoPlaygroundServer(PlaygroundServer):
                 prompt_dir = Path(request.state.vault.config["prompt_dir"])
                 file_path = prompt_dir / f"{spec.id}.yaml"
 
-                yaml_content = {
-                    "id": spec.id,
-                    "version": spec.version,
-                    "description": spec.description,
-                    "template": spec.template,
-                    "inputs": {
-                        name: {
-                            "type": input_spec.type,
-                            "required": input_spec.required,
-                            "default": input_spec.default
-                        }
-                        for name, input_spec in spec.inputs.items()
-                    },
-                    "metadata": spec.metadata
-                }
-
-                file_path.write_text(yaml.safe_dump(yaml_content, sort_keys=False))
-                request.state.vault.invalidate_cache()
-                self._invalidate_session_cache(request.state.session_id)
-
-                return TemplateResponse(
-                    id=spec.id,
-                    version=spec.version,
-                    description=spec.description,
-                    template=spec.template,
-                    inputs={name: {
-                        "type": input_spec.type,
-                        "required": input_spec.required,
-                        "default": input_spec.default
-                    } for name, input_spec in spec.inputs.items()},
-                    metadata=spec.metadata
-                )
+                yaml_content = _spec_to_dict(spec)
+
+                await asyncio.to_thread(_write_template_yaml, file_path, yaml_content)
+                self._invalidate_session_cache(request.state.session_id, spec.id)
+
+                return Response(content=_json_bytes(yaml_content), media_type="application/json")
 
             except HTTPException:
                 raise
@@ -820,7 +1131,7 @@ class DemoPlaygroundServer(PlaygroundServer):
         async def update_template(template_id: str, req: UpdateTemplateRequest, request: Request):
             try:
                 try:
-                    current_template = request.state.vault.get(template_id)
+                    current_template = await asyncio.to_thread(request.state.vault.get, template_id)
                     current_spec = current_template.spec
                 except TemplateNotFound:
                     raise HTTPException(status_code=404, detail=f"Template '{template_id}' not found")
@@ -829,14 +1140,8 @@ class DemoPlaygroundServer(PlaygroundServer):
                 updated_description = req.description if req.description is not None else current_spec.description
                 updated_template = req.template if req.template is not None else current_spec.template
 
-                updated_inputs_dict = {}
                 if req.inputs is not None:
-                    for input_name, input_data in req.inputs.items():
-                        updated_inputs_dict[input_name] = InputSpec(
-                            type=input_data.get("type", "string"),
-                            required=input_data.get("required", True),
-                            default=input_data.get("default")
-                        )
+                    updated_inputs_dict = _inputs_from_request(req.inputs)
                 else:
                     updated_inputs_dict = current_spec.inputs
 
@@ -854,38 +1159,12 @@ class DemoPlaygroundServer(PlaygroundServer):
                 prompt_dir = Path(request.state.vault.config["prompt_dir"])
                 file_path = prompt_dir / f"{updated_spec.id}.yaml"
 
-                yaml_content = {
-                    "id": updated_spec.id,
-                    "version": updated_spec.version,
-                    "description": updated_spec.description,
-                    "template": updated_spec.template,
-                    "inputs": {
-                        name: {
-                            "type": input_spec.type,
-                            "required": input_spec.required,
-                            "default": input_spec.default
-                        }
-                        for name, input_spec in updated_spec.inputs.items()
-                    },
-                    "metadata": updated_spec.metadata
-                }
-
-                file_path.write_text(yaml.safe_dump(yaml_content, sort_keys=False))
-                request.state.vault.invalidate_cache()
-                self._invalidate_session_cache(request.state.session_id)
-
-                return TemplateResponse(
-                    id=updated_spec.id,
-                    version=updated_spec.version,
-                    description=updated_spec.description,
-                    template=updated_spec.template,
-                    inputs={name: {
-                        "type": input_spec.type,
-                        "required": input_spec.required,
-                        "default": input_spec.default
-                    } for name, input_spec in updated_spec.inputs.items()},
-                    metadata=updated_spec.metadata
-                )
+                yaml_content = _spec_to_dict(updated_spec)
+
+                await asyncio.to_thread(_write_template_yaml, file_path, yaml_content)
+                self._invalidate_session_cache(request.state.session_id, updated_spec.id)
+
+                return Response(content=_json_bytes(yaml_content), media_type="application/json")
 
             except HTTPException:
                 raise
@@ -897,14 +1176,8 @@ class DemoPlaygroundServer(PlaygroundServer):
         @app.post("/api/templates/{template_id}/render", response_model=RenderResponse)
         async def render_template(template_id: str, req: RenderRequest, request: Request):
             try:
-                template = request.state.vault.get(template_id)
-                rendered = template.render(**req.inputs)
-                inputs_used = template.spec.coerce_inputs(req.inputs)
-
-                return RenderResponse(
-                    rendered=rendered,
-                    inputs_used=inputs_used
-                )
+                body = await asyncio.to_thread(_render_with_inputs, request.state.vault, template_id, req.inputs)
+                return Response(content=body, media_type="application/json")
             except TemplateNotFound:
                 raise HTTPException(status_code=404, detail=f"Template '{template_id}' not found")
             except ValidationError as e:
@@ -915,35 +1188,16 @@ class DemoPlaygroundServer(PlaygroundServer):
                 raise HTTPException(status_code=500, detail=str(e))
 
         @app.get("/api/examples", response_model=List[TemplateResponse])
-        async def get_example_templates():
-            examples = self._get_example_templates()
-            response_data = [
-                TemplateResponse(
-                    id=spec.id,
-                    version=spec.version,
-                    description=spec.description,
-                    template=spec.template,
-                    inputs={name: {
-                        "type": input_spec.type,
-                        "required": input_spec.required,
-                        "default": input_spec.default
-                    } for name, input_spec in spec.inputs.items()},
-                    metadata=spec.metadata
-                )
-                for spec in examples
-            ]
-            return Response(
-                content=json.dumps([r.model_dump() for r in response_data]),
-                media_type="application/json",
-                headers={"Cache-Control": "public, max-age=3600"}
-            )
+        async def get_example_templates(request: Request):
+            body, etag = _EXAMPLES_BODY, _EXAMPLES_ETAG
+            return _conditional_response(request, body, etag, "public, max-age=3600")
 
         @app.get("/api/health")
         async def health_check(request: Request):
             try:
-                template_count = len(list(request.state.vault.list()))
+                template_count = await asyncio.to_thread(request.state.vault.count)
                 return Response(
-                    content=json.dumps({
+                    content=_json_bytes({
                         "status": "healthy",
                         "demo_mode": True,
                         "session_id": request.state.session_id,
@@ -958,86 +1212,11 @@ class DemoPlaygroundServer(PlaygroundServer):
         playground_dir = Path(__file__).parent.parent / "playground"
 
         if (playground_dir / "index.html").exists():
-            @app.get("/static/{file_path:path}")
-            async def serve_static(file_path: str):
-                """Serve static files with caching headers."""
-                static_file_path = playground_dir / file_path
-                if static_file_path.exists() and static_file_path.is_file():
-                    content = static_file_path.read_bytes()
-
-                    etag = hashlib.md5(content).hexdigest()
-
-                    content_type = "application/octet-stream"
-                    if file_path.endswith('.js'):
-                        content_type = "application/javascript"
-                    elif file_path.endswith('.css'):
-                        content_type = "text/css"
-                    elif file_path.endswith('.html'):
-                        content_type = "text/html"
-                    elif file_path.endswith('.json'):
-                        content_type = "application/json"
-
-                    return Response(
-                        content=content,
-                        media_type=content_type,
-                        headers={
-                            "Cache-Control": "public, max-age=31536000, immutable",
-                            "ETag": etag
-                        }
-                    )
-                raise HTTPException(status_code=404)
-
-            app.mount("/", StaticFiles(directory=str(playground_dir), html=True), name="playground")
+            self._add_static_routes(app, playground_dir)
         else:
             @app.get("/", response_class=HTMLResponse)
-            async def playground_ui():
-                return """
-                <!DOCTYPE html>
-                <html>
-                <head>
-                    <title>PromptLightning Playground - Demo Mode</title>
-                    <meta charset="utf-8">
-                    <meta name="viewport" content="width=device-width, initial-scale=1">
-                    <style>
-                        body {
-                            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                            margin: 0; padding: 20px; background: #f5f5f5;
-                        }
-                        .container { max-width: 1200px; margin: 0 auto; }
-                        .header { background: white; padding: 20px; border-radius: 8px; margin-bottom: 20px; }
-                        .content { background: white; padding: 20px; border-radius: 8px; }
-                        .api-info { background: #e3f2fd; padding: 15px; border-radius: 4px; margin-top: 20px; }
-                        .demo-badge { background: #4caf50; color: white; padding: 4px 8px; border-radius: 4px; font-size: 0.8em; }
-                        code { background: #f5f5f5; padding: 2px 4px; border-radius: 3px; }
-                    </style>
-                </head>
-                <body>
-                    <div class="container">
-                        <div class="header">
-                            <h1>PromptLightning Playground <span class="demo-badge">DEMO MODE</span></h1>
-                            <p>Interactive playground with session isolation - your data is private!</p>
-                        </div>
-                        <div class="content">
-                            <h2>API Endpoints</h2>
-                            <ul>
-                                <li><code>GET /api/templates</code> - List all templates</li>
-                                <li><code>GET /api/templates/{id}</code> - Get template details</li>
-                                <li><code>POST /api/templates/{id}/render</code> - Render template</li>
-                                <li><code>GET /api/examples</code> - Get example templates</li>
-                                <li><code>GET /api/health</code> - Health check</li>
-                            </ul>
-
-                            <div class="api-info">
-                                <strong>API Testing</strong><br>
-                                Try these endpoints: <a href="/api/templates">/api/templates</a> |
-                                <a href="/api/examples">/api/examples</a> |
-                                <a href="/api/health">/api/health</a>
-                            </div>
-                        </div>
-                    </div>
-                </body>
-                </html>
-                """
+            async def playground_ui(request: Request):
+                return _conditional_response(request, _DEMO_FALLBACK_HTML, _DEMO_FALLBACK_HTML_ETAG, "public, max-age=300", "text/html")
 
         return app
 
@@ -1048,20 +1227,24 @@ class DemoPlaygroundServer(PlaygroundServer):
         print(f"📁 Temporary sessions stored in /tmp/promptlightning-demo/")
         print("")
 
+        # single worker: sessions live in this process's memory
         uvicorn.run(
             self.app,
             host=self.host,
             port=self.port,
             reload=debug,
             log_level="info" if debug else "warning",
-            workers=1
+            workers=1,
+            loop=_UVICORN_LOOP,
+            http=_UVICORN_HTTP
         )
 
 
 def create_playground(config_path: str = None, prompt_dir: str = None,
-                     host: str = "localhost", port: int = 3000, demo_mode: bool = False) -> PlaygroundServer:
-    """Create a playground server instance."""
+                     host: str = "localhost", port: int = 3000, demo_mode: bool = False,
+                     ready_event: Optional[threading.Event] = None) -> PlaygroundServer:
+    """Create a playground server instance; ready_event, if given, is set once it has started."""
     if demo_mode:
-        return DemoPlaygroundServer(host=host, port=port)
+        return DemoPlaygroundServer(host=host, port=port, ready_event=ready_event)
     vault = Vault(config_path=config_path, prompt_dir=prompt_dir)
-    return PlaygroundServer(vault, host=host, port=port)
+    return PlaygroundServer(vault, host=host, port=port, ready_event=ready_event)
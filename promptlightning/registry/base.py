@@ -1,10 +1,24 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Iterable
+from typing import Dict, Iterable
 from ..model import TemplateSpec
+from ..exceptions import TemplateNotFound
 
 class Registry(ABC):
+    # backends that are safe to read from several threads at once set this,
+    # letting Vault skip its registry lock on loads
+    concurrent_reads: bool = False
     @abstractmethod
     def list_ids(self) -> Iterable[str]: ...
     @abstractmethod
-    def load(self, template_id: str) -> TemplateSpec: ...
\ No newline at end of file
+    def load(self, template_id: str) -> TemplateSpec: ...
+    def count(self) -> int:
+        return sum(1 for _ in self.list_ids())
+    def exists(self, template_id: str) -> bool:
+        try:
+            self.load(template_id)
+        except TemplateNotFound:
+            return False
+        return True
+    def load_many(self, template_ids: Iterable[str]) -> Dict[str, TemplateSpec]:
+        return {tid: self.load(tid) for tid in template_ids}
@@ -1,5 +1,6 @@
 from __future__ import annotations
-from typing import Iterable
+from typing import Dict, Iterable, Iterator, List, Tuple
+from contextlib import contextmanager
 from pathlib import Path
 import time
 import lmdb
@@ -9,9 +10,16 @@ from ..exceptions import TemplateNotFound, RegistryError
 from .base import Registry
 
 class LMDBRegistry(Registry):
-    def __init__(self, db_path: str | Path, map_size: int = 100 * 1024 * 1024) -> None:
+    concurrent_reads = True
+
+    def __init__(self, db_path: str | Path, map_size: int = 100 * 1024 * 1024, durable: bool = True,
+                 readahead: bool = True) -> None:
         self.db_path = Path(db_path).resolve()
         self.map_size = map_size
+        # durable=False skips the fsync on every commit; call sync() once the batch is written
+        self.durable = durable
+        # readahead=False (MDB_NORDAHEAD) suits random lookups on a DB larger than RAM
+        self.readahead = readahead
         self._env = None
         self._templates_db = None
         self._metadata_db = None
@@ -31,9 +39,9 @@ class LMDBRegistry(Registry):
                 max_dbs=10,
                 writemap=True,
                 metasync=False,
-                sync=True,
-                map_async=False,
-                readahead=True,
+                sync=self.durable,
+                map_async=not self.durable,
+                readahead=self.readahead,
                 meminit=False,
                 lock=True
             )
@@ -45,28 +53,67 @@ class LMDBRegistry(Registry):
         except lmdb.Error as e:
             raise RegistryError(f"Failed to initialize LMDB: {e}")
 
-    def list_ids(self) -> Iterable[str]:
+    def _pack(self, spec: TemplateSpec) -> bytes:
+        # always from the spec's current content: specs are mutable, so nothing keyed on
+        # id/version or object identity can say whether these bytes are still right
+        return msgpack.packb(spec.model_dump(), use_bin_type=True)
+
+    def list_ids(self) -> List[str]:
         self._ensure_initialized()
         try:
             with self._env.begin(db=self._templates_db, write=False) as txn:
-                cursor = txn.cursor()
-                for key in cursor.iternext(keys=True, values=False):
-                    yield key.decode('utf-8')
+                keys = list(txn.cursor().iternext(keys=True, values=False))
+            return [key.decode('utf-8') for key in keys]
         except lmdb.Error as e:
             raise RegistryError(f"Failed to list template IDs: {e}")
 
-    def load(self, template_id: str) -> TemplateSpec:
+    def count(self) -> int:
+        self._ensure_initialized()
+        try:
+            with self._env.begin(db=self._templates_db, write=False) as txn:
+                return txn.stat(self._templates_db)["entries"]
+        except lmdb.Error as e:
+            raise RegistryError(f"Failed to count templates: {e}")
+
+    def exists(self, template_id: str) -> bool:
         self._ensure_initialized()
         try:
             with self._env.begin(db=self._templates_db, write=False) as txn:
+                return txn.get(template_id.encode('utf-8')) is not None
+        except lmdb.Error as e:
+            raise RegistryError(f"LMDB error checking template '{template_id}': {e}")
+
+    @staticmethod
+    def _spec_from_value(value: bytes | memoryview) -> TemplateSpec:
+        data = msgpack.unpackb(value, raw=False, strict_map_key=False)
+        # pydantic-core validates this dict faster than model_construct can rebuild
+        # the nested InputSpecs in Python, and faster than copying a cached spec,
+        # so every load decodes and validates afresh
+        return TemplateSpec.model_validate(data)
+
+    @contextmanager
+    def reader(self) -> Iterator["LMDBReader"]:
+        """Share one read transaction across a burst of lookups."""
+        self._ensure_initialized()
+        try:
+            with self._env.begin(write=False, buffers=True) as txn:
+                yield LMDBReader(self, txn)
+        except lmdb.Error as e:
+            raise RegistryError(f"LMDB read transaction failed: {e}")
+
+    def load(self, template_id: str) -> TemplateSpec:
+        self._ensure_initialized()
+        try:
+            # buffers=True hands back a view into the mmap instead of a bytes copy; it is
+            # only valid until the txn ends, so decode before leaving the block
+            with self._env.begin(db=self._templates_db, write=False, buffers=True) as txn:
                 key = template_id.encode('utf-8')
                 value = txn.get(key)
 
                 if value is None:
                     raise TemplateNotFound(template_id)
 
-                data = msgpack.unpackb(value, raw=False, strict_map_key=False)
-                return TemplateSpec.model_validate(data)
+                return self._spec_from_value(value)
 
         except TemplateNotFound:
             raise
@@ -75,35 +122,73 @@ class LMDBRegistry(Registry):
         except Exception as e:
             raise RegistryError(f"Failed to load template '{template_id}': {e}")
 
+    def load_many(self, template_ids: Iterable[str]) -> Dict[str, TemplateSpec]:
+        """Load several templates inside one read transaction."""
+        with self.reader() as reader:
+            return {tid: reader.load(tid) for tid in template_ids}
+
+    def _put_if_changed(self, txn: lmdb.Transaction, template_key: bytes, version_key: bytes, packed: bytes) -> bool:
+        """Write a packed spec unless identical bytes are already stored; returns whether anything was written."""
+        if (txn.get(template_key, db=self._templates_db) == packed
+                and txn.get(version_key, db=self._version_index_db) == template_key):
+            return False
+        txn.put(template_key, packed, db=self._templates_db)
+        txn.put(version_key, template_key, db=self._version_index_db)
+        return True
+
     def save(self, spec: TemplateSpec) -> None:
         self._ensure_initialized()
         try:
-            data = spec.model_dump()
-            packed = msgpack.packb(data, use_bin_type=True)
+            packed = self._pack(spec)
             template_key = spec.id.encode('utf-8')
             version_key = f"{spec.id}:{spec.version}".encode('utf-8')
 
             with self._env.begin(write=True) as txn:
-                txn.put(template_key, packed, db=self._templates_db)
-                txn.put(version_key, template_key, db=self._version_index_db)
-
-                count_key = b"count"
-                current_count = txn.get(count_key, db=self._metadata_db)
-                if current_count is None:
-                    new_count = 1
-                else:
-                    new_count = msgpack.unpackb(current_count, raw=False) + 1
-                txn.put(count_key, msgpack.packb(new_count), db=self._metadata_db)
-
-                timestamp_key = b"last_modified"
-                timestamp = int(time.time())
-                txn.put(timestamp_key, msgpack.packb(timestamp), db=self._metadata_db)
+                # an unchanged re-save dirties no pages, so the commit writes nothing to disk
+                if self._put_if_changed(txn, template_key, version_key, packed):
+                    timestamp_key = b"last_modified"
+                    timestamp = int(time.time())
+                    txn.put(timestamp_key, msgpack.packb(timestamp), db=self._metadata_db)
 
         except lmdb.Error as e:
             raise RegistryError(f"LMDB error saving template '{spec.id}': {e}")
         except Exception as e:
             raise RegistryError(f"Failed to save template '{spec.id}': {e}")
 
+    def save_many(self, specs: Iterable[TemplateSpec]) -> int:
+        """Save several templates in one write transaction (one commit instead of one per template)."""
+        self._ensure_initialized()
+        entries: List[Tuple[bytes, bytes, bytes]] = []
+        for spec in specs:
+            try:
+                packed = self._pack(spec)
+            except Exception as e:
+                raise RegistryError(f"Failed to save template '{spec.id}': {e}")
+            template_key = spec.id.encode('utf-8')
+            version_key = f"{spec.id}:{spec.version}".encode('utf-8')
+            entries.append((template_key, version_key, packed))
+
+        if not entries:
+            return 0
+
+        try:
+            with self._env.begin(write=True) as txn:
+                changed = False
+                for template_key, version_key, packed in entries:
+                    changed |= self._put_if_changed(txn, template_key, version_key, packed)
+
+                if changed:
+                    timestamp_key = b"last_modified"
+                    timestamp = int(time.time())
+                    txn.put(timestamp_key, msgpack.packb(timestamp), db=self._metadata_db)
+
+        except lmdb.Error as e:
+            raise RegistryError(f"LMDB error saving {len(entries)} templates: {e}")
+        except Exception as e:
+            raise RegistryError(f"Failed to save {len(entries)} templates: {e}")
+
+        return len(entries)
+
     def delete(self, template_id: str) -> None:
         self._ensure_initialized()
         try:
@@ -121,12 +206,6 @@ class LMDBRegistry(Registry):
                 txn.delete(template_key, db=self._templates_db)
                 txn.delete(version_key, db=self._version_index_db)
 
-                count_key = b"count"
-                current_count = txn.get(count_key, db=self._metadata_db)
-                if current_count is not None:
-                    new_count = max(0, msgpack.unpackb(current_count, raw=False) - 1)
-                    txn.put(count_key, msgpack.packb(new_count), db=self._metadata_db)
-
                 timestamp_key = b"last_modified"
                 timestamp = int(time.time())
                 txn.put(timestamp_key, msgpack.packb(timestamp), db=self._metadata_db)
@@ -161,16 +240,38 @@ class LMDBRegistry(Registry):
         self._ensure_initialized()
         try:
             with self._env.begin(db=self._metadata_db, write=False) as txn:
-                count_val = txn.get(b"count")
+                # the B-tree already tracks its entry count; no counter to maintain on writes
+                count = txn.stat(self._templates_db)["entries"]
                 timestamp_val = txn.get(b"last_modified")
 
                 return {
-                    "count": msgpack.unpackb(count_val, raw=False) if count_val else 0,
+                    "count": count,
                     "last_modified": msgpack.unpackb(timestamp_val, raw=False) if timestamp_val else None
                 }
         except lmdb.Error as e:
             raise RegistryError(f"Failed to get metadata: {e}")
 
+    def sync(self) -> None:
+        """Flush committed writes to disk; needed after non-durable bulk writes."""
+        if self._env is not None:
+            try:
+                self._env.sync(True)
+            except lmdb.Error as e:
+                raise RegistryError(f"Failed to sync LMDB: {e}")
+
+    def warm(self) -> int:
+        """Read every stored template once, in key order, so the pages are mapped in
+        before random lookups need them; returns the number of value bytes read."""
+        self._ensure_initialized()
+        total = 0
+        try:
+            with self._env.begin(db=self._templates_db, write=False, buffers=True) as txn:
+                for _, value in txn.cursor():
+                    total += len(bytes(value))
+        except lmdb.Error as e:
+            raise RegistryError(f"Failed to warm LMDB: {e}")
+        return total
+
     def close(self) -> None:
         if self._env is not None:
             self._env.close()
@@ -188,3 +289,27 @@ class LMDBRegistry(Registry):
 
     def __del__(self):
         self.close()
+
+
+class LMDBReader:
+    """Read-only registry view bound to a single LMDB transaction; see LMDBRegistry.reader()."""
+
+    def __init__(self, registry: LMDBRegistry, txn: lmdb.Transaction) -> None:
+        self._registry = registry
+        self._txn = txn
+
+    def list_ids(self) -> List[str]:
+        cursor = self._txn.cursor(db=self._registry._templates_db)
+        return [bytes(key).decode('utf-8') for key in cursor.iternext(keys=True, values=False)]
+
+    def exists(self, template_id: str) -> bool:
+        return self._txn.get(template_id.encode('utf-8'), db=self._registry._templates_db) is not None
+
+    def load(self, template_id: str) -> TemplateSpec:
+        value = self._txn.get(template_id.encode('utf-8'), db=self._registry._templates_db)
+        if value is None:
+            raise TemplateNotFound(template_id)
+        try:
+            return self._registry._spec_from_value(value)
+        except Exception as e:
+            raise RegistryError(f"Failed to load template '{template_id}': {e}")
@@ -1,32 +1,175 @@
 from __future__ import annotations
 from typing import Iterable
 from pathlib import Path
-import yaml
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+import os
+import threading
+from .._yaml import safe_load
 from ..model import TemplateSpec
 from ..exceptions import TemplateNotFound
+from .base import Registry
+
+
+def _read_yaml(path: Path) -> dict:
+    # raw bytes let libyaml decode UTF-8 itself instead of going through str
+    return safe_load(path.read_bytes()) or {}
+
+
+# process-wide stat key -> spec, shared by every LocalRegistry so repeated
+# registries over the same prompt dir don't re-parse unchanged files
+_SPEC_CACHE: OrderedDict[tuple, TemplateSpec] = OrderedDict()
+_SPEC_CACHE_SIZE = 4096
+_spec_cache_lock = threading.Lock()
+_spec_cache_stats = {"hits": 0, "misses": 0}
+
+
+def _stat_key(path: Path, st: os.stat_result) -> tuple:
+    # inode and ctime catch an atomic replace or a same-size rewrite within the
+    # mtime granularity, which (mtime, size) alone would miss
+    return (path, st.st_mtime_ns, st.st_size, st.st_ino, st.st_ctime_ns)
+
+
+def _cache_spec(key: tuple, spec: TemplateSpec) -> None:
+    with _spec_cache_lock:
+        _SPEC_CACHE[key] = spec
+        if len(_SPEC_CACHE) > _SPEC_CACHE_SIZE:
+            _SPEC_CACHE.popitem(last=False)
+
+
+def spec_cache_info() -> dict:
+    """Hit/miss counters and size of the shared parsed-spec cache."""
+    with _spec_cache_lock:
+        return {**_spec_cache_stats, "size": len(_SPEC_CACHE)}
+
+
+class LocalRegistry(Registry):
+    # file pattern and parser; subclasses can point the registry at another format
+    _PATTERN = "*.y*ml"
+    _read = staticmethod(_read_yaml)
 
-class LocalRegistry:
     def __init__(self, prompt_dir: str | Path) -> None:
         self.root = Path(prompt_dir).resolve()
         if not self.root.exists():
             raise FileNotFoundError(f"prompt_dir not found: {self.root}")
+        # path -> (stat key, id) for every YAML file seen by the last scan
+        self._files: dict[Path, tuple[tuple, object]] = {}
+        self._id_index: dict[str, Path] = {}
 
-    def list_ids(self) -> Iterable[str]:
-        for p in self.root.rglob("*.y*ml"):
+    def _scan(self) -> Iterable[tuple[Path, os.stat_result]]:
+        """Yield (path, stat) for matching files, using DirEntry's cached file type
+        instead of a separate stat per entry to tell files from directories."""
+        stack = [str(self.root)]
+        while stack:
+            top = stack.pop()
+            subdirs = []
             try:
-                data = yaml.safe_load(p.read_text(encoding="utf-8")) or {}
-                tid = data.get("id")
-                if tid:
-                    yield tid
-            except Exception:
+                with os.scandir(top) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                subdirs.append(entry.path)
+                            elif fnmatchcase(entry.name, self._PATTERN) and entry.is_file():
+                                yield Path(entry.path), entry.stat()
+                        except OSError:
+                            continue
+            except OSError:
                 continue
+            stack.extend(reversed(sorted(subdirs)))
+
+    def _refresh(self) -> None:
+        """Re-scan the tree, parsing only files that are new or modified since the last scan."""
+        files: dict[Path, tuple[tuple, object]] = {}
+        id_index: dict[str, Path] = {}
+        for p, st in self._scan():
+            key = _stat_key(p, st)
+            cached = self._files.get(p)
+            if cached is not None and cached[0] == key:
+                tid = cached[1]
+            else:
+                tid = self._parse_id(p, key)
+            files[p] = (key, tid)
+            # first file in scan order wins, as with a linear search
+            if tid and isinstance(tid, str) and tid not in id_index:
+                id_index[tid] = p
+        self._files = files
+        self._id_index = id_index
+
+    def _parse_id(self, path: Path, key: tuple) -> object:
+        """Template id of a new or changed file. The parsed spec goes into the shared
+        cache, so the load that usually follows doesn't read the file a second time."""
+        with _spec_cache_lock:
+            spec = _SPEC_CACHE.get(key)
+        if spec is not None:
+            return spec.id
+        try:
+            data = self._read(path)
+        except Exception:
+            return None
+        if not isinstance(data, dict):  # a list or scalar document isn't a template
+            return None
+        try:
+            _cache_spec(key, TemplateSpec.model_validate(data))
+        except Exception:
+            # invalid spec: still indexed by id, so load() reports it the usual way
+            pass
+        return data.get("id")
+
+    def _load_path(self, path: Path, template_id: str) -> TemplateSpec | None:
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        key = _stat_key(path, st)
+        with _spec_cache_lock:
+            spec = _SPEC_CACHE.get(key)
+            if spec is not None:
+                _SPEC_CACHE.move_to_end(key)
+                _spec_cache_stats["hits"] += 1
+            else:
+                _spec_cache_stats["misses"] += 1
+        if spec is not None:
+            # the cached spec is shared across registries; callers get their own copy
+            return spec.model_copy(deep=True) if spec.id == template_id else None
+        try:
+            data = self._read(path)
+            if data.get("id") != template_id:
+                return None
+            spec = TemplateSpec.model_validate(data)
+        except Exception:
+            return None
+        _cache_spec(key, spec)
+        return spec.model_copy(deep=True)
+
+    def list_ids(self) -> Iterable[str]:
+        self._refresh()
+        for _, tid in self._files.values():
+            if tid:
+                yield tid
+
+    def count(self) -> int:
+        self._refresh()
+        return sum(1 for _, tid in self._files.values() if tid)
+
+    def exists(self, template_id: str) -> bool:
+        path = self._id_index.get(template_id)
+        if path is not None and path.is_file():
+            return True
+        self._refresh()
+        return template_id in self._id_index
 
     def load(self, template_id: str) -> TemplateSpec:
-        for p in self.root.rglob("*.y*ml"):
-            try:
-                data = yaml.safe_load(p.read_text(encoding="utf-8")) or {}
-                if data.get("id") == template_id:
-                    return TemplateSpec.model_validate(data)
-            except Exception:
-                continue
-        raise TemplateNotFound(template_id)
\ No newline at end of file
+        path = self._id_index.get(template_id)
+        if path is not None:
+            spec = self._load_path(path, template_id)
+            if spec is not None:
+                return spec
+
+        # unknown id, or the indexed file moved or changed: rescan once
+        self._refresh()
+        path = self._id_index.get(template_id)
+        if path is not None:
+            spec = self._load_path(path, template_id)
+            if spec is not None:
+                return spec
+        raise TemplateNotFound(template_id)
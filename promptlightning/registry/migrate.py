@@ -1,4 +1,6 @@
 from __future__ import annotations
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 from .local import LocalRegistry
@@ -10,7 +12,8 @@ def migrate_local_to_lmdb(
     db_path: str | Path,
     map_size: int = 100 * 1024 * 1024,
     overwrite: bool = False,
-    verbose: bool = True
+    verbose: bool = True,
+    durable: bool = False
 ) -> dict:
     prompt_dir = Path(prompt_dir)
     db_path = Path(db_path)
@@ -26,7 +29,7 @@ def migrate_local_to_lmdb(
 
     try:
         local_registry = LocalRegistry(prompt_dir=prompt_dir)
-        lmdb_registry = LMDBRegistry(db_path=db_path, map_size=map_size)
+        lmdb_registry = LMDBRegistry(db_path=db_path, map_size=map_size, durable=durable)
 
         migrated_count = 0
         failed_count = 0
@@ -35,19 +38,34 @@ def migrate_local_to_lmdb(
         if verbose:
             print(f"Migrating templates from {prompt_dir} to {db_path}")
 
-        for template_id in local_registry.list_ids():
-            try:
-                template = local_registry.load(template_id)
-                lmdb_registry.save(template)
-                migrated_count += 1
-                if verbose:
-                    print(f"  ✓ Migrated: {template_id}")
-            except Exception as e:
-                failed_count += 1
-                failed_ids.append(template_id)
-                if verbose:
-                    print(f"  ✗ Failed: {template_id} - {e}")
-
+        # overlap file reads and parsing across threads; results are consumed in id order
+        template_ids = list(local_registry.list_ids())
+        templates = []
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = [executor.submit(local_registry.load, template_id) for template_id in template_ids]
+            for template_id, future in zip(template_ids, futures):
+                try:
+                    templates.append(future.result())
+                except Exception as e:
+                    failed_count += 1
+                    failed_ids.append(template_id)
+                    if verbose:
+                        print(f"  ✗ Failed: {template_id} - {e}")
+
+        # one write transaction for the whole batch
+        try:
+            migrated_count = lmdb_registry.save_many(templates)
+            if verbose:
+                for template in templates:
+                    print(f"  ✓ Migrated: {template.id}")
+        except Exception as e:
+            failed_count += len(templates)
+            failed_ids.extend(template.id for template in templates)
+            if verbose:
+                print(f"  ✗ Failed to write {len(templates)} templates - {e}")
+
+        # a single flush for the whole migration instead of one per commit
+        lmdb_registry.sync()
         lmdb_registry.close()
 
         result = {
@@ -90,25 +108,27 @@ def verify_migration(
         if verbose:
             print(f"Verifying migration...")
 
-        for template_id in local_ids & lmdb_ids:
-            try:
-                local_template = local_registry.load(template_id)
-                lmdb_template = lmdb_registry.load(template_id)
-
-                if local_template.model_dump() == lmdb_template.model_dump():
-                    verified_count += 1
-                    if verbose:
-                        print(f"  ✓ Verified: {template_id}")
-                else:
+        # one read transaction for the whole comparison
+        with lmdb_registry.reader() as lmdb_reader:
+            for template_id in local_ids & lmdb_ids:
+                try:
+                    local_template = local_registry.load(template_id)
+                    lmdb_template = lmdb_reader.load(template_id)
+
+                    if local_template.model_dump() == lmdb_template.model_dump():
+                        verified_count += 1
+                        if verbose:
+                            print(f"  ✓ Verified: {template_id}")
+                    else:
+                        mismatch_count += 1
+                        mismatch_ids.append(template_id)
+                        if verbose:
+                            print(f"  ✗ Mismatch: {template_id}")
+                except Exception as e:
                     mismatch_count += 1
                     mismatch_ids.append(template_id)
                     if verbose:
-                        print(f"  ✗ Mismatch: {template_id}")
-            except Exception as e:
-                mismatch_count += 1
-                mismatch_ids.append(template_id)
-                if verbose:
-                    print(f"  ✗ Error: {template_id} - {e}")
+                        print(f"  ✗ Error: {template_id} - {e}")
 
         lmdb_registry.close()
 
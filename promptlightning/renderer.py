@@ -1,39 +1,16 @@
 from __future__ import annotations
-from typing import Any, Dict
-from functools import lru_cache
+import re
+from typing import Any, Dict, List, Union
+from functools import lru_cache, partial
 from jinja2 import Environment, StrictUndefined, Template
-import yaml
-
-try:
-    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
-    YAML_C_AVAILABLE = True
-except ImportError:
-    from yaml import SafeLoader, SafeDumper
-    YAML_C_AVAILABLE = False
-
-@lru_cache(maxsize=1000)
-def _yaml_dump_cached(obj_repr: str) -> str:
-    """Cached YAML serialization. Uses string repr as cache key."""
-    obj = eval(obj_repr)
-    if YAML_C_AVAILABLE:
-        return yaml.dump(obj, Dumper=SafeDumper, sort_keys=False, allow_unicode=True).rstrip()
-    return yaml.safe_dump(obj, sort_keys=False, allow_unicode=True).rstrip()
+from jinja2.exceptions import UndefinedError
+from ._yaml import safe_dump
 
 def _yaml_dump(obj: Any) -> str:
-    """YAML filter with caching for common objects."""
+    """YAML filter; scalars pass through, everything else goes straight to the (C, when available) dumper."""
     if isinstance(obj, (str, int, float, bool, type(None))):
         return str(obj)
-
-    try:
-        obj_repr = repr(obj)
-        if len(obj_repr) < 1000:
-            return _yaml_dump_cached(obj_repr)
-    except (TypeError, ValueError):
-        pass
-
-    if YAML_C_AVAILABLE:
-        return yaml.dump(obj, Dumper=SafeDumper, sort_keys=False, allow_unicode=True).rstrip()
-    return yaml.safe_dump(obj, sort_keys=False, allow_unicode=True).rstrip()
+    return safe_dump(obj, sort_keys=False, allow_unicode=True).rstrip()
 
 def _default_filter(val: Any, dflt: str = "") -> Any:
     """Default filter for falsy values."""
@@ -54,16 +31,88 @@ def make_env() -> Environment:
     env.filters["yaml"] = _yaml_dump
     return env
 
+_PLAIN_VAR_RE = re.compile(r"\{\{\s*([A-Za-z_][A-Za-z0-9_]*)\s*\}\}")
+_TRAILING_NEWLINE_RE = re.compile(r"(?:\r\n|\r|\n)\Z")
+_NEWLINE_RE = re.compile(r"\r\n|\r")
+# names Jinja parses as literals or operators rather than variable lookups, plus
+# `self`, which resolves to the template's own block reference
+_JINJA_RESERVED = frozenset({"true", "false", "none", "True", "False", "None",
+                             "and", "or", "not", "in", "is", "if", "else", "self"})
+
+class PlainTemplate:
+    """Stand-in for a Jinja Template whose source is literal text plus bare `{{ name }}` substitutions.
+
+    Renders with a join instead of Jinja's runtime, matching its output for
+    these sources (trailing-newline trim, newline normalization, StrictUndefined).
+    """
+    __slots__ = ("_parts", "_globals")
+
+    def __init__(self, parts: List[str], env_globals: Dict[str, Any]) -> None:
+        self._parts = parts  # literal, name, literal, name, ..., literal
+        self._globals = env_globals
+
+    def render(self, *args: Any, **kwargs: Any) -> str:
+        if args:
+            kwargs = dict(*args, **kwargs)
+        parts = self._parts
+        if len(parts) == 1:
+            return parts[0]
+        out = [parts[0]]
+        for i in range(1, len(parts), 2):
+            name = parts[i]
+            if name in kwargs:
+                value = kwargs[name]
+            elif name in self._globals:
+                value = self._globals[name]
+            else:
+                raise UndefinedError(f"'{name}' is undefined")
+            out.append(value if type(value) is str else str(value))
+            out.append(parts[i + 1])
+        return "".join(out)
+
+def _plain_parts(template_text: str) -> List[str] | None:
+    """Split a template into literals and variable names, or None if it needs real Jinja."""
+    source = _TRAILING_NEWLINE_RE.sub("", template_text, count=1)
+    parts = _PLAIN_VAR_RE.split(source)
+    for i, part in enumerate(parts):
+        if i % 2:
+            if part in _JINJA_RESERVED:
+                return None
+            continue
+        if "{{" in part or "{%" in part or "{#" in part:
+            return None
+        # a brace touching a substitution would lex differently ({{{ x }} / {{ x }}})
+        if (i > 0 and part.startswith("}")) or (i < len(parts) - 1 and part.endswith("{")):
+            return None
+        parts[i] = _NEWLINE_RE.sub("\n", part)
+    return parts
+
+def compile_template(env: Environment, template_text: str) -> Union[Template, PlainTemplate]:
+    """Compile with Jinja, or return a PlainTemplate when the source has no logic to run."""
+    parts = _plain_parts(template_text)
+    if parts is not None:
+        return PlainTemplate(parts, env.globals)
+    return env.from_string(template_text)
+
+@lru_cache(maxsize=1)
+def shared_env() -> Environment:
+    """Process-wide environment used to compile templates attached to TemplateSpec."""
+    return make_env()
+
+@lru_cache(maxsize=10000)
+def compile_shared(template_text: str) -> Union[Template, PlainTemplate]:
+    """Compile against the shared environment, memoized on the template text."""
+    return compile_template(shared_env(), template_text)
+
 class Renderer:
     """High-performance template renderer with compilation caching."""
 
     def __init__(self) -> None:
         self.env = make_env()
-        self._compile_cache: Dict[str, Template] = {}
-        self._cache_hits = 0
-        self._cache_misses = 0
+        # C-level LRU over from_string: thread-safe, and hit/miss stats for free
+        self._compile = lru_cache(maxsize=10000)(partial(compile_template, self.env))
 
-    def compile(self, template_text: str) -> Template:
+    def compile(self, template_text: str) -> Union[Template, PlainTemplate]:
         """Compile and cache template for reuse.
 
         Args:
@@ -72,19 +121,9 @@ class Renderer:
         Returns:
             Compiled Jinja2 template object
         """
-        if template_text in self._compile_cache:
-            self._cache_hits += 1
-            return self._compile_cache[template_text]
-
-        self._cache_misses += 1
-        compiled = self.env.from_string(template_text)
-
-        if len(self._compile_cache) < 10000:
-            self._compile_cache[template_text] = compiled
-
-        return compiled
+        return self._compile(template_text)
 
-    def precompile(self, template_text: str) -> Template:
+    def precompile(self, template_text: str) -> Union[Template, PlainTemplate]:
         """Pre-compile template for later use.
 
         This method is useful for warming up the cache during initialization.
@@ -122,19 +161,18 @@ class Renderer:
         Returns:
             Dictionary with cache metrics
         """
-        total = self._cache_hits + self._cache_misses
-        hit_rate = (self._cache_hits / total * 100) if total > 0 else 0.0
+        info = self._compile.cache_info()
+        total = info.hits + info.misses
+        hit_rate = (info.hits / total * 100) if total > 0 else 0.0
 
         return {
-            "cache_size": len(self._compile_cache),
-            "cache_hits": self._cache_hits,
-            "cache_misses": self._cache_misses,
+            "cache_size": info.currsize,
+            "cache_hits": info.hits,
+            "cache_misses": info.misses,
             "hit_rate": hit_rate,
-            "max_cache_size": 10000
+            "max_cache_size": info.maxsize
         }
 
     def clear_cache(self) -> None:
         """Clear compilation cache and reset statistics."""
-        self._compile_cache.clear()
-        self._cache_hits = 0
-        self._cache_misses = 0
+        self._compile.cache_clear()
@@ -1,25 +1,38 @@
 from __future__ import annotations
-from typing import Dict, Optional, Any, List
+from typing import TYPE_CHECKING, Dict, Optional, Any, List
 from pathlib import Path
-import yaml
-from threading import RLock, Lock
+import sys
+from threading import RLock, Lock, Thread
 from collections import OrderedDict
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
 
-from .renderer import Renderer
+from ._yaml import safe_load
 from .registry.local import LocalRegistry
-from .registry.lmdb_registry import LMDBRegistry
 from .model import TemplateSpec
 from .exceptions import ValidationError, RenderError, TemplateNotFound, PromptLightningError
 from .logging import Logger
-from .llm.client import LLMClient
 from .llm.models import ExecutionResult
 
+if TYPE_CHECKING:
+    from .llm.client import LLMClient
+
+
+def __getattr__(name: str) -> Any:
+    # litellm takes seconds to import; only pay for it once something executes
+    if name == "LLMClient":
+        from .llm.client import LLMClient
+        globals()["LLMClient"] = LLMClient
+        return LLMClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 class LRUCache:
     """
     Thread-safe LRU cache for template specs with configurable max size.
-    Provides O(1) get/put operations with lock-free reads for cached items.
+    Provides O(1) get/put operations with lock-free reads for cached items;
+    only writes and (uncontended) recency updates take the lock.
+    Not functools.lru_cache: that can't drop a single key or be probed
+    without loading, which invalidate(template_id), exists() and get_many() need.
     """
     def __init__(self, maxsize: int = 1000):
         self._cache: OrderedDict[str, TemplateSpec] = OrderedDict()
@@ -27,11 +40,15 @@ class LRUCache:
         self._lock = Lock()
 
     def get(self, key: str) -> Optional[TemplateSpec]:
-        with self._lock:
-            if key not in self._cache:
-                return None
-            self._cache.move_to_end(key)
-            return self._cache[key]
+        value = self._cache.get(key)
+        if value is not None and self._lock.acquire(blocking=False):
+            # approximate LRU: a contended reader skips the recency bump instead of queueing
+            try:
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+            finally:
+                self._lock.release()
+        return value
 
     def put(self, key: str, value: TemplateSpec) -> None:
         with self._lock:
@@ -42,39 +59,9 @@ class LRUCache:
                 if len(self._cache) > self._maxsize:
                     self._cache.popitem(last=False)
 
-    def clear(self) -> None:
-        with self._lock:
-            self._cache.clear()
-
-    def __len__(self) -> int:
-        return len(self._cache)
-
-
-class RawTemplateCache:
-    """
-    Cache for raw serialized template data (lazy deserialization).
-    Stores msgpack/dict data before Pydantic validation for zero-copy LMDB access.
-    """
-    def __init__(self, maxsize: int = 1000):
-        self._cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
-        self._maxsize = maxsize
-        self._lock = Lock()
-
-    def get(self, key: str) -> Optional[Dict[str, Any]]:
+    def pop(self, key: str) -> None:
         with self._lock:
-            if key not in self._cache:
-                return None
-            self._cache.move_to_end(key)
-            return self._cache[key]
-
-    def put(self, key: str, value: Dict[str, Any]) -> None:
-        with self._lock:
-            if key in self._cache:
-                self._cache.move_to_end(key)
-            else:
-                self._cache[key] = value
-                if len(self._cache) > self._maxsize:
-                    self._cache.popitem(last=False)
+            self._cache.pop(key, None)
 
     def clear(self) -> None:
         with self._lock:
@@ -90,11 +77,11 @@ class Vault:
 
     Performance optimizations:
     - LRU cache (configurable size, default 1000 entries) for template specs
-    - Lazy deserialization: raw data cached, Pydantic validation on access
     - Fine-grained locking: separate locks for cache vs registry access
     - Batch operations: get_many() for bulk template loading
     - Connection pooling: persistent Registry instances
-    - Template precompilation: Jinja2 templates compiled on first render
+    - Template precompilation: Jinja2 templates compiled once per template text and shared
+    - Optional background preload (preload=True) so first access is a cache hit
 
     Performance targets:
     - get() operation: <1ms for cached, <10ms for LMDB uncached
@@ -107,24 +94,28 @@ class Vault:
         config_path: str | None = None,
         prompt_dir: str | None = None,
         db_path: str | None = None,
-        cache_size: int = 1000
+        cache_size: int = 1000,
+        config: Dict | None = None,
+        preload: bool = False
     ):
-        if not (config_path or prompt_dir or db_path):
-            raise PromptLightningError("pass config_path, prompt_dir, or db_path")
+        if not (config_path or prompt_dir or db_path or config is not None):
+            raise PromptLightningError("pass config_path, prompt_dir, db_path, or config")
 
         if db_path:
+            from .registry.lmdb_registry import LMDBRegistry
             self.config = {"registry": "lmdb", "db_path": db_path, "logging": {"enabled": False}}
             self.registry = LMDBRegistry(db_path)
         elif prompt_dir:
             self.config = {"registry": "local", "prompt_dir": prompt_dir, "logging": {"enabled": False}}
             self.registry = LocalRegistry(prompt_dir)
         else:
-            self.config = self._load_config(config_path)
+            self.config = self._check_config(dict(config)) if config is not None else self._load_config(config_path)
             registry_type = self.config.get("registry", "local")
 
             if registry_type == "lmdb":
                 if "db_path" not in self.config:
                     raise PromptLightningError("config with registry='lmdb' requires db_path")
+                from .registry.lmdb_registry import LMDBRegistry
                 self.registry = LMDBRegistry(self.config["db_path"])
             elif registry_type == "local":
                 if "prompt_dir" not in self.config:
@@ -133,20 +124,32 @@ class Vault:
             else:
                 raise PromptLightningError(f"unsupported registry type: {registry_type}")
 
-        self.renderer = Renderer()
         self.logger = Logger(self.config["logging"]["db_path"]) if self.config.get("logging", {}).get("enabled") else None
 
         self._spec_cache = LRUCache(maxsize=cache_size)
-        self._raw_cache = RawTemplateCache(maxsize=cache_size)
-        self._compiled_cache: Dict[str, Any] = {}
-        self._compiled_lock = Lock()
 
-        self._registry_lock = RLock()
-        self._executor = ThreadPoolExecutor(max_workers=10, thread_name_prefix="vault-worker")
+        self._llm_client: Optional[LLMClient] = None
+        self._llm_client_lock = Lock()
+
+        # LMDB readers don't need serializing; the local registry's file index does
+        self._registry_lock = nullcontext() if self.registry.concurrent_reads else RLock()
+
+        self._preload_thread: Optional[Thread] = None
+        if preload:
+            self._preload_thread = Thread(target=self._preload, name="vault-preload", daemon=True)
+            self._preload_thread.start()
+
+    @classmethod
+    def from_config_dict(cls, data: Dict, cache_size: int = 1000, preload: bool = False) -> "Vault":
+        """Build a Vault from an already-parsed config, skipping the file read."""
+        return cls(config=data, cache_size=cache_size, preload=preload)
 
     @staticmethod
     def _load_config(path: str) -> Dict:
-        data = yaml.safe_load(Path(path).read_text(encoding="utf-8")) or {}
+        return Vault._check_config(safe_load(Path(path).read_text(encoding="utf-8")) or {})
+
+    @staticmethod
+    def _check_config(data: Dict) -> Dict:
         registry_type = data.get("registry", "local")
 
         if registry_type == "local" and "prompt_dir" not in data:
@@ -158,44 +161,71 @@ class Vault:
             data["logging"] = {"enabled": False}
         return data
 
+    def _preload(self) -> None:
+        """Load and compile templates in the background so first access is a cache hit."""
+        try:
+            with self._registry_lock:
+                template_ids = list(self.registry.list_ids())
+        except Exception:
+            return
+        for template_id in template_ids[:self._spec_cache._maxsize]:
+            try:
+                self.get_spec(template_id)
+            except Exception:
+                # a broken template should surface when it's requested, not here
+                continue
+
     def list(self):
         return list(self.registry.list_ids())
 
+    def count(self) -> int:
+        return self.registry.count()
+
+    def exists(self, template_id: str) -> bool:
+        """Check for a template without deserializing it."""
+        if self._spec_cache.get(template_id) is not None:
+            return True
+        with self._registry_lock:
+            return self.registry.exists(template_id)
+
     def invalidate_cache(self):
-        """Clear all caches (spec, raw, and compiled templates)"""
+        """Clear the spec cache; compiles are keyed on template text, so they stay valid."""
         self._spec_cache.clear()
-        self._raw_cache.clear()
-        with self._compiled_lock:
-            self._compiled_cache.clear()
+
+    def invalidate(self, template_id: Optional[str] = None):
+        """Drop one template's cached spec, or every cache when no id is given."""
+        if template_id is None:
+            self.invalidate_cache()
+            return
+        self._spec_cache.pop(template_id)
 
     def get_spec(self, template_id: str) -> TemplateSpec:
         """
-        Get template spec with optimized caching:
-        1. Check spec cache (deserialized)
-        2. Check raw cache (serialized) + lazy deserialize
-        3. Load from registry + cache both raw and spec
+        Get template spec: serve the validated spec from the LRU cache,
+        otherwise load it from the registry (which validates once), compile its
+        template and cache it.
         """
         cached_spec = self._spec_cache.get(template_id)
         if cached_spec is not None:
             return cached_spec
 
-        cached_raw = self._raw_cache.get(template_id)
-        if cached_raw is not None:
-            spec = TemplateSpec.model_validate(cached_raw)
-            self._spec_cache.put(template_id, spec)
-            return spec
-
         with self._registry_lock:
             spec = self.registry.load(template_id)
-            raw_data = spec.model_dump()
-            self._raw_cache.put(template_id, raw_data)
-            self._spec_cache.put(template_id, spec)
-            return spec
+        self._cache_spec(template_id, spec)
+        return spec
+
+    def _cache_spec(self, template_id: str, spec: TemplateSpec) -> None:
+        try:
+            spec.compiled
+        except Exception:
+            pass  # syntax errors surface as RenderError on render, not on get
+        self._spec_cache.put(template_id, spec)
 
     def get_many(self, template_ids: List[str]) -> Dict[str, TemplateSpec]:
         """
-        Batch load multiple templates with parallel processing.
-        Uses ThreadPoolExecutor for concurrent registry access and deserialization.
+        Batch load multiple templates.
+        Cache misses go to the registry in a single load_many() call, which
+        LMDB serves from one read transaction.
 
         Performance: ~50ms for 100 templates (LMDB), near-instant for cached.
         """
@@ -212,35 +242,23 @@ class Vault:
         if not to_load:
             return result
 
-        def load_one(tid: str) -> tuple[str, TemplateSpec]:
-            spec = self.get_spec(tid)
-            return (tid, spec)
-
-        futures = {self._executor.submit(load_one, tid): tid for tid in to_load}
-
-        for future in as_completed(futures):
-            tid, spec = future.result()
+        with self._registry_lock:
+            loaded = self.registry.load_many(to_load)
+        for tid, spec in loaded.items():
+            self._cache_spec(tid, spec)
             result[tid] = spec
 
         return result
 
-    def get_compiled_template(self, template_text: str) -> Any:
-        """
-        Get precompiled Jinja2 template from cache or compile and cache.
-        Avoids recompilation on every render for significant performance gain.
-        """
-        cache_key = hash(template_text)
-
-        with self._compiled_lock:
-            if cache_key in self._compiled_cache:
-                return self._compiled_cache[cache_key]
-
-        compiled = self.renderer.env.from_string(template_text)
-
-        with self._compiled_lock:
-            self._compiled_cache[cache_key] = compiled
-
-        return compiled
+    def llm_client(self) -> "LLMClient":
+        """LiteLLM client shared by every handle from this vault, created on first execute."""
+        client = self._llm_client
+        if client is None:
+            with self._llm_client_lock:
+                if self._llm_client is None:
+                    self._llm_client = sys.modules[__name__].LLMClient()
+                client = self._llm_client
+        return client
 
     def get(self, template_id: str) -> "TemplateHandle":
         """Public API: Get template handle for rendering and execution"""
@@ -248,10 +266,13 @@ class Vault:
         return TemplateHandle(self, spec)
 
     def close(self):
-        """Clean up resources: close registry and executor"""
+        """Clean up resources: finish any preload, then close registry and logger"""
+        if self._preload_thread is not None:
+            self._preload_thread.join()
         if hasattr(self.registry, 'close'):
             self.registry.close()
-        self._executor.shutdown(wait=True)
+        if self.logger:
+            self.logger.close()
 
     def __enter__(self):
         return self
@@ -270,7 +291,11 @@ class TemplateHandle:
     def __init__(self, vault: Vault, spec: TemplateSpec):
         self.vault = vault
         self.spec = spec
-        self._llm_client: Optional[LLMClient] = None
+
+    # the client lives on the vault so all handles share one connection pool
+    @property
+    def _llm_client(self) -> Optional[LLMClient]:
+        return self.vault._llm_client
 
     @property
     def id(self): return self.spec.id
@@ -282,14 +307,14 @@ class TemplateHandle:
     def render(self, **kwargs) -> str:
         """
         Render template with input validation and precompiled Jinja2 templates.
-        Uses vault's compiled template cache for performance.
+        Compiles are memoized on the template text, so repeat renders never recompile.
         """
         try:
             vars = self.spec.coerce_inputs(kwargs)
         except Exception as e:
             raise ValidationError(str(e)) from e
         try:
-            compiled = self.vault.get_compiled_template(self.spec.template)
+            compiled = self.spec.compiled
             return compiled.render(**vars)
         except Exception as e:
             raise RenderError(str(e)) from e
@@ -312,8 +337,7 @@ class TemplateHandle:
             RenderError: Template rendering failed
             LLMError: LLM execution failed (APIKeyError, RateLimitError, ModelNotFoundError)
         """
-        if self._llm_client is None:
-            self._llm_client = LLMClient()
+        client = self.vault.llm_client()
 
         template_input_names = set(self.spec.inputs.keys())
         template_inputs = {k: v for k, v in kwargs.items() if k in template_input_names}
@@ -325,12 +349,12 @@ class TemplateHandle:
             raise ValidationError(str(e)) from e
 
         try:
-            compiled = self.vault.get_compiled_template(self.spec.template)
+            compiled = self.spec.compiled
             prompt = compiled.render(**vars)
         except Exception as e:
             raise RenderError(str(e)) from e
 
-        result = self._llm_client.execute(prompt, model, **llm_params)
+        result = client.execute(prompt, model, **llm_params)
 
         if self.vault.logger:
             self.vault.logger.write(
@@ -356,7 +380,7 @@ class TemplateHandle:
             out = tmpl.run(lambda prompt: call_llm(prompt), input_text="...")
         """
         vars = self.spec.coerce_inputs(kwargs)
-        compiled = self.vault.get_compiled_template(self.spec.template)
+        compiled = self.spec.compiled
         prompt = compiled.render(**vars)
         rec = {"inputs": vars, "output": None, "cost": None, "latency_ms": None}
         out = func(prompt)
@@ -2,20 +2,37 @@ from __future__ import annotations
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Optional
+import threading
 
 class _Handler(FileSystemEventHandler):
-    def __init__(self, on_change: Callable[[], None]) -> None:
+    def __init__(self, on_change: Callable[[], None], debounce: float = 0.25) -> None:
         super().__init__()
         self.on_change = on_change
+        self.debounce = debounce
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
     def on_any_event(self, event):  # create/modify/move/delete
-        self.on_change()
+        if event.event_type in ("opened", "closed_no_write"):
+            return
+        # editors emit several events per save; coalesce the burst into one on_change
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.debounce, self.on_change)
+            self._timer.daemon = True
+            self._timer.start()
+    def cancel(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
 
 class Watcher:
-    def __init__(self, path: str | Path, on_change: Callable[[], None]) -> None:
+    def __init__(self, path: str | Path, on_change: Callable[[], None], debounce: float = 0.25) -> None:
         self.path = str(Path(path))
         self._observer = Observer()
-        self._handler = _Handler(on_change)
+        self._handler = _Handler(on_change, debounce)
 
     def start(self):
         self._observer.schedule(self._handler, self.path, recursive=True)
@@ -23,4 +40,5 @@ class Watcher:
 
     def stop(self):
         self._observer.stop()
-        self._observer.join()
\ No newline at end of file
+        self._observer.join()
+        self._handler.cancel()
@@ -5,37 +5,49 @@ Tests response times, compression ratios, and cache effectiveness.
 """
 
 import time
+import statistics
 import requests
+from requests.adapters import HTTPAdapter
 import json
 from typing import Dict, List
 
+# keep-alive pool so timings measure the server, not TCP setup per request
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
 def benchmark_endpoint(url: str, iterations: int = 10) -> Dict[str, float]:
     """Benchmark an endpoint and return statistics."""
     times = []
     sizes = []
     
+    SESSION.get(url)  # warm-up: open the connection outside the timed loop
+    
     for _ in range(iterations):
-        start = time.time()
-        response = requests.get(url)
-        duration = (time.time() - start) * 1000
-        
-        times.append(duration)
+        start = time.perf_counter_ns()
+        response = SESSION.get(url)
+        times.append(time.perf_counter_ns() - start)
         sizes.append(len(response.content))
     
+    times_ms = [t / 1e6 for t in times]
+    # quantiles needs two points; with one sample the P95 is just that sample
+    p95_ms = statistics.quantiles(times_ms, n=100, method="inclusive")[94] if len(times_ms) > 1 else times_ms[0]
+    
     return {
-        "avg_ms": sum(times) / len(times),
-        "min_ms": min(times),
-        "max_ms": max(times),
-        "p95_ms": sorted(times)[int(len(times) * 0.95)],
-        "avg_size_bytes": sum(sizes) / len(sizes),
+        "avg_ms": statistics.fmean(times_ms),
+        "min_ms": min(times_ms),
+        "max_ms": max(times_ms),
+        "p95_ms": p95_ms,
+        "avg_size_bytes": statistics.fmean(sizes),
     }
 
 def test_compression(url: str) -> Dict[str, float]:
     """Test compression effectiveness."""
-    response_plain = requests.get(url, headers={"Accept-Encoding": "identity"})
+    response_plain = SESSION.get(url, headers={"Accept-Encoding": "identity"})
     plain_size = len(response_plain.content)
     
-    response_gzip = requests.get(url, headers={"Accept-Encoding": "gzip"})
+    response_gzip = SESSION.get(url, headers={"Accept-Encoding": "gzip"})
     gzip_size = len(response_gzip.content)
     
     compression_ratio = (1 - gzip_size / plain_size) * 100 if plain_size > 0 else 0
@@ -48,17 +60,17 @@ def test_compression(url: str) -> Dict[str, float]:
 
 def test_cache_effectiveness(url: str, iterations: int = 5) -> Dict[str, float]:
     """Test cache hit performance improvement."""
-    start = time.time()
-    requests.get(url)
-    first_request_ms = (time.time() - start) * 1000
+    start = time.perf_counter_ns()
+    SESSION.get(url)
+    first_request_ms = (time.perf_counter_ns() - start) / 1e6
     
     cached_times = []
     for _ in range(iterations):
-        start = time.time()
-        requests.get(url)
-        cached_times.append((time.time() - start) * 1000)
+        start = time.perf_counter_ns()
+        SESSION.get(url)
+        cached_times.append(time.perf_counter_ns() - start)
     
-    avg_cached_ms = sum(cached_times) / len(cached_times)
+    avg_cached_ms = statistics.fmean(cached_times) / 1e6
     improvement = ((first_request_ms - avg_cached_ms) / first_request_ms) * 100
     
     return {
@@ -1,167 +1,207 @@
 """
 Test configuration and fixtures for PromptLightning tests
+
+Fixture scopes: the project tree (temp_project_dir) and its Vault (test_vault) are
+built once per module, and the live playground server once per session, so tests
+using them must not modify the tree; temp_project_dir_fresh gives a private copy.
 """
-import tempfile
 import shutil
 import os
+import socket
 from pathlib import Path
-import yaml
 import pytest
 import threading
-import time
 import requests
+import uvicorn
 from contextlib import contextmanager
 
-from promptlightning.playground import create_playground
+from promptlightning.playground import PlaygroundServer
 from promptlightning.vault import Vault
+from promptlightning._yaml import safe_dump, YAML_C_AVAILABLE
+
+
+def pytest_report_header(config):
+    # fixtures and LocalRegistry parse YAML constantly; make a pure-Python fallback visible
+    return f"libyaml: {'yes' if YAML_C_AVAILABLE else 'no (pure-Python PyYAML, expect slow YAML fixtures)'}"
 
 
 @pytest.fixture
-def temp_project_dir():
-    """Create a temporary directory with a PromptLightning project setup"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Create config file
-        config = {
-            "registry": "local",
-            "prompt_dir": "./prompts",
-            "logging": {
-                "enabled": False,  # Disable logging for tests
-                "backend": "sqlite",
-                "db_path": "./promptlightning.db"
-            }
+def local_spec_cache():
+    """Counters for LocalRegistry's shared parsed-spec cache; call it for a snapshot."""
+    from promptlightning.registry.local import spec_cache_info
+    return spec_cache_info
+
+
+def _write_project(root: Path) -> Path:
+    """Write the test project (config plus templates) under root; returns the config path."""
+    # Create config file
+    config = {
+        "registry": "local",
+        "prompt_dir": "./prompts",
+        "logging": {
+            "enabled": False,  # Disable logging for tests
+            "backend": "sqlite",
+            "db_path": "./promptlightning.db"
         }
-
-        config_path = Path(tmpdir) / "promptlightning.yaml"
-        config_path.write_text(yaml.safe_dump(config))
-
-        # Create prompts directory
-        prompts_dir = Path(tmpdir) / "prompts"
-        prompts_dir.mkdir()
-
-        # Create test templates
-        test_templates = [
-            {
-                "id": "simple-greeting",
-                "version": "1.0.0",
-                "description": "A simple greeting template",
-                "template": "Hello {{ name }}!",
-                "inputs": {
-                    "name": {
-                        "type": "string",
-                        "required": True
-                    }
+    }
+
+    config_path = root / "promptlightning.yaml"
+    config_path.write_text(safe_dump(config))
+
+    # Create prompts directory
+    prompts_dir = root / "prompts"
+    prompts_dir.mkdir()
+
+    # Create test templates
+    test_templates = [
+        {
+            "id": "simple-greeting",
+            "version": "1.0.0",
+            "description": "A simple greeting template",
+            "template": "Hello {{ name }}!",
+            "inputs": {
+                "name": {
+                    "type": "string",
+                    "required": True
                 }
-            },
-            {
-                "id": "complex-template",
-                "version": "2.1.0",
-                "description": "A complex template with multiple inputs",
-                "template": """Welcome {{ name }}!
+            }
+        },
+        {
+            "id": "complex-template",
+            "version": "2.1.0",
+            "description": "A complex template with multiple inputs",
+            "template": """Welcome {{ name }}!
 {% if age %}You are {{ age }} years old.{% endif %}
 {% if hobbies %}Your hobbies: {{ hobbies | join(", ") }}{% endif %}
 {{ message | default("Have a great day!") }}""",
-                "inputs": {
-                    "name": {
-                        "type": "string",
-                        "required": True
-                    },
-                    "age": {
-                        "type": "number",
-                        "required": False
-                    },
-                    "hobbies": {
-                        "type": "array<string>",
-                        "required": False
-                    },
-                    "message": {
-                        "type": "string",
-                        "required": False,
-                        "default": "Welcome to PromptLightning!"
-                    }
+            "inputs": {
+                "name": {
+                    "type": "string",
+                    "required": True
+                },
+                "age": {
+                    "type": "number",
+                    "required": False
+                },
+                "hobbies": {
+                    "type": "array<string>",
+                    "required": False
                 },
-                "metadata": {
-                    "category": "greeting",
-                    "tags": ["test", "complex"]
+                "message": {
+                    "type": "string",
+                    "required": False,
+                    "default": "Welcome to PromptLightning!"
                 }
             },
-            {
-                "id": "error-template",
-                "version": "1.0.0",
-                "description": "Template that will cause render errors",
-                "template": "Hello {{ undefined_var.missing_attr }}!",
-                "inputs": {
-                    "name": {
-                        "type": "string",
-                        "required": True
-                    }
+            "metadata": {
+                "category": "greeting",
+                "tags": ["test", "complex"]
+            }
+        },
+        {
+            "id": "error-template",
+            "version": "1.0.0",
+            "description": "Template that will cause render errors",
+            "template": "Hello {{ undefined_var.missing_attr }}!",
+            "inputs": {
+                "name": {
+                    "type": "string",
+                    "required": True
                 }
             }
-        ]
+        }
+    ]
 
-        for template in test_templates:
-            template_path = prompts_dir / f"{template['id']}.yaml"
-            template_path.write_text(yaml.safe_dump(template))
+    for template in test_templates:
+        template_path = prompts_dir / f"{template['id']}.yaml"
+        template_path.write_text(safe_dump(template))
 
-        yield tmpdir, config_path
+    return config_path
 
 
-@pytest.fixture
-def test_vault(temp_project_dir):
-    """Create a Vault instance for testing"""
-    tmpdir, config_path = temp_project_dir
+def _project_vault(config_path: Path) -> Vault:
+    """Vault for a _write_project tree; its relative prompt_dir is resolved here, once."""
     original_cwd = os.getcwd()
-    os.chdir(tmpdir)
-
+    os.chdir(config_path.parent)
     try:
-        vault = Vault(str(config_path))
-        yield vault
+        return Vault(str(config_path))
     finally:
         os.chdir(original_cwd)
 
 
+@pytest.fixture(scope="module")
+def temp_project_dir(tmp_path_factory):
+    """Create a temporary directory with a PromptLightning project setup (shared per module)"""
+    root = tmp_path_factory.mktemp("project")
+    return str(root), _write_project(root)
+
+
+@pytest.fixture
+def temp_project_dir_fresh(tmp_path):
+    """Like temp_project_dir, but a new tree per test, for tests that modify it"""
+    return str(tmp_path), _write_project(tmp_path)
+
+
+@pytest.fixture(scope="module")
+def test_vault(temp_project_dir):
+    """Create a Vault instance for testing (shared per module)"""
+    _, config_path = temp_project_dir
+    vault = _project_vault(config_path)
+    yield vault
+    vault.close()
+
+
 @contextmanager
 def playground_server(vault, port=0):
     """Context manager that starts a playground server and yields the base URL"""
-    # Find available port if port=0
-    if port == 0:
-        import socket
-        sock = socket.socket()
-        sock.bind(('', 0))
-        port = sock.getsockname()[1]
-        sock.close()
-
-    playground = create_playground(config_path=None, prompt_dir=vault.config["prompt_dir"],
-                                 host="127.0.0.1", port=port)
+    # bind here and hand the listening socket to uvicorn: with port=0 the kernel picks
+    # a free port and nothing can take it between finding it and serving on it
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", port))
+    # listening before uvicorn starts: connections queue in the kernel until it accepts
+    sock.listen()
+    port = sock.getsockname()[1]
+
+    ready = threading.Event()
+    playground = PlaygroundServer(vault, host="127.0.0.1", port=port, ready_event=ready)
+    server = uvicorn.Server(uvicorn.Config(playground.app, log_level="warning"))
 
     # Start server in thread
-    server_thread = threading.Thread(
-        target=lambda: playground.run(debug=False),
-        daemon=True
-    )
+    server_thread = threading.Thread(target=server.run, kwargs={"sockets": [sock]}, daemon=True)
     server_thread.start()
 
-    # Wait for server to start
-    base_url = f"http://127.0.0.1:{port}"
-    max_attempts = 30
-    for _ in range(max_attempts):
-        try:
-            response = requests.get(f"{base_url}/api/health", timeout=1)
-            if response.status_code == 200:
-                break
-        except (requests.exceptions.RequestException, requests.exceptions.Timeout):
-            time.sleep(0.1)
-    else:
+    # the app sets the event from its startup hook: one wake-up instead of polling
+    if not ready.wait(timeout=5):
         raise RuntimeError("Playground server failed to start")
+    base_url = f"http://127.0.0.1:{port}"
 
     try:
         yield base_url
     finally:
-        # Server will be stopped when thread exits
-        pass
+        server.should_exit = True
+        server_thread.join(timeout=5)
+        sock.close()
+
+
+@pytest.fixture(scope="session")
+def playground_session(tmp_path_factory):
+    """One playground server for the whole run and a keep-alive HTTP session to it.
+
+    Server startup dominates the API tests, so they share it; tests that create
+    templates use ids no other test touches.
+    """
+    vault = _project_vault(_write_project(tmp_path_factory.mktemp("playground")))
+    with playground_server(vault) as url, requests.Session() as session:
+        yield url, session
+
+
+@pytest.fixture
+def playground_url(playground_session):
+    """Base URL of the shared playground server"""
+    return playground_session[0]
 
 
 @pytest.fixture
-def playground_url(test_vault):
-    """Fixture that provides a running playground server URL"""
-    with playground_server(test_vault) as url:
-        yield url
\ No newline at end of file
+def playground_http(playground_session):
+    """Pooled requests.Session for the shared server (not for use across threads)"""
+    return playground_session[1]
@@ -15,13 +15,13 @@ This test uses gpt-5-nano which is the most cost-efficient GPT-5 model.
 
 import tempfile
 from pathlib import Path
-import yaml
 import sys
 import os
 
 from dotenv import load_dotenv
 from promptlightning.vault import Vault
 from promptlightning.exceptions import APIKeyError
+from promptlightning._yaml import safe_dump
 
 load_dotenv()
 
@@ -60,7 +60,7 @@ def test_gpt5_nano_execution():
         }
 
         template_path = prompts_dir / "summarizer.yaml"
-        template_path.write_text(yaml.safe_dump(test_template))
+        template_path.write_text(safe_dump(test_template))
 
         config = {
             "registry": "local",
@@ -73,7 +73,7 @@ def test_gpt5_nano_execution():
         }
 
         config_path = Path(tmpdir) / "promptlightning.yaml"
-        config_path.write_text(yaml.safe_dump(config))
+        config_path.write_text(safe_dump(config))
 
         vault = Vault(str(config_path))
         template = vault.get("summarizer")
@@ -170,7 +170,7 @@ def test_gpt5_nano_with_custom_params():
             }
         }
 
-        (prompts_dir / "creative-writer.yaml").write_text(yaml.safe_dump(test_template))
+        (prompts_dir / "creative-writer.yaml").write_text(safe_dump(test_template))
 
         vault = Vault(prompt_dir=str(prompts_dir))
         template = vault.get("creative-writer")
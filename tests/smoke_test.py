@@ -5,7 +5,6 @@ Quick smoke test for PromptLightning functionality
 import tempfile
 import shutil
 from pathlib import Path
-import yaml
 import sys
 import os
 
@@ -14,6 +13,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from promptlightning.vault import Vault
 from promptlightning.cli import app
+from promptlightning._yaml import safe_dump
 import typer.testing
 
 def test_vault_operations():
@@ -37,7 +37,7 @@ def test_vault_operations():
             }
         }
 
-        (prompts_dir / "test.yaml").write_text(yaml.safe_dump(template_data))
+        (prompts_dir / "test.yaml").write_text(safe_dump(template_data))
 
         # Test Vault initialization
         vault = Vault(prompt_dir=str(prompts_dir))
@@ -132,7 +132,7 @@ def test_error_handling():
                 "name": {"type": "string", "required": True}
             }
         }
-        (prompts_dir / "validation.yaml").write_text(yaml.safe_dump(template_data))
+        (prompts_dir / "validation.yaml").write_text(safe_dump(template_data))
 
         template = vault.get("validation_test")
         try:
@@ -5,13 +5,13 @@ Test that promptlightning init command works correctly
 import tempfile
 import os
 from pathlib import Path
-import yaml
 import sys
 
 # Add parent directory to path to import promptlightning
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from promptlightning.cli import app
+from promptlightning._yaml import safe_load
 import typer.testing
 
 def test_init_creates_proper_structure():
@@ -32,7 +32,7 @@ def test_init_creates_proper_structure():
             assert config_path.exists(), "promptlightning.yaml was not created"
 
             # Check config file contents
-            config_data = yaml.safe_load(config_path.read_text())
+            config_data = safe_load(config_path.read_text())
             assert config_data["registry"] == "local", "Wrong registry type in config"
             assert config_data["prompt_dir"] == "./prompts", "Wrong prompt_dir in config"
             assert "logging" in config_data, "Logging config missing"
@@ -50,7 +50,7 @@ def test_init_creates_proper_structure():
             assert example_template.exists(), "Example summarizer.yaml was not created"
 
             # Check example template contents
-            template_data = yaml.safe_load(example_template.read_text())
+            template_data = safe_load(example_template.read_text())
             assert template_data["id"] == "summarizer", "Wrong template id"
             assert template_data["version"] == "1.0.0", "Wrong template version"
             assert "description" in template_data, "Template missing description"
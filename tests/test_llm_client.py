@@ -239,4 +239,13 @@ def test_execute_messages_override_prompt(llm_client, mock_litellm_response):
 
         mock_completion.assert_called_once()
         call_kwargs = mock_completion.call_args[1]
-        assert call_kwargs["messages"] == custom_messages
\ No newline at end of file
+        assert call_kwargs["messages"] == custom_messages
+
+
+def test_default_client_leaves_event_loop_policy_alone():
+    with patch.object(LLMClient, "_install_uvloop") as install:
+        LLMClient()
+        install.assert_not_called()
+
+        LLMClient(use_uvloop=True)
+        install.assert_called_once()
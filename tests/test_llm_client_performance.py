@@ -1,10 +1,12 @@
 import pytest
 import asyncio
+import random
+import time
 from unittest.mock import Mock, patch, AsyncMock
 from litellm.exceptions import RateLimitError as LiteLLMRateLimitError, Timeout, APIError
 
 from promptlightning.llm.client import LLMClient
-from promptlightning.exceptions import LLMError
+from promptlightning.exceptions import LLMError, RateLimitError
 
 
 @pytest.fixture
@@ -67,6 +69,56 @@ class TestCaching:
 
             assert mock_completion.call_count == 2
 
+    def test_cache_evicts_least_recently_used(self, mock_litellm_response):
+        client = LLMClient(enable_cache=True, cache_maxsize=2)
+
+        with patch("promptlightning.llm.client.completion", return_value=mock_litellm_response) as mock_completion:
+            client.execute("Prompt 1", "gpt-4")
+            client.execute("Prompt 2", "gpt-4")
+            client.execute("Prompt 1", "gpt-4")
+            client.execute("Prompt 3", "gpt-4")
+            assert mock_completion.call_count == 3
+
+            client.execute("Prompt 1", "gpt-4")
+            assert mock_completion.call_count == 3
+            client.execute("Prompt 2", "gpt-4")
+            assert mock_completion.call_count == 4
+
+    def test_cache_key_handles_unhashable_params(self, llm_client, mock_litellm_response):
+        messages = [{"role": "user", "content": "Hi"}]
+
+        with patch("promptlightning.llm.client.completion", return_value=mock_litellm_response) as mock_completion:
+            llm_client.execute("Hi", "gpt-4", messages=messages)
+            llm_client.execute("Hi", "gpt-4", messages=list(messages))
+
+            mock_completion.assert_called_once()
+
+    def test_cache_disabled_skips_key_building(self):
+        client = LLMClient(enable_cache=False)
+
+        assert client._get_cache_key("Prompt", "gpt-4", messages=[{"role": "user"}]) is None
+
+    def test_cache_skipped_for_short_prompts(self, mock_litellm_response):
+        client = LLMClient(enable_cache=True, min_cache_len=64)
+
+        with patch("promptlightning.llm.client.completion", return_value=mock_litellm_response) as mock_completion:
+            client.execute("hi", "gpt-4")
+            client.execute("hi", "gpt-4")
+            assert mock_completion.call_count == 2
+
+            long_prompt = "x" * 64
+            client.execute(long_prompt, "gpt-4")
+            client.execute(long_prompt, "gpt-4")
+            assert mock_completion.call_count == 3
+
+    def test_cache_stats(self, llm_client, mock_litellm_response):
+        with patch("promptlightning.llm.client.completion", return_value=mock_litellm_response):
+            llm_client.execute("Prompt 1", "gpt-4")
+            llm_client.execute("Prompt 1", "gpt-4")
+            llm_client.execute("Prompt 2", "gpt-4")
+
+        assert llm_client.cache_stats() == {"hits": 1, "misses": 2, "size": 2}
+
     def test_clear_cache(self, llm_client, mock_litellm_response):
         with patch("promptlightning.llm.client.completion", return_value=mock_litellm_response) as mock_completion:
             llm_client.execute("Test prompt", "gpt-4")
@@ -111,12 +163,27 @@ class TestRetryLogic:
                 mock_litellm_response
             ]
 
+            random.seed(0)
             with patch("time.sleep") as mock_sleep:
                 result = llm_client.execute("Test prompt", "gpt-4", max_retries=3, retry_delay=1.0)
 
+            # full jitter: each delay is drawn from [0, retry_delay * 2**attempt]
             assert mock_sleep.call_count == 2
-            assert mock_sleep.call_args_list[0][0][0] == 1.0
-            assert mock_sleep.call_args_list[1][0][0] == 2.0
+            assert 0 <= mock_sleep.call_args_list[0][0][0] <= 1.0
+            assert 0 <= mock_sleep.call_args_list[1][0][0] <= 2.0
+
+    def test_retry_stops_at_total_timeout(self, llm_client):
+        with patch("promptlightning.llm.client.completion") as mock_completion, \
+                patch("promptlightning.llm.client.random.uniform", side_effect=lambda low, high: high):
+            mock_completion.side_effect = LiteLLMRateLimitError("Rate limit", llm_provider="openai", model="gpt-4")
+
+            with patch("time.sleep") as mock_sleep:
+                with pytest.raises(RateLimitError):
+                    llm_client.execute("Test prompt", "gpt-4", max_retries=3, retry_delay=1.0, total_timeout=0.5)
+
+            # the first 1s backoff would already overrun the 0.5s budget
+            assert mock_completion.call_count == 1
+            mock_sleep.assert_not_called()
 
     def test_max_retries_exceeded(self, llm_client):
         with patch("promptlightning.llm.client.completion") as mock_completion:
@@ -177,10 +244,27 @@ class TestCircuitBreaker:
                     llm_client.execute("Test", "openai/gpt-4", max_retries=1)
 
             llm_client.reset_circuit_breakers()
+            assert not llm_client._breaker_fails
+            assert not llm_client._breaker_opened_at
 
             with pytest.raises(LLMError):
                 llm_client.execute("Test", "openai/gpt-4", max_retries=1)
 
+    def test_circuit_breaker_is_per_model(self, llm_client, mock_litellm_response):
+        with patch("promptlightning.llm.client.completion") as mock_completion:
+            mock_completion.side_effect = APIError(
+                status_code=500, message="Server error", llm_provider="openai", model="gpt-4"
+            )
+            for _ in range(5):
+                with pytest.raises(LLMError):
+                    llm_client.execute("Test", "openai/gpt-4", max_retries=1)
+
+            mock_completion.side_effect = None
+            mock_completion.return_value = mock_litellm_response
+            result = llm_client.execute("Test", "openai/gpt-4o-mini", max_retries=1)
+
+        assert result.output == "Test response"
+
 
 class TestAsyncExecution:
     @pytest.mark.asyncio
@@ -226,6 +310,44 @@ class TestBatchExecution:
             assert len(results) == 3
             assert all(r.output == "Test response" for r in results)
 
+    def test_execute_batch_runs_concurrently(self, llm_client, mock_litellm_response):
+        prompts = [f"Prompt {i}" for i in range(4)]
+
+        def slow_completion(**params):
+            time.sleep(0.2)
+            return mock_litellm_response
+
+        with patch("promptlightning.llm.client.completion", side_effect=slow_completion) as mock_completion:
+            start = time.perf_counter()
+            results = llm_client.execute_batch(prompts, "gpt-4")
+            elapsed = time.perf_counter() - start
+
+            assert mock_completion.call_count == len(prompts)
+            assert len(results) == len(prompts)
+            assert elapsed < len(prompts) * 0.2
+
+    def test_execute_batch_multi_prompt_single_request(self, llm_client):
+        prompts = ["Prompt 1", "Prompt 2", "Prompt 3"]
+        response = Mock()
+        # choices can come back in any order; index says which prompt each answers
+        response.choices = [Mock(index=i, text=f"Answer {i}") for i in (2, 0, 1)]
+        response.usage = Mock(prompt_tokens=31, completion_tokens=9)
+        response._hidden_params = {"custom_llm_provider": "text-completion-openai", "response_cost": 0.03}
+
+        model = "text-completion-openai/gpt-3.5-turbo-instruct"
+        with patch("promptlightning.llm.client.text_completion", return_value=response) as mock_text_completion, \
+                patch("promptlightning.llm.client.completion") as mock_completion:
+            results = llm_client.execute_batch(prompts, model, max_tokens=16)
+
+            mock_text_completion.assert_called_once()
+            assert mock_text_completion.call_args.kwargs["prompt"] == prompts
+            mock_completion.assert_not_called()
+
+        assert [r.output for r in results] == ["Answer 0", "Answer 1", "Answer 2"]
+        assert sum(r.tokens_in for r in results) == 31
+        assert sum(r.tokens_out for r in results) == 9
+        assert sum(r.cost_usd for r in results) == pytest.approx(0.03)
+
     @pytest.mark.asyncio
     async def test_execute_batch_async(self, llm_client, mock_async_response):
         prompts = ["Prompt 1", "Prompt 2", "Prompt 3"]
@@ -246,6 +368,28 @@ class TestBatchExecution:
             assert len(results) == 20
             assert mock_acompletion.call_count == 20
 
+    @pytest.mark.asyncio
+    async def test_execute_batch_async_overlaps_up_to_limit(self, llm_client, mock_async_response):
+        prompts = [f"Prompt {i}" for i in range(20)]
+        in_flight = peak = 0
+
+        async def slow_acompletion(**params):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            return mock_async_response
+
+        with patch("promptlightning.llm.client.acompletion", side_effect=slow_acompletion):
+            start = time.perf_counter()
+            await llm_client.execute_batch_async(prompts, "claude-3-opus", max_concurrency=5)
+            elapsed = time.perf_counter() - start
+
+        # ceil(20 / 5) waves of 50ms, nowhere near 20 serial calls
+        assert peak == 5
+        assert elapsed < 20 * 0.05 / 2
+
 
 class TestStreamingExecution:
     def test_execute_stream(self, llm_client):
@@ -262,6 +406,22 @@ class TestStreamingExecution:
 
             assert chunks == ["Hello", " world", "!"]
 
+    def test_execute_stream_skips_empty_chunks(self, llm_client):
+        mock_chunks = []
+        for text in [None, "Hello", "", " world"]:
+            chunk = Mock()
+            chunk.choices = [Mock()]
+            chunk.choices[0].delta.content = text
+            mock_chunks.append(chunk)
+        usage_only = Mock()
+        usage_only.choices = []
+        mock_chunks.append(usage_only)
+
+        with patch("promptlightning.llm.client.completion", return_value=iter(mock_chunks)):
+            chunks = list(llm_client.execute_stream("Test prompt", "gpt-4"))
+
+        assert chunks == ["Hello", " world"]
+
     @pytest.mark.asyncio
     async def test_execute_stream_async(self, llm_client):
         async def mock_async_iter():
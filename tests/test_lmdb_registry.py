@@ -68,6 +68,97 @@ def test_list_ids(temp_db_path, sample_template):
 
     registry.close()
 
+def test_save_many(temp_db_path, sample_template):
+    registry = LMDBRegistry(db_path=temp_db_path)
+    templates = [
+        sample_template.model_copy(update={"id": f"template_{i}"})
+        for i in range(3)
+    ]
+
+    assert registry.save_many(templates) == 3
+    assert set(registry.list_ids()) == {"template_0", "template_1", "template_2"}
+    assert registry.load("template_1").template == "Hello {{name}}!"
+    assert registry.get_metadata()["count"] == 3
+    assert registry.save_many([]) == 0
+
+    registry.close()
+
+def test_exists(temp_db_path, sample_template):
+    registry = LMDBRegistry(db_path=temp_db_path)
+
+    assert registry.exists("test_template") is False
+    registry.save(sample_template)
+    assert registry.exists("test_template") is True
+
+    registry.close()
+
+def test_load_many(temp_db_path, sample_template):
+    registry = LMDBRegistry(db_path=temp_db_path)
+    other = TemplateSpec(id="other", version="1.0.0", template="Other {{ x }}")
+    registry.save_many([sample_template, other])
+
+    loaded = registry.load_many(["other", "test_template"])
+    assert list(loaded) == ["other", "test_template"]
+    assert loaded["other"].template == "Other {{ x }}"
+
+    with pytest.raises(TemplateNotFound):
+        registry.load_many(["other", "missing"])
+
+    registry.close()
+
+def test_each_load_returns_independent_spec(temp_db_path, sample_template):
+    registry = LMDBRegistry(db_path=temp_db_path)
+    registry.save(sample_template)
+
+    first = registry.load("test_template")
+    second = registry.load("test_template")
+    assert second == first and second is not first
+
+    # mutating one caller's spec must not leak into the next load
+    first.template = "Mutated"
+    first.inputs["name"].required = False
+    third = registry.load("test_template")
+    assert third.template == sample_template.template
+    assert third.inputs["name"].required is True
+
+    registry.save(sample_template.model_copy(update={"template": "Changed {{ name }}"}))
+    assert registry.load("test_template").template == "Changed {{ name }}"
+
+    registry.close()
+
+def test_save_after_mutating_spec_stores_new_content(temp_db_path):
+    registry = LMDBRegistry(db_path=temp_db_path)
+    spec = TemplateSpec(id="mutable", version="1.0.0", template="one")
+    registry.save(spec)
+
+    spec.template = "two"
+    registry.save(spec)
+
+    assert registry.load("mutable").template == "two"
+    registry.close()
+
+def test_warm_reads_every_stored_value(temp_db_path, sample_template):
+    registry = LMDBRegistry(db_path=temp_db_path)
+    assert registry.warm() == 0
+
+    registry.save(sample_template)
+    assert registry.warm() == len(registry._pack(sample_template))
+
+    registry.close()
+
+def test_reader_shares_one_transaction(temp_db_path, sample_template):
+    registry = LMDBRegistry(db_path=temp_db_path)
+    registry.save(sample_template)
+
+    with registry.reader() as reader:
+        assert reader.list_ids() == ["test_template"]
+        assert reader.exists("test_template")
+        assert reader.load("test_template").template == "Hello {{name}}!"
+        with pytest.raises(TemplateNotFound):
+            reader.load("missing")
+
+    registry.close()
+
 def test_delete_template(temp_db_path, sample_template):
     registry = LMDBRegistry(db_path=temp_db_path)
 
@@ -156,6 +247,22 @@ def test_update_template(temp_db_path, sample_template):
     assert loaded.version == "2.0.0"
     assert loaded.description == "Updated template"
     assert loaded.template == "Hi {{name}}!"
+    assert registry.get_metadata()["count"] == 1
+
+    registry.close()
+
+def test_unchanged_save_writes_nothing(temp_db_path, sample_template):
+    registry = LMDBRegistry(db_path=temp_db_path)
+
+    registry.save(sample_template)
+    txn_id = registry._env.info()["last_txnid"]
+
+    registry.save(sample_template.model_copy())
+    registry.save_many([sample_template.model_copy()])
+    assert registry._env.info()["last_txnid"] == txn_id
+
+    registry.save(sample_template.model_copy(update={"description": "changed"}))
+    assert registry._env.info()["last_txnid"] == txn_id + 1
 
     registry.close()
 
@@ -10,14 +10,14 @@ from requests.exceptions import RequestException
 class TestPlaygroundHealthAPI:
     """Test health check and server status endpoints"""
 
-    def test_health_endpoint_returns_200(self, playground_url):
+    def test_health_endpoint_returns_200(self, playground_url, playground_http):
         """Test that health endpoint returns successful status"""
-        response = requests.get(f"{playground_url}/api/health")
+        response = playground_http.get(f"{playground_url}/api/health")
         assert response.status_code == 200
 
-    def test_health_endpoint_structure(self, playground_url):
+    def test_health_endpoint_structure(self, playground_url, playground_http):
         """Test health endpoint returns expected data structure"""
-        response = requests.get(f"{playground_url}/api/health")
+        response = playground_http.get(f"{playground_url}/api/health")
         data = response.json()
 
         assert "status" in data
@@ -29,10 +29,10 @@ class TestPlaygroundHealthAPI:
         assert "prompt_dir" in data["vault_config"]
         assert "logging_enabled" in data["vault_config"]
 
-    def test_health_shows_correct_template_count(self, playground_url):
+    def test_health_shows_correct_template_count(self, playground_url, playground_http):
         """Test that health endpoint shows correct number of templates"""
-        health_response = requests.get(f"{playground_url}/api/health")
-        templates_response = requests.get(f"{playground_url}/api/templates")
+        health_response = playground_http.get(f"{playground_url}/api/health")
+        templates_response = playground_http.get(f"{playground_url}/api/templates")
 
         health_data = health_response.json()
         templates_data = templates_response.json()
@@ -43,9 +43,9 @@ class TestPlaygroundHealthAPI:
 class TestPlaygroundTemplatesAPI:
     """Test template listing and retrieval endpoints"""
 
-    def test_templates_list_endpoint(self, playground_url):
+    def test_templates_list_endpoint(self, playground_url, playground_http):
         """Test that templates list endpoint returns template IDs"""
-        response = requests.get(f"{playground_url}/api/templates")
+        response = playground_http.get(f"{playground_url}/api/templates")
         assert response.status_code == 200
 
         data = response.json()
@@ -56,9 +56,9 @@ class TestPlaygroundTemplatesAPI:
         expected_ids = {"simple-greeting", "complex-template", "error-template"}
         assert expected_ids.issubset(template_ids)
 
-    def test_get_template_details(self, playground_url):
+    def test_get_template_details(self, playground_url, playground_http):
         """Test retrieving specific template details"""
-        response = requests.get(f"{playground_url}/api/templates/simple-greeting")
+        response = playground_http.get(f"{playground_url}/api/templates/simple-greeting")
         assert response.status_code == 200
 
         data = response.json()
@@ -71,9 +71,9 @@ class TestPlaygroundTemplatesAPI:
         assert data["inputs"]["name"]["type"] == "string"
         assert data["inputs"]["name"]["required"] is True
 
-    def test_get_complex_template_details(self, playground_url):
+    def test_get_complex_template_details(self, playground_url, playground_http):
         """Test retrieving complex template with all features"""
-        response = requests.get(f"{playground_url}/api/templates/complex-template")
+        response = playground_http.get(f"{playground_url}/api/templates/complex-template")
         assert response.status_code == 200
 
         data = response.json()
@@ -102,25 +102,25 @@ class TestPlaygroundTemplatesAPI:
         assert data["metadata"]["category"] == "greeting"
         assert "test" in data["metadata"]["tags"]
 
-    def test_get_nonexistent_template_404(self, playground_url):
+    def test_get_nonexistent_template_404(self, playground_url, playground_http):
         """Test that requesting non-existent template returns 404"""
-        response = requests.get(f"{playground_url}/api/templates/nonexistent-template")
+        response = playground_http.get(f"{playground_url}/api/templates/nonexistent-template")
         assert response.status_code == 404
 
         data = response.json()
         assert "detail" in data
         assert "not found" in data["detail"].lower()
 
-    def test_templates_endpoint_content_type(self, playground_url):
+    def test_templates_endpoint_content_type(self, playground_url, playground_http):
         """Test that API endpoints return proper JSON content type"""
-        response = requests.get(f"{playground_url}/api/templates")
+        response = playground_http.get(f"{playground_url}/api/templates")
         assert "application/json" in response.headers.get("content-type", "")
 
 
 class TestPlaygroundRenderAPI:
     """Test template rendering endpoints"""
 
-    def test_simple_template_render(self, playground_url):
+    def test_simple_template_render(self, playground_url, playground_http):
         """Test rendering simple template with required inputs"""
         payload = {
             "inputs": {
@@ -128,7 +128,7 @@ class TestPlaygroundRenderAPI:
             }
         }
 
-        response = requests.post(
+        response = playground_http.post(
             f"{playground_url}/api/templates/simple-greeting/render",
             json=payload
         )
@@ -141,7 +141,7 @@ class TestPlaygroundRenderAPI:
         assert "inputs_used" in data
         assert data["inputs_used"]["name"] == "Alice"
 
-    def test_complex_template_render_minimal(self, playground_url):
+    def test_complex_template_render_minimal(self, playground_url, playground_http):
         """Test rendering complex template with minimal required inputs"""
         payload = {
             "inputs": {
@@ -149,7 +149,7 @@ class TestPlaygroundRenderAPI:
             }
         }
 
-        response = requests.post(
+        response = playground_http.post(
             f"{playground_url}/api/templates/complex-template/render",
             json=payload
         )
@@ -162,7 +162,7 @@ class TestPlaygroundRenderAPI:
         assert "Welcome to PromptLightning!" in rendered  # Default message
         assert "years old" not in rendered  # Age not provided
 
-    def test_complex_template_render_full(self, playground_url):
+    def test_complex_template_render_full(self, playground_url, playground_http):
         """Test rendering complex template with all inputs"""
         payload = {
             "inputs": {
@@ -173,7 +173,7 @@ class TestPlaygroundRenderAPI:
             }
         }
 
-        response = requests.post(
+        response = playground_http.post(
             f"{playground_url}/api/templates/complex-template/render",
             json=payload
         )
@@ -194,7 +194,7 @@ class TestPlaygroundRenderAPI:
         assert inputs_used["hobbies"] == ["coding", "reading", "hiking"]
         assert inputs_used["message"] == "Have an awesome day!"
 
-    def test_render_missing_required_input(self, playground_url):
+    def test_render_missing_required_input(self, playground_url, playground_http):
         """Test that rendering fails when required input is missing"""
         payload = {
             "inputs": {
@@ -203,7 +203,7 @@ class TestPlaygroundRenderAPI:
             }
         }
 
-        response = requests.post(
+        response = playground_http.post(
             f"{playground_url}/api/templates/simple-greeting/render",
             json=payload
         )
@@ -214,7 +214,7 @@ class TestPlaygroundRenderAPI:
         assert "validation error" in data["detail"].lower()
         assert "missing input" in data["detail"].lower()
 
-    def test_render_invalid_input_type(self, playground_url):
+    def test_render_invalid_input_type(self, playground_url, playground_http):
         """Test that rendering fails with invalid input types"""
         payload = {
             "inputs": {
@@ -223,7 +223,7 @@ class TestPlaygroundRenderAPI:
             }
         }
 
-        response = requests.post(
+        response = playground_http.post(
             f"{playground_url}/api/templates/complex-template/render",
             json=payload
         )
@@ -232,7 +232,7 @@ class TestPlaygroundRenderAPI:
         data = response.json()
         assert "detail" in data
 
-    def test_render_template_error(self, playground_url):
+    def test_render_template_error(self, playground_url, playground_http):
         """Test handling of template rendering errors"""
         payload = {
             "inputs": {
@@ -240,7 +240,7 @@ class TestPlaygroundRenderAPI:
             }
         }
 
-        response = requests.post(
+        response = playground_http.post(
             f"{playground_url}/api/templates/error-template/render",
             json=payload
         )
@@ -250,7 +250,7 @@ class TestPlaygroundRenderAPI:
         assert "detail" in data
         assert "render error" in data["detail"].lower()
 
-    def test_render_nonexistent_template(self, playground_url):
+    def test_render_nonexistent_template(self, playground_url, playground_http):
         """Test rendering non-existent template returns 404"""
         payload = {
             "inputs": {
@@ -258,33 +258,33 @@ class TestPlaygroundRenderAPI:
             }
         }
 
-        response = requests.post(
+        response = playground_http.post(
             f"{playground_url}/api/templates/nonexistent/render",
             json=payload
         )
 
         assert response.status_code == 404
 
-    def test_render_empty_inputs(self, playground_url):
+    def test_render_empty_inputs(self, playground_url, playground_http):
         """Test rendering template with empty inputs object"""
         payload = {
             "inputs": {}
         }
 
-        response = requests.post(
+        response = playground_http.post(
             f"{playground_url}/api/templates/simple-greeting/render",
             json=payload
         )
 
         assert response.status_code == 400  # Missing required 'name'
 
-    def test_render_no_inputs_key(self, playground_url):
+    def test_render_no_inputs_key(self, playground_url, playground_http):
         """Test rendering with malformed JSON (no inputs key)"""
         payload = {
             "name": "Test"  # Should be under "inputs"
         }
 
-        response = requests.post(
+        response = playground_http.post(
             f"{playground_url}/api/templates/simple-greeting/render",
             json=payload
         )
@@ -296,9 +296,9 @@ class TestPlaygroundRenderAPI:
 class TestPlaygroundExamplesAPI:
     """Test example templates endpoint"""
 
-    def test_examples_endpoint(self, playground_url):
+    def test_examples_endpoint(self, playground_url, playground_http):
         """Test that examples endpoint returns example templates"""
-        response = requests.get(f"{playground_url}/api/examples")
+        response = playground_http.get(f"{playground_url}/api/examples")
         assert response.status_code == 200
 
         data = response.json()
@@ -313,9 +313,9 @@ class TestPlaygroundExamplesAPI:
         assert "template" in example
         assert "inputs" in example
 
-    def test_examples_include_expected_templates(self, playground_url):
+    def test_examples_include_expected_templates(self, playground_url, playground_http):
         """Test that examples include the expected built-in templates"""
-        response = requests.get(f"{playground_url}/api/examples")
+        response = playground_http.get(f"{playground_url}/api/examples")
         data = response.json()
 
         example_ids = {example["id"] for example in data}
@@ -323,9 +323,9 @@ class TestPlaygroundExamplesAPI:
 
         assert expected_ids.issubset(example_ids)
 
-    def test_examples_have_valid_structure(self, playground_url):
+    def test_examples_have_valid_structure(self, playground_url, playground_http):
         """Test that all examples have valid template structure"""
-        response = requests.get(f"{playground_url}/api/examples")
+        response = playground_http.get(f"{playground_url}/api/examples")
         data = response.json()
 
         for example in data:
@@ -345,7 +345,7 @@ class TestPlaygroundExamplesAPI:
 class TestPlaygroundTemplateCreationAPI:
     """Test template creation endpoints"""
 
-    def test_create_template_success(self, playground_url, tmp_path):
+    def test_create_template_success(self, playground_url, playground_http, tmp_path):
         """Test successful template creation"""
         payload = {
             "id": "api-test-template",
@@ -368,7 +368,7 @@ class TestPlaygroundTemplateCreationAPI:
             }
         }
 
-        response = requests.post(
+        response = playground_http.post(
             f"{playground_url}/api/templates",
             json=payload
         )
@@ -396,14 +396,14 @@ class TestPlaygroundTemplateCreationAPI:
         # Verify metadata
         assert data["metadata"]["tags"] == ["test", "api"]
 
-    def test_create_template_minimal(self, playground_url):
+    def test_create_template_minimal(self, playground_url, playground_http):
         """Test creating template with minimal required fields"""
         payload = {
             "id": "minimal-template",
             "template": "Simple template: {{ value }}"
         }
 
-        response = requests.post(
+        response = playground_http.post(
             f"{playground_url}/api/templates",
             json=payload
         )
@@ -418,7 +418,7 @@ class TestPlaygroundTemplateCreationAPI:
         assert data["inputs"] == {}
         assert data["metadata"] == {}
 
-    def test_create_template_with_all_input_types(self, playground_url):
+    def test_create_template_with_all_input_types(self, playground_url, playground_http):
         """Test creating template with all supported input types"""
         payload = {
             "id": "all-types-template",
@@ -451,7 +451,7 @@ class TestPlaygroundTemplateCreationAPI:
             }
         }
 
-        response = requests.post(
+        response = playground_http.post(
             f"{playground_url}/api/templates",
             json=payload
         )
@@ -471,7 +471,7 @@ class TestPlaygroundTemplateCreationAPI:
         assert inputs["config"]["type"] == "object"
         assert inputs["config"]["default"] == {"key": "value"}
 
-    def test_create_template_appears_in_list(self, playground_url):
+    def test_create_template_appears_in_list(self, playground_url, playground_http):
         """Test that created template appears in templates list"""
         # Create template
         payload = {
@@ -479,18 +479,18 @@ class TestPlaygroundTemplateCreationAPI:
             "template": "Test {{ name }}"
         }
 
-        create_response = requests.post(
+        create_response = playground_http.post(
             f"{playground_url}/api/templates",
             json=payload
         )
         assert create_response.status_code == 200
 
         # Check it appears in list
-        list_response = requests.get(f"{playground_url}/api/templates")
+        list_response = playground_http.get(f"{playground_url}/api/templates")
         templates = list_response.json()
         assert "list-test-template" in templates
 
-    def test_create_template_is_retrievable(self, playground_url):
+    def test_create_template_is_retrievable(self, playground_url, playground_http):
         """Test that created template can be retrieved"""
         # Create template
         payload = {
@@ -505,14 +505,14 @@ class TestPlaygroundTemplateCreationAPI:
             }
         }
 
-        create_response = requests.post(
+        create_response = playground_http.post(
             f"{playground_url}/api/templates",
             json=payload
         )
         assert create_response.status_code == 200
 
         # Retrieve template
-        get_response = requests.get(f"{playground_url}/api/templates/retrievable-template")
+        get_response = playground_http.get(f"{playground_url}/api/templates/retrievable-template")
         assert get_response.status_code == 200
 
         data = get_response.json()
@@ -520,7 +520,7 @@ class TestPlaygroundTemplateCreationAPI:
         assert data["description"] == "Test retrieval"
         assert data["template"] == "Hello {{ user }}"
 
-    def test_create_template_is_renderable(self, playground_url):
+    def test_create_template_is_renderable(self, playground_url, playground_http):
         """Test that created template can be rendered"""
         # Create template
         payload = {
@@ -534,7 +534,7 @@ class TestPlaygroundTemplateCreationAPI:
             }
         }
 
-        create_response = requests.post(
+        create_response = playground_http.post(
             f"{playground_url}/api/templates",
             json=payload
         )
@@ -547,7 +547,7 @@ class TestPlaygroundTemplateCreationAPI:
             }
         }
 
-        render_response = requests.post(
+        render_response = playground_http.post(
             f"{playground_url}/api/templates/renderable-template/render",
             json=render_payload
         )
@@ -556,7 +556,7 @@ class TestPlaygroundTemplateCreationAPI:
         data = render_response.json()
         assert data["rendered"] == "Greetings TestUser!"
 
-    def test_create_template_duplicate_id_fails(self, playground_url):
+    def test_create_template_duplicate_id_fails(self, playground_url, playground_http):
         """Test that creating template with duplicate ID fails"""
         payload = {
             "id": "duplicate-test",
@@ -564,7 +564,7 @@ class TestPlaygroundTemplateCreationAPI:
         }
 
         # Create first template
-        response1 = requests.post(
+        response1 = playground_http.post(
             f"{playground_url}/api/templates",
             json=payload
         )
@@ -572,7 +572,7 @@ class TestPlaygroundTemplateCreationAPI:
 
         # Try to create duplicate
         payload["template"] = "Second template"
-        response2 = requests.post(
+        response2 = playground_http.post(
             f"{playground_url}/api/templates",
             json=payload
         )
@@ -581,31 +581,31 @@ class TestPlaygroundTemplateCreationAPI:
         data = response2.json()
         assert "already exists" in data["detail"]
 
-    def test_create_template_missing_id_fails(self, playground_url):
+    def test_create_template_missing_id_fails(self, playground_url, playground_http):
         """Test that creating template without ID fails"""
         payload = {
             "template": "Template without ID"
         }
 
-        response = requests.post(
+        response = playground_http.post(
             f"{playground_url}/api/templates",
             json=payload
         )
         assert response.status_code == 422  # Validation error
 
-    def test_create_template_missing_template_fails(self, playground_url):
+    def test_create_template_missing_template_fails(self, playground_url, playground_http):
         """Test that creating template without template content fails"""
         payload = {
             "id": "no-template-content"
         }
 
-        response = requests.post(
+        response = playground_http.post(
             f"{playground_url}/api/templates",
             json=payload
         )
         assert response.status_code == 422  # Validation error
 
-    def test_create_template_invalid_input_type_fails(self, playground_url):
+    def test_create_template_invalid_input_type_fails(self, playground_url, playground_http):
         """Test that creating template with invalid input type fails"""
         payload = {
             "id": "invalid-input-type",
@@ -618,13 +618,13 @@ class TestPlaygroundTemplateCreationAPI:
             }
         }
 
-        response = requests.post(
+        response = playground_http.post(
             f"{playground_url}/api/templates",
             json=payload
         )
         assert response.status_code == 500  # Server error due to validation
 
-    def test_create_template_invalid_default_value_fails(self, playground_url):
+    def test_create_template_invalid_default_value_fails(self, playground_url, playground_http):
         """Test that creating template with invalid default value fails"""
         payload = {
             "id": "invalid-default",
@@ -638,29 +638,29 @@ class TestPlaygroundTemplateCreationAPI:
             }
         }
 
-        response = requests.post(
+        response = playground_http.post(
             f"{playground_url}/api/templates",
             json=payload
         )
         assert response.status_code == 500  # Server error due to validation
 
-    def test_create_template_empty_id_fails(self, playground_url):
+    def test_create_template_empty_id_fails(self, playground_url, playground_http):
         """Test that creating template with empty ID fails"""
         payload = {
             "id": "",
             "template": "Empty ID test"
         }
 
-        response = requests.post(
+        response = playground_http.post(
             f"{playground_url}/api/templates",
             json=payload
         )
         assert response.status_code == 422  # Validation error
 
-    def test_create_template_health_count_updates(self, playground_url):
+    def test_create_template_health_count_updates(self, playground_url, playground_http):
         """Test that health endpoint reflects new template count after creation"""
         # Get initial count
-        health_response1 = requests.get(f"{playground_url}/api/health")
+        health_response1 = playground_http.get(f"{playground_url}/api/health")
         initial_count = health_response1.json()["templates_loaded"]
 
         # Create template
@@ -669,14 +669,14 @@ class TestPlaygroundTemplateCreationAPI:
             "template": "Count test"
         }
 
-        create_response = requests.post(
+        create_response = playground_http.post(
             f"{playground_url}/api/templates",
             json=payload
         )
         assert create_response.status_code == 200
 
         # Check count updated
-        health_response2 = requests.get(f"{playground_url}/api/health")
+        health_response2 = playground_http.get(f"{playground_url}/api/health")
         new_count = health_response2.json()["templates_loaded"]
         assert new_count == initial_count + 1
 
@@ -684,9 +684,9 @@ class TestPlaygroundTemplateCreationAPI:
 class TestPlaygroundErrorHandling:
     """Test error handling and edge cases"""
 
-    def test_invalid_json_request(self, playground_url):
+    def test_invalid_json_request(self, playground_url, playground_http):
         """Test handling of invalid JSON in POST requests"""
-        response = requests.post(
+        response = playground_http.post(
             f"{playground_url}/api/templates/simple-greeting/render",
             data="invalid-json",
             headers={"Content-Type": "application/json"}
@@ -694,38 +694,38 @@ class TestPlaygroundErrorHandling:
 
         assert response.status_code == 422  # FastAPI returns 422 for invalid JSON
 
-    def test_get_root_endpoint(self, playground_url):
+    def test_get_root_endpoint(self, playground_url, playground_http):
         """Test that root endpoint returns HTML playground UI"""
-        response = requests.get(playground_url)
+        response = playground_http.get(playground_url)
         assert response.status_code == 200
         assert "text/html" in response.headers.get("content-type", "")
         assert "PromptLightning Playground" in response.text
 
-    def test_nonexistent_endpoint(self, playground_url):
+    def test_nonexistent_endpoint(self, playground_url, playground_http):
         """Test that non-existent endpoints return 404"""
-        response = requests.get(f"{playground_url}/api/nonexistent")
+        response = playground_http.get(f"{playground_url}/api/nonexistent")
         assert response.status_code == 404
 
-    def test_method_not_allowed(self, playground_url):
+    def test_method_not_allowed(self, playground_url, playground_http):
         """Test that wrong HTTP methods return appropriate errors"""
         # PUT to templates list (should be GET or POST)
-        response = requests.put(f"{playground_url}/api/templates")
+        response = playground_http.put(f"{playground_url}/api/templates")
         assert response.status_code == 405  # Method Not Allowed
 
 
 class TestPlaygroundIntegration:
     """Integration tests that test multiple API interactions"""
 
-    def test_complete_workflow(self, playground_url):
+    def test_complete_workflow(self, playground_url, playground_http):
         """Test complete workflow: list -> get -> render"""
         # 1. List all templates
-        templates_response = requests.get(f"{playground_url}/api/templates")
+        templates_response = playground_http.get(f"{playground_url}/api/templates")
         assert templates_response.status_code == 200
         template_ids = templates_response.json()
         assert "simple-greeting" in template_ids
 
         # 2. Get template details
-        detail_response = requests.get(f"{playground_url}/api/templates/simple-greeting")
+        detail_response = playground_http.get(f"{playground_url}/api/templates/simple-greeting")
         assert detail_response.status_code == 200
         template_data = detail_response.json()
 
@@ -741,17 +741,17 @@ class TestPlaygroundIntegration:
                 "name": "Integration Test"
             }
         }
-        render_response = requests.post(
+        render_response = playground_http.post(
             f"{playground_url}/api/templates/simple-greeting/render",
             json=render_payload
         )
         assert render_response.status_code == 200
         assert "Hello Integration Test!" in render_response.json()["rendered"]
 
-    def test_examples_are_renderable(self, playground_url):
+    def test_examples_are_renderable(self, playground_url, playground_http):
         """Test that example templates can actually be rendered"""
         # Get examples
-        examples_response = requests.get(f"{playground_url}/api/examples")
+        examples_response = playground_http.get(f"{playground_url}/api/examples")
         examples = examples_response.json()
 
         # Test rendering first example that has simple inputs
@@ -766,7 +766,7 @@ class TestPlaygroundIntegration:
 
                 # Note: Example templates aren't loaded in vault, this will 404
                 # But we test the API structure is correct
-                render_response = requests.post(
+                render_response = playground_http.post(
                     f"{playground_url}/api/templates/{example['id']}/render",
                     json=render_payload
                 )
@@ -774,13 +774,13 @@ class TestPlaygroundIntegration:
                 assert render_response.status_code == 404
                 break
 
-    def test_health_reflects_server_state(self, playground_url):
+    def test_health_reflects_server_state(self, playground_url, playground_http):
         """Test that health endpoint reflects actual server state"""
-        health_response = requests.get(f"{playground_url}/api/health")
+        health_response = playground_http.get(f"{playground_url}/api/health")
         health_data = health_response.json()
 
         # Verify template count matches actual templates
-        templates_response = requests.get(f"{playground_url}/api/templates")
+        templates_response = playground_http.get(f"{playground_url}/api/templates")
         templates = templates_response.json()
 
         assert health_data["templates_loaded"] == len(templates)
@@ -791,7 +791,7 @@ class TestPlaygroundIntegration:
         assert vault_config["prompt_dir"] == "./prompts"
         assert isinstance(vault_config["logging_enabled"], bool)
 
-    def test_complete_template_creation_workflow(self, playground_url):
+    def test_complete_template_creation_workflow(self, playground_url, playground_http):
         """Test complete template creation workflow: create -> list -> get -> render"""
         # 1. Create a new template
         create_payload = {
@@ -820,19 +820,19 @@ class TestPlaygroundIntegration:
             }
         }
 
-        create_response = requests.post(
+        create_response = playground_http.post(
             f"{playground_url}/api/templates",
             json=create_payload
         )
         assert create_response.status_code == 200
 
         # 2. Verify it appears in templates list
-        list_response = requests.get(f"{playground_url}/api/templates")
+        list_response = playground_http.get(f"{playground_url}/api/templates")
         templates = list_response.json()
         assert "integration-workflow-test" in templates
 
         # 3. Get template details
-        get_response = requests.get(f"{playground_url}/api/templates/integration-workflow-test")
+        get_response = playground_http.get(f"{playground_url}/api/templates/integration-workflow-test")
         assert get_response.status_code == 200
         template_data = get_response.json()
 
@@ -851,7 +851,7 @@ class TestPlaygroundIntegration:
             }
         }
 
-        render_response = requests.post(
+        render_response = playground_http.post(
             f"{playground_url}/api/templates/integration-workflow-test/render",
             json=render_payload
         )
@@ -869,7 +869,7 @@ class TestPlaygroundIntegration:
             }
         }
 
-        full_render_response = requests.post(
+        full_render_response = playground_http.post(
             f"{playground_url}/api/templates/integration-workflow-test/render",
             json=full_render_payload
         )
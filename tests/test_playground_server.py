@@ -31,6 +31,18 @@ class TestPlaygroundServer:
         assert playground.port == 8080
         assert playground.vault.config["prompt_dir"] == prompts_dir
 
+    def test_ready_event_set_on_startup(self, temp_project_dir):
+        """Test that the ready event fires from the app's startup hook"""
+        import threading
+
+        tmpdir, config_path = temp_project_dir
+        ready = threading.Event()
+        playground = create_playground(prompt_dir=f"{tmpdir}/prompts", ready_event=ready)
+
+        assert not ready.is_set()
+        with TestClient(playground.app):
+            assert ready.is_set()
+
     def test_playground_app_creation(self, test_vault):
         """Test that playground creates FastAPI app correctly"""
         playground = PlaygroundServer(test_vault)
@@ -77,6 +89,53 @@ class TestPlaygroundServer:
             assert isinstance(example.metadata, dict)
 
 
+    def test_template_yaml_writer_round_trips(self):
+        """Test that the hand-rolled YAML writer loads back to the same data"""
+        import yaml
+        from promptlightning.playground import _dump_template_yaml
+
+        content = {
+            "id": "tricky",
+            "version": "1.0",
+            "description": None,
+            "template": 'Line: "{{ a }}"\n\t# not a comment\n  yes \\ no \u2028 \U0001F3AF',
+            "inputs": {
+                "a": {"type": "string", "required": False, "default": "on"},
+                "n": {"type": "number", "required": True, "default": 1e20}
+            },
+            "metadata": {"tags": ["x, y", "true"], "nested": {"k": [1, {"deep": None}]}, "empty": {}}
+        }
+
+        assert yaml.safe_load(_dump_template_yaml(content)) == content
+
+    def test_miss_invalidated_mid_read_is_not_cached(self, test_vault, monkeypatch):
+        """Test that a write landing during a cache miss keeps the old response out of the cache"""
+        playground = PlaygroundServer(test_vault)
+        playground._invalidate_cache("simple-greeting")  # drop what startup warmed
+        vault_get, vault_list = test_vault.get, test_vault.list
+
+        def get_then_write(template_id):
+            handle = vault_get(template_id)
+            playground._invalidate_cache(template_id)  # a PUT finishing while the GET reads
+            return handle
+
+        def list_then_write():
+            ids = vault_list()
+            playground._invalidate_cache("simple-greeting")
+            return ids
+
+        monkeypatch.setattr(test_vault, "get", get_then_write)
+        monkeypatch.setattr(test_vault, "list", list_then_write)
+
+        body, _ = playground._get_template_cached("simple-greeting")
+        assert b"simple-greeting" in body
+        assert not any(tid == "simple-greeting" for _, tid in playground._template_cache)
+
+        playground._get_health_body()
+        assert playground._template_list_cache == {}
+        assert playground._health_cache is None
+
+
 class TestPlaygroundServerWithTestClient:
     """Test playground server using FastAPI TestClient"""
 
@@ -120,6 +179,22 @@ class TestPlaygroundServerWithTestClient:
             assert "inputs" in template_data
             assert "name" in template_data["inputs"]
 
+    def test_template_detail_conditional_get(self, test_vault):
+        """Test that a matching If-None-Match short-circuits to 304"""
+        playground = PlaygroundServer(test_vault)
+
+        with TestClient(playground.app) as client:
+            response = client.get("/api/templates/simple-greeting")
+            etag = response.headers["etag"]
+
+            cached = client.get("/api/templates/simple-greeting", headers={"If-None-Match": etag})
+            assert cached.status_code == 304
+            assert cached.content == b""
+            assert cached.headers["etag"] == etag
+
+            stale = client.get("/api/templates/simple-greeting", headers={"If-None-Match": '"stale"'})
+            assert stale.status_code == 200
+
     def test_template_render_endpoint(self, test_vault):
         """Test template rendering endpoint"""
         playground = PlaygroundServer(test_vault)
@@ -155,6 +230,18 @@ class TestPlaygroundServerWithTestClient:
             assert "template" in example
             assert "inputs" in example
 
+    def test_examples_conditional_get(self, test_vault):
+        """Test that the precomputed examples payload honours If-None-Match"""
+        playground = PlaygroundServer(test_vault)
+
+        with TestClient(playground.app) as client:
+            response = client.get("/api/examples")
+            assert response.headers["cache-control"] == "public, max-age=3600"
+
+            cached = client.get("/api/examples", headers={"If-None-Match": response.headers["etag"]})
+            assert cached.status_code == 304
+            assert cached.content == b""
+
     def test_root_endpoint_returns_html(self, test_vault):
         """Test root endpoint returns HTML playground UI"""
         playground = PlaygroundServer(test_vault)
@@ -257,6 +344,29 @@ class TestPlaygroundServerEdgeCases:
             finally:
                 os.chdir(original_cwd)
 
+    def test_demo_session_skeleton_is_private(self, tmp_path, monkeypatch):
+        """Test that demo sessions only get the built-in examples and the skeleton goes on shutdown"""
+        import tempfile
+        from promptlightning.playground import DemoPlaygroundServer
+
+        # sessions and the skeleton both live under the temp dir; keep them in tmp_path
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+        # a stray file where the old shared skeleton used to live
+        stray = tmp_path / "promptlightning-demo-skeleton" / "prompts"
+        stray.mkdir(parents=True)
+        (stray / "planted.yaml").write_text('{"id": "planted", "template": "x"}')
+
+        demo = DemoPlaygroundServer()
+        skeleton = demo._skeleton_dir
+        assert skeleton.name.startswith("promptlightning-skeleton-")
+
+        with TestClient(demo.app) as client:
+            templates = client.get("/api/templates").json()
+            assert "planted" not in templates
+            assert len(templates) >= 3
+
+        assert not skeleton.exists()
+
     def test_malformed_request_data(self, test_vault):
         """Test handling of malformed request data"""
         playground = PlaygroundServer(test_vault)
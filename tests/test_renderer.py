@@ -0,0 +1,48 @@
+import pytest
+from jinja2.exceptions import UndefinedError
+
+from promptlightning.renderer import Renderer, PlainTemplate, compile_template, make_env
+
+
+@pytest.mark.parametrize("source", [
+    "Plain text, no tags\n",
+    "Hello {{ name }}!",
+    "{{name}} and {{ name }}\r\nline two\r\n",
+    "Value: {{ count }} / {{ missing_is_none }}",
+    "{{ range }}",
+])
+def test_plain_template_matches_jinja(source):
+    env = make_env()
+    compiled = compile_template(env, source)
+    variables = {"name": "Ada", "count": 3, "missing_is_none": None}
+
+    assert isinstance(compiled, PlainTemplate)
+    assert compiled.render(**variables) == env.from_string(source).render(**variables)
+
+
+@pytest.mark.parametrize("source", [
+    "{% if name %}{{ name }}{% endif %}",
+    "{{ name | upper }}",
+    "{{- name }}",
+    "{{ name }}}",
+    "{{ none }}",
+    "{{ self }}",
+    "{# comment #}{{ name }}",
+])
+def test_templates_with_logic_use_jinja(source):
+    assert not isinstance(compile_template(make_env(), source), PlainTemplate)
+
+
+def test_plain_template_strict_undefined():
+    with pytest.raises(UndefinedError):
+        compile_template(make_env(), "Hi {{ name }}").render()
+
+
+def test_renderer_cache_stats():
+    renderer = Renderer()
+    renderer.render("Hi {{ name }}", {"name": "a"})
+    renderer.render("Hi {{ name }}", {"name": "b"})
+
+    stats = renderer.get_cache_stats()
+    assert stats["cache_hits"] == 1
+    assert stats["cache_misses"] == 1
@@ -93,7 +93,7 @@ class TestTemplateHandleExecute:
         vault = temp_vault_no_logging
         template = vault.get("test-template")
 
-        with patch.object(template, '_llm_client', None):
+        with patch.object(vault, '_llm_client', None):
             with patch('promptlightning.vault.LLMClient') as mock_client_class:
                 mock_client = Mock()
                 mock_client.execute.return_value = mock_execution_result
@@ -119,7 +119,7 @@ class TestTemplateHandleExecute:
         vault = temp_vault_no_logging
         template = vault.get("test-template")
 
-        with patch.object(template, '_llm_client', None):
+        with patch.object(vault, '_llm_client', None):
             with patch('promptlightning.vault.LLMClient') as mock_client_class:
                 mock_client = Mock()
                 mock_client.execute.return_value = mock_execution_result
@@ -144,7 +144,7 @@ class TestTemplateHandleExecute:
         vault, tmpdir = temp_vault_with_logging
         template = vault.get("test-template")
 
-        with patch.object(template, '_llm_client', None):
+        with patch.object(vault, '_llm_client', None):
             with patch('promptlightning.vault.LLMClient') as mock_client_class:
                 mock_client = Mock()
                 mock_client.execute.return_value = mock_execution_result
@@ -182,7 +182,7 @@ class TestTemplateHandleExecute:
         vault = temp_vault_no_logging
         template = vault.get("test-template")
 
-        with patch.object(template, '_llm_client', None):
+        with patch.object(vault, '_llm_client', None):
             with patch('promptlightning.vault.LLMClient') as mock_client_class:
                 mock_client = Mock()
                 mock_client.execute.side_effect = APIKeyError("Invalid API key")
@@ -197,7 +197,7 @@ class TestTemplateHandleExecute:
         vault = temp_vault_no_logging
         template = vault.get("test-template")
 
-        with patch.object(template, '_llm_client', None):
+        with patch.object(vault, '_llm_client', None):
             with patch('promptlightning.vault.LLMClient') as mock_client_class:
                 mock_client = Mock()
                 mock_client.execute.side_effect = RateLimitError("Rate limit exceeded")
@@ -212,7 +212,7 @@ class TestTemplateHandleExecute:
         vault = temp_vault_no_logging
         template = vault.get("test-template")
 
-        with patch.object(template, '_llm_client', None):
+        with patch.object(vault, '_llm_client', None):
             with patch('promptlightning.vault.LLMClient') as mock_client_class:
                 mock_client = Mock()
                 mock_client.execute.side_effect = ModelNotFoundError("Model not found")
@@ -227,7 +227,7 @@ class TestTemplateHandleExecute:
         vault = temp_vault_no_logging
         template = vault.get("test-template")
 
-        with patch.object(template, '_llm_client', None):
+        with patch.object(vault, '_llm_client', None):
             with patch('promptlightning.vault.LLMClient') as mock_client_class:
                 mock_client = Mock()
                 mock_client.execute.side_effect = LLMError("Unexpected error")
@@ -242,7 +242,7 @@ class TestTemplateHandleExecute:
         vault = temp_vault_no_logging
         template = vault.get("test-template")
 
-        with patch.object(template, '_llm_client', None):
+        with patch.object(vault, '_llm_client', None):
             with patch('promptlightning.vault.LLMClient') as mock_client_class:
                 mock_client = Mock()
                 mock_client.execute.return_value = mock_execution_result
@@ -254,6 +254,157 @@ class TestTemplateHandleExecute:
                 assert mock_client_class.call_count == 1
                 assert mock_client.execute.call_count == 2
 
+    def test_execute_client_shared_across_handles(self, temp_vault_no_logging, mock_execution_result):
+        vault = temp_vault_no_logging
+
+        with patch('promptlightning.vault.LLMClient') as mock_client_class:
+            mock_client_class.return_value.execute.return_value = mock_execution_result
+
+            vault.get("test-template").execute(model="gpt-4", text="First handle")
+            vault.get("test-template").execute(model="gpt-4", text="Second handle")
+
+            assert mock_client_class.call_count == 1
+            assert mock_client_class.return_value.execute.call_count == 2
+
+    def test_compiled_template_tied_to_spec(self, temp_vault_no_logging):
+        vault = temp_vault_no_logging
+        compiled = vault.get("test-template").spec.compiled
+
+        assert vault.get("test-template").spec.compiled is compiled
+
+        # same id and version, edited text: the reloaded spec must not reuse the old compile
+        template_path = Path(vault.config["prompt_dir"]) / "test-template.yaml"
+        data = yaml.safe_load(template_path.read_text())
+        data["template"] = "Edited: {{ text }}"
+        template_path.write_text(yaml.safe_dump(data))
+        vault.invalidate("test-template")
+
+        assert vault.get("test-template").render(text="x") == "Edited: x"
+
+    def test_compiled_follows_template_edits_and_copies(self, temp_vault_no_logging):
+        import copy
+        import pickle
+
+        spec = temp_vault_no_logging.get("test-template").spec
+        spec.compiled
+
+        edited = spec.model_copy(update={"template": "Copy: {{ text }}"})
+        assert edited.compiled.render(text="x") == "Copy: x"
+
+        assigned = spec.model_copy()
+        assigned.template = "Assigned: {{ text }}"
+        assert assigned.compiled.render(text="x") == "Assigned: x"
+
+        for clone in (pickle.loads(pickle.dumps(spec)), copy.deepcopy(spec)):
+            assert clone.compiled.render(text="x") == spec.compiled.render(text="x")
+
+    def test_repeated_renders_compile_once(self, temp_vault_no_logging, monkeypatch):
+        from jinja2 import Environment
+        from promptlightning.renderer import compile_shared
+        compile_shared.cache_clear()
+
+        prompts_dir = Path(temp_vault_no_logging.config["prompt_dir"])
+        (prompts_dir / "logic.yaml").write_text(yaml.safe_dump({
+            "id": "logic", "template": "{% if text %}Got {{ text }}{% endif %}",
+            "inputs": {"text": {"type": "string"}},
+        }))
+        calls = []
+        from_string = Environment.from_string
+        monkeypatch.setattr(Environment, "from_string",
+                            lambda env, *a, **kw: calls.append(a) or from_string(env, *a, **kw))
+
+        vault = Vault(prompt_dir=str(prompts_dir))
+        assert vault.get("logic").render(text="a") == "Got a"
+        assert vault.get("logic").render(text="b") == "Got b"
+
+        assert len(calls) == 1
+
+    def test_invalidate_one_template_keeps_others_cached(self, temp_vault_no_logging):
+        vault = temp_vault_no_logging
+        prompts_dir = Path(vault.config["prompt_dir"])
+        (prompts_dir / "other.yaml").write_text(yaml.safe_dump({"id": "other", "template": "Other"}))
+
+        specs = vault.get_many(["test-template", "other"])
+        (prompts_dir / "test-template.yaml").write_text(yaml.safe_dump({
+            "id": "test-template", "version": "1.0.0", "template": "Edited: {{ text }}",
+        }))
+        vault.invalidate("test-template")
+
+        assert vault.get_spec("other") is specs["other"]
+        assert vault.get_spec("test-template").template == "Edited: {{ text }}"
+
+    def test_nested_templates_found_and_yaml_named_dirs_skipped(self, temp_vault_no_logging):
+        prompts_dir = Path(temp_vault_no_logging.config["prompt_dir"])
+        (prompts_dir / "decoy.yaml").mkdir()
+        (prompts_dir / "team" / "sub").mkdir(parents=True)
+        (prompts_dir / "team" / "sub" / "nested.yml").write_text(
+            yaml.safe_dump({"id": "nested", "template": "Deep {{ x }}"})
+        )
+
+        vault = Vault(prompt_dir=prompts_dir)
+
+        assert vault.get_spec("nested").template == "Deep {{ x }}"
+        assert "nested" in vault.list()
+
+    def test_non_mapping_yaml_files_are_skipped(self, tmp_path):
+        (tmp_path / "valid.yaml").write_text(yaml.safe_dump({"id": "valid", "template": "Hi"}))
+        (tmp_path / "list.yaml").write_text(yaml.safe_dump(["not", "a", "template"]))
+        (tmp_path / "scalar.yaml").write_text("just a string\n")
+
+        vault = Vault(prompt_dir=str(tmp_path))
+
+        assert vault.list() == ["valid"]
+        assert vault.get_spec("valid").template == "Hi"
+
+    def test_second_vault_reuses_parsed_specs(self, temp_vault_no_logging, local_spec_cache):
+        prompts_dir = temp_vault_no_logging.config["prompt_dir"]
+        first = temp_vault_no_logging.get_spec("test-template")
+
+        before = local_spec_cache()
+        second = Vault(prompt_dir=prompts_dir).get_spec("test-template")
+
+        # parsed once, but each vault gets its own copy to mutate
+        assert second == first and second is not first
+        assert local_spec_cache()["hits"] == before["hits"] + 1
+        assert local_spec_cache()["misses"] == before["misses"]
+
+    def test_atomic_replace_with_same_mtime_and_size_is_reparsed(self, tmp_path):
+        import os
+
+        target = tmp_path / "swap.yaml"
+        target.write_text(yaml.safe_dump({"id": "swap", "template": "Old"}))
+        vault = Vault(prompt_dir=str(tmp_path))
+        assert vault.get("swap").render() == "Old"
+
+        # same size and mtime as the original, but a new inode
+        staged = tmp_path / "swap.tmp"
+        staged.write_text(yaml.safe_dump({"id": "swap", "template": "New"}))
+        st = target.stat()
+        os.utime(staged, ns=(st.st_atime_ns, st.st_mtime_ns))
+        os.replace(staged, target)
+        vault.invalidate("swap")
+
+        assert vault.get("swap").render() == "New"
+
+    def test_first_load_parses_file_once(self, tmp_path, local_spec_cache):
+        (tmp_path / "fresh.yaml").write_text(yaml.safe_dump({"id": "fresh", "template": "Hi"}))
+
+        before = local_spec_cache()
+        Vault(prompt_dir=str(tmp_path)).get_spec("fresh")
+
+        # the id scan parsed the file and cached the spec, so the load itself was a hit
+        assert local_spec_cache()["hits"] == before["hits"] + 1
+        assert local_spec_cache()["misses"] == before["misses"]
+
+    def test_preload_fills_spec_cache(self, temp_vault_no_logging):
+        prompts_dir = temp_vault_no_logging.config["prompt_dir"]
+
+        vault = Vault(prompt_dir=prompts_dir, preload=True)
+        vault._preload_thread.join(timeout=5)
+
+        assert vault._spec_cache.get("test-template") is not None
+        vault.close()
+
     def test_execute_with_complex_template(self, temp_vault_no_logging):
         vault = temp_vault_no_logging
 
@@ -285,7 +436,7 @@ class TestTemplateHandleExecute:
             latency_ms=800
         )
 
-        with patch.object(template, '_llm_client', None):
+        with patch.object(vault, '_llm_client', None):
             with patch('promptlightning.vault.LLMClient') as mock_client_class:
                 mock_client = Mock()
                 mock_client.execute.return_value = mock_result
@@ -306,7 +457,7 @@ class TestTemplateHandleExecute:
         vault = temp_vault_no_logging
         template = vault.get("test-template")
 
-        with patch.object(template, '_llm_client', None):
+        with patch.object(vault, '_llm_client', None):
             with patch('promptlightning.vault.LLMClient') as mock_client_class:
                 mock_client = Mock()
                 mock_client.execute.return_value = mock_execution_result
@@ -359,6 +510,9 @@ class TestDatabaseMigration:
                 assert "tokens_out" in columns
                 assert "cost_usd" in columns
 
+                indexes = {row[1] for row in con.execute("PRAGMA index_list(logs)").fetchall()}
+                assert "idx_logs_prompt_id" in indexes
+
     def test_logger_write_with_llm_metadata(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             db_path = Path(tmpdir) / "test.db"
@@ -388,4 +542,47 @@ class TestDatabaseMigration:
                 assert row[8] == "gpt-4"
                 assert row[9] == 100
                 assert row[10] == 50
-                assert row[11] == 0.05
\ No newline at end of file
+                assert row[11] == 0.05
+
+    def test_logger_write_many(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+
+            from promptlightning.logging import Logger
+            logger = Logger(db_path)
+
+            written = logger.write_many([
+                {"prompt_id": "a", "version": "1.0.0", "inputs": {"n": i}, "output": f"out {i}", "model": "gpt-4"}
+                for i in range(3)
+            ])
+            logger.write("b", "1.0.0", {}, "single")
+            logger.close()
+
+            assert written == 3
+            with sqlite3.connect(db_path) as con:
+                rows = con.execute("SELECT prompt_id, output_text, model FROM logs ORDER BY id").fetchall()
+                assert con.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+            assert rows == [("a", "out 0", "gpt-4"), ("a", "out 1", "gpt-4"), ("a", "out 2", "gpt-4"), ("b", "single", None)]
+
+    def test_logger_write_many_rolls_back_on_bad_row(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+
+            from promptlightning.logging import Logger
+            logger = Logger(db_path)
+
+            good = {"prompt_id": "a", "version": "1.0.0", "inputs": {}, "output": "ok"}
+            # sqlite can't bind an arbitrary object, so the third insert fails mid-batch
+            bad = {**good, "latency_ms": object()}
+            with pytest.raises(sqlite3.Error):
+                logger.write_many([good, good, bad])
+
+            # the transaction was closed, so the connection still takes writes
+            logger.write("b", "1.0.0", {}, "after")
+            logger.close()
+
+            with sqlite3.connect(db_path) as con:
+                rows = con.execute("SELECT prompt_id, output_text FROM logs ORDER BY id").fetchall()
+
+            assert rows == [("b", "after")]